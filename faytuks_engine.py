@@ -10,10 +10,22 @@ Usage:
     python faytuks_engine.py daily --date 2026-01-17
     python faytuks_engine.py validate --tweet "tweet text here"
     python faytuks_engine.py lab --test fact-check --tweet "tweet text"
+    python faytuks_engine.py usage --days 7 --by day command model
+    FAYTUKS_LLM_MODE=replay python faytuks_engine.py refresh --execute
 """
 
+import bisect
+import gzip
+import hashlib
+import heapq
 import json
+import math
 import os
+import re
+import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -33,6 +45,11 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: FileLock falls back to an in-process lock
+
 # Knowledge base paths - all files are now in knowledge/ directory
 KNOWLEDGE_DIR = Path(__file__).parent / "knowledge"
 
@@ -61,6 +78,79 @@ KNOWLEDGE_FILES = {
 # Generation history file (shared with TypeScript system)
 GENERATION_HISTORY_FILE = KNOWLEDGE_DIR / "generation-history.json"
 
+# Append-only ledger of LLM calls (see UsageLedger)
+USAGE_LEDGER_FILE = Path(__file__).parent / "logs" / "llm-usage.jsonl"
+
+# Recorded LLM responses for offline replay (see ReplayTransport)
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of values using linear interpolation."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = 2):
+    """Write JSON to a temp file in the same directory, fsync, then rename over path.
+
+    Readers see either the old file or the new one, never a partial write.
+    """
+    import tempfile
+
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class FileLock:
+    """Re-entrant exclusive lock across threads and processes.
+
+    A threading.RLock guards the process; an fcntl advisory lock on `path`
+    guards against other processes (daemon workers, the CLI, the poster).
+    Only the outermost acquire takes the file lock, so nested use is safe.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._rlock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self) -> 'FileLock':
+        self._rlock.acquire()
+        if self._depth == 0:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a')
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0:
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        self._rlock.release()
+
 
 class ClaudeClient:
     """Wrapper for Claude API calls via Vercel AI Gateway."""
@@ -72,23 +162,157 @@ class ClaudeClient:
     OPUS = "anthropic/claude-opus-4.5"
     SONNET = "anthropic/claude-sonnet-4.5"
 
-    def __init__(self, api_key: Optional[str] = None):
-        if not ANTHROPIC_AVAILABLE:
-            raise ImportError("anthropic package not installed. Run: pip install anthropic")
+    # Task routing: model, fallback, token cap and latency budget (seconds) per task type.
+    # A task falls back when a call hits its budget, fails (rate limit, overload, 5xx,
+    # connection), or its observed p95 reaches the budget.
+    TASK_ROUTES = {
+        "breaking_translation": {"model": SONNET, "fallback": None, "max_tokens": 512, "latency_budget": 8},
+        "bulk_translation": {"model": SONNET, "fallback": None, "max_tokens": 4096, "latency_budget": 15},
+        "enrichment": {"model": OPUS, "fallback": SONNET, "max_tokens": 1024, "latency_budget": 20},
+        "generate": {"model": OPUS, "fallback": SONNET, "max_tokens": 1024, "latency_budget": 30},
+        "counter": {"model": OPUS, "fallback": SONNET, "max_tokens": 1024, "latency_budget": 30},
+        "anniversary": {"model": OPUS, "fallback": SONNET, "max_tokens": 1024, "latency_budget": 30},
+        "memorial": {"model": OPUS, "fallback": SONNET, "max_tokens": 1024, "latency_budget": 30},
+        "thread": {"model": OPUS, "fallback": SONNET, "max_tokens": 2048, "latency_budget": 60},
+        "validation": {"model": SONNET, "fallback": None, "max_tokens": 1024, "latency_budget": 20},
+        "repair": {"model": SONNET, "fallback": None, "max_tokens": 512, "latency_budget": 10},
+        "daily_brief": {"model": OPUS, "fallback": SONNET, "max_tokens": 2048, "latency_budget": 60},
+    }
 
-        # Use AI Gateway key
-        key = api_key or os.getenv("AI_GATEWAY_API_KEY")
-        if not key:
-            raise ValueError("No API key found. Set AI_GATEWAY_API_KEY in .env")
+    # Latency samples kept per (task, model) and needed before p95 can trigger a downgrade
+    LATENCY_WINDOW = 50
+    LATENCY_MIN_SAMPLES = 5
+    # While downgraded, every Nth call probes the primary model; a probe within budget
+    # clears the window so the route recovers at once
+    PROBE_EVERY = 10
+
+    def __init__(self, api_key: Optional[str] = None, command: Optional[str] = None,
+                 ledger: Optional['UsageLedger'] = None, transport: Any = None):
+        # FAYTUKS_LLM_MODE=replay serves cassettes offline; record wraps the live client
+        mode = os.getenv("FAYTUKS_LLM_MODE", "live")
+        if transport is None and mode == "replay":
+            transport = ReplayTransport.from_env()
+
+        if transport is not None:
+            self.client = transport
+        else:
+            if not ANTHROPIC_AVAILABLE:
+                raise ImportError("anthropic package not installed. Run: pip install anthropic")
 
-        self.client = anthropic.Anthropic(
-            api_key=key,
-            base_url=self.AI_GATEWAY_URL
-        )
+            # Use AI Gateway key
+            key = api_key or os.getenv("AI_GATEWAY_API_KEY")
+            if not key:
+                raise ValueError("No API key found. Set AI_GATEWAY_API_KEY in .env")
+
+            self.client = anthropic.Anthropic(
+                api_key=key,
+                base_url=os.getenv("AI_GATEWAY_URL", self.AI_GATEWAY_URL)
+            )
+            if mode == "record":
+                self.client = ReplayTransport.from_env(upstream=self.client)
+        self.latencies: Dict[tuple, deque] = {}
+        self.downgrade_counts: Dict[str, int] = {}
+        # Guards latencies and downgrade_counts: --candidates calls from several threads
+        self._lock = threading.Lock()
+        self.command = command
+        self.ledger = ledger if ledger is not None else UsageLedger()
+
+    def _record_latency(self, task: str, model: str, seconds: float):
+        """Track wall time for a (task, model) pair."""
+        with self._lock:
+            self.latencies.setdefault((task, model), deque(maxlen=self.LATENCY_WINDOW)).append(seconds)
+
+    def latency_samples(self) -> Dict[tuple, List[float]]:
+        """Snapshot of the latency windows per (task, model)."""
+        with self._lock:
+            return {key: list(samples) for key, samples in self.latencies.items()}
+
+    def observed_p95(self, task: str, model: str) -> Optional[float]:
+        """Observed p95 latency for a task on a model, or None if too few samples."""
+        with self._lock:
+            samples = list(self.latencies.get((task, model), ()))
+        if len(samples) < self.LATENCY_MIN_SAMPLES:
+            return None
+        return percentile(samples, 95)
+
+    def route(self, task: str) -> Dict[str, Any]:
+        """Pick model and max_tokens for a task, downgrading when its p95 exceeds the budget."""
+        spec = self.TASK_ROUTES.get(task, self.TASK_ROUTES["generate"])
+        model = spec["model"]
+        downgraded = probe = False
+        p95 = self.observed_p95(task, model)
+        if spec["fallback"] and p95 is not None and p95 >= spec["latency_budget"]:
+            with self._lock:
+                count = self.downgrade_counts.get(task, 0) + 1
+                self.downgrade_counts[task] = count
+            if count % self.PROBE_EVERY:
+                model = spec["fallback"]
+                downgraded = True
+            else:
+                probe = True
+        return {**spec, "task": task, "model": model, "downgraded": downgraded, "probe": probe}
+
+    def generate_task(self, task: str, prompt: str, system: str = None) -> str:
+        """Execute prompt with the model routed for a task type (see TASK_ROUTES)."""
+        route = self.route(task)
+        kwargs = {
+            "max_tokens": route["max_tokens"],
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if system:
+            kwargs["system"] = system
+
+        client = self.client
+        if route["fallback"] and not route["downgraded"]:
+            # Cap the primary call at the budget so a slow Opus call can fall back in time
+            client = self.client.with_options(timeout=route["latency_budget"], max_retries=0)
+
+        start = time.monotonic()
+        try:
+            response = self._create(task, client, model=route["model"], **kwargs)
+        except LLM_FALLBACK_ERRORS:
+            if client is self.client:
+                raise
+            # The fallback keeps the client's own retries
+            response = self._create(task, self.client, model=route["fallback"], **kwargs)
+        else:
+            if route["probe"] and time.monotonic() - start < route["latency_budget"]:
+                with self._lock:
+                    samples = self.latencies.get((task, route["model"]))
+                    if samples:
+                        recent = samples[-1]
+                        samples.clear()
+                        samples.append(recent)
+                    self.downgrade_counts[task] = 0
+        return response.content[0].text
+
+    def _create(self, task: str, client, **kwargs):
+        """Run one messages.create call, tracking its latency and writing it to the usage ledger."""
+        start = time.monotonic()
+        try:
+            response = client.messages.create(**kwargs)
+        except LLM_API_ERRORS as e:
+            elapsed = time.monotonic() - start
+            if isinstance(e, LLM_TIMEOUT_ERRORS):
+                error = "timeout"
+                budget = self.TASK_ROUTES.get(task, {}).get("latency_budget", 0)
+                self._record_latency(task, kwargs["model"], max(elapsed, budget))
+            else:
+                status = getattr(e, "status_code", None)
+                error = f"http_{status}" if status else type(e).__name__
+            if self.ledger:
+                self.ledger.record(self.command, task, kwargs["model"], None, elapsed, error=error)
+            raise
+        elapsed = time.monotonic() - start
+        self._record_latency(task, kwargs["model"], elapsed)
+        if self.ledger:
+            self.ledger.record(self.command, task, kwargs["model"], getattr(response, "usage", None), elapsed)
+        return response
 
     def generate(self, prompt: str, model: str = None, max_tokens: int = 1024) -> str:
         """Execute prompt with Claude API. Default: Opus 4.5."""
-        response = self.client.messages.create(
+        response = self._create(
+            "generate", self.client,
             model=model or self.OPUS,
             max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}]
@@ -97,7 +321,8 @@ class ClaudeClient:
 
     def generate_fast(self, prompt: str, max_tokens: int = 512) -> str:
         """Fast generation with Sonnet (for breaking news translation)."""
-        response = self.client.messages.create(
+        response = self._create(
+            "fast", self.client,
             model=self.SONNET,
             max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}]
@@ -106,7 +331,8 @@ class ClaudeClient:
 
     def generate_with_system(self, prompt: str, system: str, model: str = None) -> str:
         """Execute prompt with system message. Default: Opus 4.5."""
-        response = self.client.messages.create(
+        response = self._create(
+            "system", self.client,
             model=model or self.OPUS,
             max_tokens=1024,
             system=system,
@@ -115,6 +341,310 @@ class ClaudeClient:
         return response.content[0].text
 
 
+class UsageLedger:
+    """Append-only JSONL ledger of LLM calls (command, task, model, tokens, cache, wall time)."""
+
+    # USD per million tokens (input, output); cache reads bill at 10% of input
+    MODEL_PRICING = {
+        ClaudeClient.OPUS: (5.0, 25.0),
+        ClaudeClient.SONNET: (3.0, 15.0),
+    }
+    CACHE_READ_RATE = 0.1
+
+    def __init__(self, ledger_file: Path = USAGE_LEDGER_FILE):
+        self.ledger_file = ledger_file
+        self._lock = threading.Lock()
+
+    def estimate_cost(self, model: str, input_tokens: int, output_tokens: int, cache_read_tokens: int = 0) -> float:
+        """Estimate USD cost of a call from token counts."""
+        in_price, out_price = self.MODEL_PRICING.get(model, (0.0, 0.0))
+        return (input_tokens * in_price + cache_read_tokens * in_price * self.CACHE_READ_RATE
+                + output_tokens * out_price) / 1_000_000
+
+    def record(self, command: Optional[str], task: str, model: str, usage: Any, wall_seconds: float,
+               error: Optional[str] = None) -> Dict:
+        """Append one call to the ledger."""
+        input_tokens = getattr(usage, "input_tokens", 0) or 0
+        output_tokens = getattr(usage, "output_tokens", 0) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        entry = {
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "cmd": command or "unknown",
+            "task": task,
+            "model": model,
+            "in": input_tokens,
+            "out": output_tokens,
+            "cache_read": cache_read,
+            "cache_hit": cache_read > 0,
+            "ms": round(wall_seconds * 1000),
+            "usd": round(self.estimate_cost(model, input_tokens, output_tokens, cache_read), 6),
+        }
+        if error:
+            entry["error"] = error
+
+        line = json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n"
+        with self._lock:
+            self.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.ledger_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+        return entry
+
+    def read(self, since: Optional[str] = None) -> List[Dict]:
+        """Read ledger entries, optionally only those on or after a YYYY-MM-DD date."""
+        entries = []
+        if not self.ledger_file.exists():
+            return entries
+        with open(self.ledger_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Tolerate a torn final line
+                if since and entry.get("ts", "")[:10] < since:
+                    continue
+                entries.append(entry)
+        return entries
+
+    def aggregate(self, group_by: List[str], since: Optional[str] = None) -> List[Dict]:
+        """Aggregate entries by any of day/command/task/model with latency percentiles."""
+        fields = {"day": lambda e: e.get("ts", "")[:10], "command": lambda e: e.get("cmd", "unknown"),
+                  "task": lambda e: e.get("task", ""), "model": lambda e: e.get("model", "")}
+        groups: Dict[tuple, List[Dict]] = {}
+        for entry in self.read(since):
+            key = tuple(fields[g](entry) for g in group_by)
+            groups.setdefault(key, []).append(entry)
+
+        rows = []
+        for key, entries in sorted(groups.items()):
+            wall = [e.get("ms", 0) for e in entries]
+            rows.append({
+                **dict(zip(group_by, key)),
+                "calls": len(entries),
+                "errors": sum(1 for e in entries if e.get("error")),
+                "input_tokens": sum(e.get("in", 0) for e in entries),
+                "output_tokens": sum(e.get("out", 0) for e in entries),
+                "cache_hits": sum(1 for e in entries if e.get("cache_hit")),
+                "cost_usd": sum(e.get("usd", 0) for e in entries),
+                "total_ms": sum(wall),
+                "p50_ms": percentile(wall, 50),
+                "p95_ms": percentile(wall, 95),
+                "p99_ms": percentile(wall, 99),
+            })
+        return rows
+
+
+class ReplayTimeoutError(Exception):
+    """Raised by ReplayTransport when artificial latency exceeds the request timeout."""
+
+
+LLM_TIMEOUT_ERRORS = (anthropic.APITimeoutError, ReplayTimeoutError) if ANTHROPIC_AVAILABLE else (ReplayTimeoutError,)
+# Errors a routed primary call falls back on: timeouts, rate limits (429), overload and
+# server errors (529/5xx) and connection failures. Request errors (400/401/403/404) would
+# fail the same way on the fallback model, so they are raised instead.
+LLM_FALLBACK_ERRORS = (LLM_TIMEOUT_ERRORS + (anthropic.RateLimitError, anthropic.InternalServerError,
+                                             anthropic.APIConnectionError)
+                       + ((anthropic.OverloadedError,) if hasattr(anthropic, "OverloadedError") else ())
+                       if ANTHROPIC_AVAILABLE else LLM_TIMEOUT_ERRORS)
+# Errors written to the usage ledger: any API error, plus replay timeouts
+LLM_API_ERRORS = LLM_TIMEOUT_ERRORS + (anthropic.APIError,) if ANTHROPIC_AVAILABLE else LLM_TIMEOUT_ERRORS
+
+
+class ReplayTransport:
+    """Record/replay stand-in for anthropic.Anthropic backed by cassette files.
+
+    Record mode forwards calls to an upstream client and writes each response to
+    CASSETTE_DIR/<key>.json. Replay mode answers from cassettes with artificial
+    latency and no network. Cassettes are keyed on the system prompt and messages,
+    so routing changes (Opus vs Sonnet) still hit the same recording. On a miss,
+    replay picks a recorded cassette deterministically from the prompt hash unless
+    strict, which lets a small recording drive high-volume load tests.
+
+    Environment:
+        FAYTUKS_LLM_MODE=live|record|replay
+        FAYTUKS_CASSETTE_DIR      cassette directory (default: cassettes/)
+        FAYTUKS_REPLAY_LATENCY    seconds per call, or "recorded" (default: 0)
+        FAYTUKS_REPLAY_STRICT=1   raise on cassette misses instead of substituting
+    """
+
+    def __init__(self, cassette_dir: Path = CASSETTE_DIR, upstream: Any = None,
+                 latency: Any = 0.0, strict: bool = False, timeout: Optional[float] = None):
+        self.cassette_dir = Path(cassette_dir)
+        self.upstream = upstream
+        self.latency = latency
+        self.strict = strict
+        self.timeout = timeout
+        self.messages = self._Messages(self)
+        self._cassettes: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        if upstream is None:
+            self._load_cassettes()
+
+    @classmethod
+    def from_env(cls, upstream: Any = None) -> 'ReplayTransport':
+        """Build a transport from FAYTUKS_* environment variables."""
+        latency = os.getenv("FAYTUKS_REPLAY_LATENCY", "0")
+        return cls(
+            cassette_dir=Path(os.getenv("FAYTUKS_CASSETTE_DIR", str(CASSETTE_DIR))),
+            upstream=upstream,
+            latency=latency if latency == "recorded" else float(latency),
+            strict=os.getenv("FAYTUKS_REPLAY_STRICT") == "1",
+        )
+
+    class _Messages:
+        def __init__(self, transport: 'ReplayTransport'):
+            self.transport = transport
+
+        def create(self, **kwargs):
+            return self.transport.create(**kwargs)
+
+    def with_options(self, timeout: Optional[float] = None, **kwargs) -> 'ReplayTransport':
+        """Mirror anthropic.Anthropic.with_options (timeout is enforced against artificial latency)."""
+        clone = ReplayTransport.__new__(ReplayTransport)
+        clone.__dict__.update(self.__dict__)
+        clone.timeout = timeout
+        if self.upstream is not None:
+            clone.upstream = self.upstream.with_options(timeout=timeout, **kwargs)
+        clone.messages = self._Messages(clone)
+        return clone
+
+    @staticmethod
+    def cassette_key(kwargs: Dict) -> str:
+        """Stable key for a request: hash of system prompt and messages."""
+        payload = json.dumps({"system": kwargs.get("system"), "messages": kwargs.get("messages")},
+                             sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _load_cassettes(self):
+        """Index all cassettes in memory so replay never touches disk per call."""
+        if not self.cassette_dir.exists():
+            return
+        for f in sorted(self.cassette_dir.glob("*.json")):
+            try:
+                with open(f, 'r', encoding='utf-8') as file:
+                    self._cassettes[f.stem] = json.load(file)
+            except (OSError, json.JSONDecodeError):
+                continue
+
+    def create(self, **kwargs):
+        key = self.cassette_key(kwargs)
+        if self.upstream is not None:
+            return self._record(key, kwargs)
+        return self._replay(key, kwargs)
+
+    def _record(self, key: str, kwargs: Dict):
+        start = time.monotonic()
+        response = self.upstream.messages.create(**kwargs)
+        usage = getattr(response, "usage", None)
+        cassette = {
+            "key": key,
+            "recorded_at": datetime.now().isoformat(),
+            "request": {k: kwargs.get(k) for k in ("model", "max_tokens", "system", "messages")},
+            "response": {
+                "model": getattr(response, "model", kwargs.get("model")),
+                "text": response.content[0].text,
+                "usage": {
+                    "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+                    "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+                },
+            },
+            "latency_ms": round((time.monotonic() - start) * 1000),
+        }
+        self.cassette_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self.cassette_dir / f"{key}.json", cassette)
+        with self._lock:
+            self._cassettes[key] = cassette
+        return response
+
+    def lookup(self, key: str) -> Dict:
+        """Find the cassette for a key, substituting deterministically on a miss."""
+        cassette = self._cassettes.get(key)
+        if cassette is None:
+            if self.strict or not self._cassettes:
+                raise KeyError(f"No cassette for request {key} in {self.cassette_dir}")
+            keys = sorted(self._cassettes)
+            cassette = self._cassettes[keys[int(key, 16) % len(keys)]]
+        return cassette
+
+    def _replay(self, key: str, kwargs: Dict):
+        from types import SimpleNamespace
+
+        cassette = self.lookup(key)
+        delay = cassette.get("latency_ms", 0) / 1000 if self.latency == "recorded" else float(self.latency)
+        if self.timeout is not None and delay > self.timeout:
+            time.sleep(self.timeout)
+            raise ReplayTimeoutError(f"Replay latency {delay:.2f}s exceeds timeout {self.timeout}s")
+        if delay:
+            time.sleep(delay)
+
+        response = cassette.get("response", {})
+        usage = response.get("usage", {})
+        return SimpleNamespace(
+            model=kwargs.get("model", response.get("model")),
+            content=[SimpleNamespace(type="text", text=response.get("text", ""))],
+            usage=SimpleNamespace(input_tokens=usage.get("input_tokens", 0),
+                                  output_tokens=usage.get("output_tokens", 0),
+                                  cache_read_input_tokens=0),
+        )
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8765):
+        """Serve cassettes over HTTP as a local Messages API stand-in (POST /v1/messages)."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        transport = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if not self.path.split("?")[0].endswith("/v1/messages"):
+                    self.send_error(404)
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                except (ValueError, UnicodeDecodeError) as e:
+                    self.send_error(400, f"Malformed request body: {e}")
+                    return
+                if not isinstance(request, dict):
+                    self.send_error(400, "Request body must be a JSON object")
+                    return
+                try:
+                    response = transport._replay(transport.cassette_key(request), request)
+                except KeyError as e:
+                    self.send_error(404, str(e))
+                    return
+                body = json.dumps({
+                    "id": f"msg_replay_{transport.cassette_key(request)[:16]}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": response.model,
+                    "content": [{"type": "text", "text": response.content[0].text}],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": response.usage.input_tokens,
+                              "output_tokens": response.usage.output_tokens},
+                }, ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep load tests quiet
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        print(f"Replaying {len(self._cassettes)} cassettes from {self.cassette_dir} on http://{host}:{port}")
+        print(f"Point the engine at it with: AI_GATEWAY_URL=http://{host}:{port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
 class TweetPattern(Enum):
     FIRE_PARALLEL = "fire_parallel"
     COUNTER_REVOLUTION = "counter_revolution"
@@ -204,6 +734,17 @@ def get_emotions(pattern: str) -> List[str]:
     return PATTERN_EMOTIONS.get(pattern, ["OUTRAGE"])
 
 
+def weighted_length(text: str) -> int:
+    """Tweet length as X counts it: URLs count 23, characters outside Latin ranges count 2."""
+    text = re.sub(r"https?://\S+", "x" * 23, text or "")
+    length = 0
+    for ch in text:
+        cp = ord(ch)
+        light = cp <= 0x10FF or 0x2000 <= cp <= 0x200D or 0x2010 <= cp <= 0x201F or 0x2032 <= cp <= 0x2037
+        length += 1 if light else 2
+    return length
+
+
 def auto_detect_pattern(text: str) -> List[tuple]:
     """Auto-detect which patterns match the input text.
 
@@ -242,17 +783,271 @@ class TweetDraft:
 @dataclass
 class ValidationResult:
     passed: bool
-    fact_check_score: float
+    fact_check_score: Optional[float]
     voice_score: float
     parallel_score: float
     issues: List[str]
     suggestions: List[str]
+    confidence: str = ""
+    raw: str = ""
+
+
+@dataclass
+class GeneratedTweet:
+    text: str
+    sources: List[str]
+    confidence: str
+    hashtags: List[str]
+    raw: str = ""
+
+
+@dataclass
+class CounterTweet:
+    text: str
+    strategy: str
+    facts: List[str]
+    hashtags: List[str]
+    raw: str = ""
+
+
+@dataclass
+class AnniversaryTweet:
+    text: str
+    pattern: str
+    connection: str
+    hashtags: List[str]
+    raw: str = ""
+
+
+@dataclass
+class MemorialTweet:
+    text: str
+    tone_check: str
+    humanization: str
+    hashtags: List[str]
+    raw: str = ""
+
+
+@dataclass
+class EnrichmentResult:
+    text: str
+    parallel: str
+    hashtags: List[str]
+    raw: str = ""
+
+
+class ResponseParseError(ValueError):
+    """Raised when a completion does not match its prompt family's OUTPUT FORMAT."""
+
+
+class ResponseParser:
+    """Parses completions for each prompt family into typed results.
+
+    Each family maps the labels from its prompt's OUTPUT FORMAT block to fields.
+    A label's value runs until the next known label, so multi-line tweets survive.
+    """
+
+    FAMILIES = {
+        "generate": {
+            "labels": {"TWEET": "text", "SOURCES": "sources", "CONFIDENCE": "confidence"},
+            "required": ["text"],
+        },
+        "counter": {
+            "labels": {"COUNTER-TWEET": "text", "STRATEGY USED": "strategy", "FACTS DEPLOYED": "facts"},
+            "required": ["text"],
+        },
+        "anniversary": {
+            "labels": {"ANNIVERSARY TWEET": "text", "PATTERN USED": "pattern", "CONNECTION TO 2026": "connection"},
+            "required": ["text"],
+        },
+        "memorial": {
+            "labels": {"MEMORIAL TWEET": "text", "TONE CHECK": "tone_check", "HUMANIZATION": "humanization"},
+            "required": ["text"],
+        },
+        "enrichment": {
+            "labels": {"TWEET": "text", "PARALLEL": "parallel", "HASHTAGS": "hashtags"},
+            "required": ["text"],
+        },
+        "validation": {
+            "labels": {"READY TO PUBLISH": "ready", "ISSUES": "issues", "SUGGESTIONS": "suggestions",
+                       "CONFIDENCE": "confidence"},
+            "required": ["ready"],
+        },
+    }
+
+    # Fields that hold lists in the typed results
+    LIST_FIELDS = {"sources", "facts", "issues", "suggestions"}
+
+    HASHTAG_RE = re.compile(r"#[\w\u0600-\u06FF]+")
+
+    def split_sections(self, family: str, raw: str) -> Dict[str, str]:
+        """Split a completion into {field: value} using the family's labels."""
+        labels = self.FAMILIES[family]["labels"]
+        # Longest labels first so "COUNTER-TWEET" wins over a bare "TWEET"
+        alternation = "|".join(re.escape(l) for l in sorted(labels, key=len, reverse=True))
+        label_re = re.compile(rf"^[ \t>*_#-]*({alternation})[ \t*_]*:[ \t*_]*", re.IGNORECASE | re.MULTILINE)
+
+        sections = {}
+        matches = list(label_re.finditer(raw))
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(raw)
+            field = labels[next(l for l in labels if l.lower() == match.group(1).lower())]
+            sections.setdefault(field, raw[match.end():end].strip())
+        return sections
+
+    @staticmethod
+    def _clean_text(value: str) -> str:
+        """Strip placeholder brackets and wrapping quotes from a tweet body."""
+        value = value.strip()
+        if value.startswith("[") and value.endswith("]"):
+            value = value[1:-1].strip()
+        if len(value) > 1 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1].strip()
+        return value
+
+    @staticmethod
+    def _split_list(value: str) -> List[str]:
+        """Split a bullet, comma or newline separated value into items."""
+        value = value.strip().strip("[]")
+        if not value or value.lower() in ("none", "n/a", "-"):
+            return []
+        separator = "\n" if "\n" in value else ","
+        items = [re.sub(r"^\s*(?:[-*•]|\d+[.)])\s*", "", item).strip() for item in value.split(separator)]
+        return [item for item in items if item]
+
+    def parse(self, family: str, raw: str) -> Any:
+        """Parse a completion into the family's typed result, or raise ResponseParseError."""
+        if family not in self.FAMILIES:
+            raise ValueError(f"Unknown prompt family: {family}")
+        sections = self.split_sections(family, raw or "")
+        missing = [f for f in self.FAMILIES[family]["required"] if not sections.get(f)]
+        if missing:
+            raise ResponseParseError(f"{family} response missing {', '.join(missing)}")
+
+        if family == "validation":
+            return self._parse_validation(raw, sections)
+
+        fields = {}
+        for field, value in sections.items():
+            if field in self.LIST_FIELDS:
+                fields[field] = self._split_list(value)
+            elif field == "text":
+                fields[field] = self._clean_text(value)
+            else:
+                fields[field] = value.strip().strip("[]").strip()
+
+        text = fields.get("text", "")
+        if not text:
+            raise ResponseParseError(f"{family} response has an empty tweet")
+        hashtags = self.HASHTAG_RE.findall(text)
+
+        if family == "generate":
+            return GeneratedTweet(text=text, sources=fields.get("sources", []),
+                                  confidence=fields.get("confidence", "").lower(), hashtags=hashtags, raw=raw)
+        if family == "counter":
+            return CounterTweet(text=text, strategy=fields.get("strategy", ""),
+                                facts=fields.get("facts", []), hashtags=hashtags, raw=raw)
+        if family == "anniversary":
+            return AnniversaryTweet(text=text, pattern=fields.get("pattern", ""),
+                                    connection=fields.get("connection", ""), hashtags=hashtags, raw=raw)
+        if family == "memorial":
+            return MemorialTweet(text=text, tone_check=fields.get("tone_check", ""),
+                                 humanization=fields.get("humanization", ""), hashtags=hashtags, raw=raw)
+        suggested = self.HASHTAG_RE.findall(sections.get("hashtags", ""))
+        return EnrichmentResult(text=text, parallel=fields.get("parallel", ""),
+                                hashtags=hashtags or suggested, raw=raw)
+
+    def _parse_validation(self, raw: str, sections: Dict[str, str]) -> ValidationResult:
+        """Parse the full validation verdict.
+
+        Section scores come from 'TOTAL: X/25' lines, or from the per-criterion
+        '1. Name: X' scores (out of 5) when the total is missing. The fact score is
+        the share of 'Verdict: PASS' lines, or None when the check gave no verdicts.
+        """
+        ready = sections["ready"].split()[0].strip("*[]").upper() if sections["ready"].split() else ""
+        if ready not in ("YES", "NO"):
+            raise ResponseParseError(f"validation verdict is not YES/NO: {sections['ready'][:40]}")
+
+        def section_score(header: str) -> float:
+            match = re.search(rf"=== {header}.*?===(.*?)(?====|\Z)", raw, re.DOTALL | re.IGNORECASE)
+            body = match.group(1) if match else ""
+            total = re.search(r"TOTAL:\s*(\d+(?:\.\d+)?)\s*/\s*(\d+)", body)
+            if total:
+                return float(total.group(1)) / float(total.group(2))
+            criteria = [float(x) for x in re.findall(
+                r"^\s*\d+[.)][^\n]*?[:=\-]\s*\**(\d(?:\.\d+)?)\**\s*(?:/\s*5)?\s*$", body, re.MULTILINE)]
+            return sum(criteria) / (5 * len(criteria)) if criteria else 0.0
+
+        fact_section = re.search(r"=== FACT CHECK ===(.*?)(?====|\Z)", raw, re.DOTALL | re.IGNORECASE)
+        verdicts = [v.upper() for v in re.findall(r"Verdict\W*\s*(PASS|FAIL)\b(?!\s*[/|])",
+                                                  fact_section.group(1) if fact_section else "",
+                                                  re.IGNORECASE)]
+        fact_score = verdicts.count("PASS") / len(verdicts) if verdicts else None
+
+        return ValidationResult(
+            passed=ready == "YES",
+            fact_check_score=fact_score,
+            voice_score=section_score("VOICE CHECK"),
+            parallel_score=section_score("PARALLEL CHECK"),
+            issues=self._split_list(sections.get("issues", "")),
+            suggestions=self._split_list(sections.get("suggestions", "")),
+            confidence=sections.get("confidence", "").strip("[]").strip().lower(),
+            raw=raw,
+        )
+
+    def repair_prompt(self, family: str, raw: str) -> str:
+        """Prompt asking the model to re-emit a completion in the family's exact format."""
+        labels = self.FAMILIES[family]["labels"]
+        format_lines = "\n".join(f"{label}: [...]" for label in labels)
+        return f"""Reformat this response into the exact output format below.
+Do not rewrite, shorten or improve the content - only restructure it.
+If a field is genuinely absent, write N/A.
+
+RESPONSE:
+{raw}
+
+OUTPUT FORMAT:
+{format_lines}
+"""
+
+    def parse_with_repair(self, family: str, raw: str, claude_client: Optional['ClaudeClient'] = None) -> Any:
+        """Parse a completion; on failure make one targeted repair call instead of regenerating."""
+        try:
+            return self.parse(family, raw)
+        except ResponseParseError:
+            if not claude_client:
+                raise
+        repaired = claude_client.generate_task("repair", self.repair_prompt(family, raw))
+        result = self.parse(family, repaired)
+        result.raw = raw
+        return result
+
+    def try_parse(self, family: str, raw: str, claude_client: Optional['ClaudeClient'] = None) -> Optional[Any]:
+        """parse_with_repair, returning None when the completion cannot be salvaged.
+
+        A failed repair call (API error or timeout) also yields None, so callers keep
+        the completion they already have and fall back to printing it raw.
+        """
+        try:
+            return self.parse_with_repair(family, raw, claude_client)
+        except ResponseParseError:
+            return None
+        except LLM_API_ERRORS as e:
+            print(f"Warning: {family} repair call failed: {e}", file=sys.stderr)
+            return None
 
 
 # Media paths
 MEDIA_DIR = Path(__file__).parent / "media"
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 DRAFTS_DIR = Path(__file__).parent / "drafts"
+STATE_DIR = Path(__file__).parent / "state"
+BUCKETS_DIR = Path(__file__).parent / "buckets"
+BUCKETS_CONFIG_FILE = Path(__file__).parent / "buckets.json"
+INGEST_STATE_FILE = STATE_DIR / "ingest-marks.json"
+INGEST_BACKLOG_FILE = STATE_DIR / "ingest-backlog.json"
+SEEN_TWEETS_FILE = STATE_DIR / "seen-tweets.json"
+DAEMON_CHECKPOINT_FILE = STATE_DIR / "daemon-checkpoint.json"
 
 
 class MediaMatcher:
@@ -488,7 +1283,7 @@ HASHTAGS: [suggested hashtags]
 """
 
     def translate_to_persian(self, english_text: str, claude_client: 'ClaudeClient') -> str:
-        """Translate breaking news to Persian for bilingual posting. Uses Sonnet for speed."""
+        """Translate breaking news to Persian for bilingual posting. Routed to the fast model."""
         prompt = f"""Translate this breaking news tweet to Persian (Farsi).
 
 ENGLISH:
@@ -503,219 +1298,2973 @@ RULES:
 6. Output ONLY the Persian translation, nothing else
 
 PERSIAN:"""
-        return claude_client.generate_fast(prompt).strip()
+        return claude_client.generate_task("breaking_translation", prompt).strip()
+
+    # Max tweets per bulk translation request
+    BULK_TRANSLATION_SIZE = 10
+
+    def generate_bulk_translation_prompt(self, english_texts: List[str]) -> str:
+        """Generate a prompt translating several tweets as one JSON array."""
+        items = json.dumps([{"index": i, "english": t} for i, t in enumerate(english_texts)],
+                           indent=2, ensure_ascii=False)
+        return f"""Translate each of these breaking news tweets to Persian (Farsi).
+
+TWEETS (JSON):
+{items}
+
+RULES:
+1. Keep the same factual content and tone
+2. Use standard Persian, not overly formal
+3. If there are hashtags in English, translate them to Persian equivalents
+4. Keep names transliterated (not translated)
+5. Maximum 280 characters per translation
+6. Translate every tweet independently - never merge or skip one
+
+OUTPUT FORMAT:
+Output ONLY a JSON array with exactly {len(english_texts)} objects, in the same order:
+[{{"index": 0, "persian": "..."}}, ...]"""
+
+    @staticmethod
+    def parse_bulk_translation(response: str, expected: int) -> List[Optional[str]]:
+        """Parse a bulk translation into one entry per input; None marks a missing or bad item.
+
+        Raises ValueError when the array is unreadable or its count does not match.
+        """
+        start, end = response.find("["), response.rfind("]")
+        if start == -1 or end <= start:
+            raise ValueError("No JSON array in bulk translation response")
+        items = json.loads(response[start:end + 1])
+        if not isinstance(items, list) or len(items) != expected:
+            raise ValueError(f"Expected {expected} translations, got {len(items) if isinstance(items, list) else 0}")
+
+        translations: List[Optional[str]] = [None] * expected
+        for position, item in enumerate(items):
+            index = item.get("index", position) if isinstance(item, dict) else position
+            text = item.get("persian") if isinstance(item, dict) else item
+            if index != position:
+                raise ValueError(f"Bulk translation out of order at position {position}")
+            if isinstance(text, str) and text.strip():
+                translations[position] = text.strip()
+        return translations
+
+    def translate_batch_to_persian(self, english_texts: List[str], claude_client: 'ClaudeClient',
+                                   batch_size: int = None) -> List[str]:
+        """Translate many tweets with one LLM call per batch.
+
+        A batch whose output count or order does not match falls back to per-tweet
+        calls; individual empty items are retried alone. Returns "" for any tweet
+        that still fails, matching the single-tweet callers' behaviour.
+        """
+        batch_size = batch_size or self.BULK_TRANSLATION_SIZE
+        results: List[str] = []
+        for offset in range(0, len(english_texts), batch_size):
+            batch = english_texts[offset:offset + batch_size]
+            translations: List[Optional[str]] = [None] * len(batch)
+            if len(batch) > 1:
+                try:
+                    response = claude_client.generate_task("bulk_translation",
+                                                           self.generate_bulk_translation_prompt(batch))
+                    translations = self.parse_bulk_translation(response, len(batch))
+                except Exception:
+                    pass  # Whole batch falls back to per-tweet calls below
+
+            for i, text in enumerate(batch):
+                if translations[i] is None:
+                    try:
+                        translations[i] = self.translate_to_persian(text, claude_client)
+                    except Exception:
+                        translations[i] = ""
+            results.extend(translations)
+        return results
 
     def download_tweet_media(self, tweet_id: str, handle: str) -> List[str]:
         """Download media from a tweet using yt-dlp or gallery-dl."""
         import subprocess
         import urllib.request
 
-        media_dir = Path(__file__).parent / "media" / "downloaded" / handle
-        media_dir.mkdir(parents=True, exist_ok=True)
+        media_dir = Path(__file__).parent / "media" / "downloaded" / handle
+        media_dir.mkdir(parents=True, exist_ok=True)
+
+        downloaded = []
+        tweet_url = f"https://x.com/{handle}/status/{tweet_id}"
+
+        # Try gallery-dl first (better for images)
+        try:
+            result = subprocess.run(
+                ["gallery-dl", "--dest", str(media_dir), tweet_url],
+                capture_output=True, text=True, timeout=30
+            )
+            if result.returncode == 0:
+                # Find downloaded files
+                for f in media_dir.glob(f"*{tweet_id}*"):
+                    downloaded.append(str(f))
+                    print(f"  📷 Downloaded: {f.name}")
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            pass
+
+        # Fallback to yt-dlp for videos
+        if not downloaded:
+            try:
+                result = subprocess.run(
+                    ["yt-dlp", "-o", str(media_dir / f"{tweet_id}.%(ext)s"), tweet_url],
+                    capture_output=True, text=True, timeout=60
+                )
+                if result.returncode == 0:
+                    for f in media_dir.glob(f"{tweet_id}.*"):
+                        downloaded.append(str(f))
+                        print(f"  🎬 Downloaded: {f.name}")
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                pass
+
+        return downloaded
+
+    def enrich_draft(self, draft: Dict, claude_client: 'ClaudeClient' = None) -> Dict:
+        """Enrich a bucket-based draft with historical context."""
+        text = draft.get('english', '')
+        pattern = self.detect_pattern(text)
+
+        if not pattern:
+            pattern = draft.get('pattern', 'massacre_escalation')
+
+        context = self.get_historical_context(pattern)
+
+        enriched = {
+            **draft,
+            "detected_pattern": pattern,
+            "historical_context": {
+                "facts_count": len(context.get('facts', [])),
+                "era": context.get('era', {}).get('name') if context.get('era') else None
+            }
+        }
+
+        if claude_client:
+            prompt = self.generate_enrichment_prompt(text, context)
+            response = claude_client.generate_task("enrichment", prompt)
+            result = ResponseParser().try_parse("enrichment", response, claude_client)
+            enriched["supplemental_tweet"] = result.text if result else response
+            if result:
+                enriched["supplemental_parallel"] = result.parallel
+                enriched["supplemental_hashtags"] = result.hashtags
+            enriched["enrichment_prompt"] = prompt
+
+        return enriched
+
+
+class NearDuplicateIndex:
+    """Near-duplicate text detection with 64-bit SimHash and banded LSH.
+
+    Signatures are split into max_distance + 1 bands, so two texts within
+    max_distance differing bits share at least one band exactly and only
+    those bucket-mates need a Hamming check.
+    """
+
+    BITS = 64
+
+    def __init__(self, max_distance: int = 7):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width = self.BITS // bands
+        self.bands = [(i * width, self.BITS if i == bands - 1 else (i + 1) * width) for i in range(bands)]
+        self.signatures: Dict[str, int] = {}
+        self.buckets: Dict[tuple, List[str]] = {}
+
+    @staticmethod
+    def tokens(text: str) -> List[str]:
+        """Lowercased words with URLs, mentions and RT markers removed."""
+        text = re.sub(r"https?://\S+|@\w+|\bRT\b", " ", text or "")
+        return re.findall(r"[\w']+", text.lower())
+
+    # Byte value -> its 8 bits spread into 16-bit counter lanes, so per-bit
+    # votes for all features are summed with a handful of big-int additions
+    _LANES = [sum(((v >> bit) & 1) << (16 * bit) for bit in range(8)) for v in range(256)]
+
+    @classmethod
+    def simhash(cls, text: str) -> int:
+        words = cls.tokens(text)
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        votes = 0
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            for i, byte in enumerate(reversed(digest)):
+                votes += cls._LANES[byte] << (128 * i)
+        half = len(features) / 2
+        return sum(1 << bit for bit in range(cls.BITS) if (votes >> (16 * bit) & 0xFFFF) > half)
+
+    def _band_keys(self, signature: int) -> List[tuple]:
+        return [(i, signature >> lo & ((1 << (hi - lo)) - 1)) for i, (lo, hi) in enumerate(self.bands)]
+
+    def add(self, key: str, text: str):
+        if not self.tokens(text):
+            return  # No features (empty, URL- or mention-only): signature 0 would match every such text
+        signature = self.simhash(text)
+        self.signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self.buckets.setdefault(band_key, []).append(key)
+
+    def remove(self, key: str):
+        signature = self.signatures.pop(key, None)
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            keys = self.buckets.get(band_key, [])
+            if key in keys:
+                keys.remove(key)
+
+    def nearest(self, text: str) -> Optional[tuple]:
+        """(key, distance) of the closest indexed text within max_distance bits, if any."""
+        if not self.tokens(text):
+            return None
+        signature = self.simhash(text)
+        best, best_distance = None, self.max_distance + 1
+        for band_key in self._band_keys(signature):
+            for key in self.buckets.get(band_key, []):
+                distance = bin(signature ^ self.signatures[key]).count("1")
+                if distance < best_distance:
+                    best, best_distance = key, distance
+        return (best, best_distance) if best is not None else None
+
+    def find(self, text: str) -> Optional[str]:
+        """Key of the closest indexed text within max_distance bits, if any."""
+        nearest = self.nearest(text)
+        return nearest[0] if nearest else None
+
+    def check_and_add(self, key: str, text: str) -> Optional[str]:
+        """Return the key this text duplicates, or index it and return None."""
+        duplicate = self.find(text)
+        if duplicate is None:
+            self.add(key, text)
+        return duplicate
+
+    @classmethod
+    def from_drafts(cls, draft_mgr: 'DraftManager', days: float = 7, max_distance: int = 7,
+                    statuses: Optional[tuple] = None) -> 'NearDuplicateIndex':
+        """Index drafts created, and tweets posted, within the last `days`.
+
+        Pages newest first and stops at the cutoff, so only drafts inside the
+        window are opened.
+        """
+        from datetime import timedelta
+
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        index = cls(max_distance)
+        for status in statuses or DRAFT_STATUSES:
+            sort = "posted_at" if status == "posted" else "created_at"
+            cursor = None
+            while True:
+                drafts, cursor = draft_mgr.page(status, 200, cursor, fields=["id", sort, "english"])
+                recent = [d for d in drafts if (d.get(sort) or "") >= cutoff]
+                for draft in recent:
+                    if draft.get("english"):
+                        index.add(str(draft["id"]), draft["english"])
+                if cursor is None or len(recent) < len(drafts):
+                    break
+        return index
+
+
+def parse_tweet_date(value: str) -> Optional[datetime]:
+    """Parse a bucket tweet's ISO date ('...Z' included); None if missing or invalid."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+class BucketFileError(ValueError):
+    """Raised when a bucket file is valid JSON but not a tweets object or list."""
+
+
+def _load_json_tweets(f, header: Dict) -> List[Dict]:
+    """Tweets of a bucket JSON file ({..., "tweets": [...]} or a bare list); other top-level keys go to `header`.
+
+    Entries that are not objects are dropped; any other top-level shape raises BucketFileError.
+    """
+    data = json.load(f)
+    if isinstance(data, dict):
+        header.update((k, v) for k, v in data.items() if k != "tweets")
+        data = data.get("tweets", [])
+    if not isinstance(data, list):
+        raise BucketFileError(f"expected a tweets list, got {type(data).__name__}")
+    return [t for t in data if isinstance(t, dict)]
+
+
+def stream_bucket_tweets(file_path: Path, stop_at: Optional[datetime] = None):
+    """Yield tweets from a bucket file (*-tweets.json or *-tweets.ndjson).
+
+    NDJSON files written by convert_bucket_file() are read lazily and sorted
+    newest first, so with `stop_at` reading stops at the first tweet not
+    newer than it. The scraper's JSON files are not date-sorted and are
+    loaded whole; ingest converts each one once per re-scrape (see
+    FaytuksDaemon.scrape_buckets), so later reads take the NDJSON path.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        if file_path.suffix != ".ndjson":
+            yield from _load_json_tweets(f, {})
+            return
+        header = json.loads(f.readline() or "{}")
+        if not isinstance(header, dict):
+            raise BucketFileError("first line is not a header object")
+        sorted_desc = header.get("sortedBy") == "date-desc"
+        for line in f:
+            if not line.strip():
+                continue
+            tweet = json.loads(line)
+            if not isinstance(tweet, dict):
+                continue
+            if sorted_desc and stop_at is not None:
+                ts = parse_tweet_date(tweet.get('date', ''))
+                if ts is None or ts <= stop_at:
+                    return
+            yield tweet
+
+
+def convert_bucket_file(file_path: Path) -> Path:
+    """Write a *-tweets.json bucket file as newest-first NDJSON next to it.
+
+    Line 1 is the header (handle, name, scrapedAt, ..., sortedBy, and
+    sourceMtimeNs, the JSON's mtime when it was read), then one tweet per
+    line. The write is atomic; returns the new path.
+    """
+    import tempfile
+
+    header: Dict[str, Any] = {}
+    # Stat before reading: a re-scrape during the read leaves a mismatch, so it converts again
+    source_mtime = file_path.stat().st_mtime_ns
+    with open(file_path, 'r', encoding='utf-8') as f:
+        tweets = _load_json_tweets(f, header)
+
+    def newest_first(t):
+        ts = parse_tweet_date(t.get('date', ''))
+        return ts.timestamp() if ts else float("-inf")
+
+    tweets.sort(key=newest_first, reverse=True)
+    header.update({"tweetCount": len(tweets), "sortedBy": "date-desc", "sourceMtimeNs": source_mtime})
+
+    target = file_path.with_suffix(".ndjson")
+    fd, tmp = tempfile.mkstemp(dir=str(target.parent), prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            for tweet in tweets:
+                f.write(json.dumps(tweet, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return target
+
+
+def _current_bucket_file(json_path: Path) -> Optional[Path]:
+    """The NDJSON copy of a bucket file if it was converted from the JSON as it is now, else the JSON."""
+    ndjson_path = json_path.with_suffix(".ndjson")
+    try:
+        json_mtime = json_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ndjson_path if ndjson_path.exists() else None
+    try:
+        with open(ndjson_path, 'r', encoding='utf-8') as f:
+            header = json.loads(f.readline() or "{}")
+    except (OSError, json.JSONDecodeError):
+        return json_path
+    current = isinstance(header, dict) and header.get("sourceMtimeNs") == json_mtime
+    return ndjson_path if current else json_path
+
+
+def tweet_epoch_ms(tweet: Dict) -> Optional[int]:
+    """A tweet's date as epoch milliseconds (UTC if no offset); uses 'epoch_ms' when already set."""
+    if 'epoch_ms' in tweet:
+        return tweet['epoch_ms']
+    ts = parse_tweet_date(tweet.get('date', ''))
+    if ts is None:
+        return None
+    if ts.tzinfo is None:
+        from datetime import timezone
+        ts = ts.replace(tzinfo=timezone.utc)
+    return int(ts.timestamp() * 1000)
+
+
+class TweetTimeIndex:
+    """Tweets read from a bucket file, sorted by date parsed once into epoch ms.
+
+    Each tweet gets an 'epoch_ms' field that later stages (window cuts,
+    merging files, seen-set checks) use instead of reparsing its date, and
+    window() answers "tweets newer than X" by binary search in O(log n + k),
+    newest first. Build it from stream_bucket_tweets() with `stop_at`, so a
+    date-sorted NDJSON file is only read down to the window. Undated tweets
+    are left out.
+    """
+
+    def __init__(self, tweets):
+        from array import array
+
+        dated = []
+        for t in tweets:
+            ms = tweet_epoch_ms(t)
+            if ms is not None:
+                t['epoch_ms'] = ms
+                dated.append(t)
+        dated.sort(key=lambda t: t['epoch_ms'])
+        self.tweets = dated
+        self.epochs = array('q', (t['epoch_ms'] for t in dated))
+
+    def __len__(self) -> int:
+        return len(self.tweets)
+
+    @property
+    def newest_ms(self) -> Optional[int]:
+        return self.epochs[-1] if self.epochs else None
+
+    def window(self, after_ms: Optional[int] = None, until_ms: Optional[int] = None) -> List[Dict]:
+        """Tweets with after_ms < epoch_ms <= until_ms, newest first."""
+        lo = 0 if after_ms is None else bisect.bisect_right(self.epochs, after_ms)
+        hi = len(self.epochs) if until_ms is None else bisect.bisect_right(self.epochs, until_ms)
+        return self.tweets[lo:hi][::-1]
+
+
+def discover_bucket_files(config_file: Path = BUCKETS_CONFIG_FILE,
+                          buckets_dir: Path = BUCKETS_DIR) -> Dict[str, List[tuple]]:
+    """Map each bucket to its (handle, tweets file) pairs.
+
+    Accounts come from buckets.json (files named <handle lowercased>-tweets.json
+    in buckets/<bucket>/); any other *-tweets.json in a bucket directory is
+    picked up too. Files that don't exist yet are left out. A
+    *-tweets.ndjson copy converted from the JSON as it is now is used in
+    place of the JSON.
+    """
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f).get("buckets", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        config = {}
+
+    buckets: Dict[str, List[tuple]] = {}
+    names = list(config) + sorted(d.name for d in buckets_dir.glob("*") if d.is_dir() and d.name not in config)
+    for bucket in names:
+        files = {}
+        for account in config.get(bucket, {}).get("accounts", []):
+            handle = account.get("handle", "")
+            stem = f"{handle.lower()}-tweets"
+            if handle:
+                files[stem] = (handle, buckets_dir / bucket / f"{stem}.json")
+        for path in sorted((buckets_dir / bucket).glob("*-tweets.*")):
+            if path.suffix in (".json", ".ndjson"):
+                files.setdefault(path.stem, (path.stem[:-len("-tweets")], path.with_suffix(".json")))
+        buckets[bucket] = [(handle, current) for handle, path in files.values()
+                           if (current := _current_bucket_file(path))]
+    return buckets
+
+
+def load_bucket_schedule(config_file: Path = BUCKETS_CONFIG_FILE) -> Dict[str, Dict[str, float]]:
+    """Per-bucket {"period", "window", "jitter"} from buckets.json `defaults`.
+
+    defaults.schedule.<bucket> may set periodSeconds, windowHours and
+    jitterSeconds; anything missing falls back to checkIntervalMinutes and
+    FaytuksDaemon.BUCKET_WINDOWS.
+    """
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        config = {}
+    defaults = config.get("defaults", {})
+    period = defaults.get("checkIntervalMinutes", 60) * 60
+    overrides = defaults.get("schedule", {})
+
+    schedule = {}
+    for bucket in list(FaytuksDaemon.BUCKET_WINDOWS) + [b for b in overrides if b not in FaytuksDaemon.BUCKET_WINDOWS]:
+        entry = overrides.get(bucket, {})
+        schedule[bucket] = {
+            "period": float(entry.get("periodSeconds", period)),
+            "window": float(entry.get("windowHours", FaytuksDaemon.BUCKET_WINDOWS.get(bucket, 24))),
+            "jitter": float(entry.get("jitterSeconds", 0)),
+        }
+    return schedule
+
+
+def load_admission_limits(config_file: Path = BUCKETS_CONFIG_FILE) -> Dict[str, Dict[str, int]]:
+    """Per-bucket {"high", "low"} pending-queue watermarks from buckets.json `defaults.admission`.
+
+    Buckets without an entry are not limited.
+    """
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        config = {}
+    limits = {}
+    for bucket, entry in config.get("defaults", {}).get("admission", {}).items():
+        high = int(entry.get("highWatermark", 0))
+        if high > 0:
+            limits[bucket] = {"high": high, "low": min(high, int(entry.get("lowWatermark", high)))}
+    return limits
+
+
+class AdmissionController:
+    """Queue-depth-aware admission of new drafts, per bucket, with hysteresis.
+
+    A bucket admits drafts until its pending depth reaches the high
+    watermark, then stays closed until reviewers bring it down to the low
+    watermark. Candidates that don't fit are deferred (kept, best first, up
+    to DEFERRED_LIMIT per bucket and offered again on later passes) or
+    dropped once that backlog is full or they leave the bucket window.
+    """
+
+    DEFERRED_LIMIT = 50
+
+    def __init__(self, limits: Dict[str, Dict[str, int]], closed: Optional[List[str]] = None):
+        self.limits = limits
+        self.closed = set(closed or [])
+        self._lock = threading.Lock()
+
+    def allowance(self, bucket: str, depth: int) -> Optional[int]:
+        """How many new drafts `bucket` may add at this pending depth (None: unlimited)."""
+        limit = self.limits.get(bucket)
+        if limit is None:
+            return None
+        with self._lock:
+            if bucket in self.closed and depth > limit["low"]:
+                return 0
+            self.closed.discard(bucket)
+            if depth >= limit["high"]:
+                self.closed.add(bucket)
+                return 0
+            return limit["high"] - depth
+
+
+class BucketIngestor:
+    """Incremental reads of bucket files using per-file high-water marks.
+
+    For each file the state keeps mtime, size and the newest tweet date
+    seen, keyed by bucket and file stem so that switching between a JSON
+    file and its NDJSON copy keeps the mark. Unchanged files are skipped without being opened; changed files
+    surface only tweets newer than their mark. poll() stages new marks and
+    commit() persists them once downstream work has succeeded, so a failed
+    cycle sees the same tweets again next time.
+
+    A mark moves past every tweet it surfaced, so tweets a pass did not get
+    to (over its quota, or stopped early) are handed back with carry() and
+    kept in a per-bucket backlog; take_backlog() returns them on the next
+    incremental read until they are handled or leave the bucket window.
+    """
+
+    def __init__(self, state_file: Path = INGEST_STATE_FILE, backlog_file: Path = INGEST_BACKLOG_FILE):
+        self.state_file = state_file
+        self.backlog_file = backlog_file
+        self.lock = FileLock(state_file.with_name(state_file.name + ".lock"))
+        self.marks: Dict[str, Dict] = self._migrate(self._load())
+        self._staged: Dict[str, Dict] = {}
+        self._carried: Dict[str, List[Dict]] = {}
+        self._staged_lock = threading.Lock()  # poll() runs on loader threads
+        self.stats = {"skipped": 0, "read": 0, "new_tweets": 0, "backlog": 0}
+
+    def _load(self, path: Optional[Path] = None) -> Dict:
+        try:
+            with open(path or self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def take_backlog(self, bucket: str) -> List[Dict]:
+        """Tweets of a bucket an earlier committed pass surfaced but did not handle.
+
+        The next commit() covering the bucket replaces its backlog with what
+        was carry()'d since, so call this once per pass.
+        """
+        tweets = self._load(self.backlog_file).get(bucket, [])
+        with self._staged_lock:
+            self._carried[bucket] = []
+            self.stats["backlog"] += len(tweets)
+        return tweets
+
+    def carry(self, tweets: List[Dict]):
+        """Keep tweets that were surfaced but not handled for the next pass (persisted by commit)."""
+        with self._staged_lock:
+            for t in tweets:
+                self._carried.setdefault(t.get('bucket', ''), []).append(t)
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        """'<bucket>/<handle>-tweets': the same mark whether the JSON or its NDJSON copy is read."""
+        return f"{file_path.parent.name}/{file_path.stem}"
+
+    @classmethod
+    def _migrate(cls, marks: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Re-key marks saved under file paths (buckets/<bucket>/<file>.json) by bucket and stem."""
+        migrated: Dict[str, Dict] = {}
+        for key, mark in marks.items():
+            new_key = cls._key(Path(key)) if Path(key).suffix in (".json", ".ndjson") else key
+            current = migrated.get(new_key)
+            if (current and current.get("newest") and mark.get("newest")
+                    and parse_tweet_date(current["newest"]) >= parse_tweet_date(mark["newest"])):
+                continue
+            migrated[new_key] = mark
+        return migrated
+
+    def poll(self, file_path: Path) -> List[Dict]:
+        """Tweets in file_path newer than its high-water mark ([] if the file is unchanged)."""
+        key = self._key(file_path)
+        st = file_path.stat()
+        with self._staged_lock:
+            mark = self._staged.get(key) or self.marks.get(key)
+            if mark and mark["mtime_ns"] == st.st_mtime_ns and mark["size"] == st.st_size:
+                self.stats["skipped"] += 1
+                return []
+
+        newest = parse_tweet_date(mark["newest"]) if mark and mark.get("newest") else None
+        newest_ms = tweet_epoch_ms({"date": mark["newest"]}) if newest else None
+        # Sorted NDJSON stops reading at the mark
+        fresh = TweetTimeIndex(stream_bucket_tweets(file_path, stop_at=newest)).window(after_ms=newest_ms)
+        latest = fresh[0] if fresh else None
+        latest = parse_tweet_date(latest['date']) if latest else newest
+
+        with self._staged_lock:
+            self._staged[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size,
+                                 "newest": latest.isoformat() if latest else None}
+            self.stats["read"] += 1
+            self.stats["new_tweets"] += len(fresh)
+        return fresh
+
+    def commit(self, buckets: Optional[List[str]] = None):
+        """Persist staged marks and carried backlogs, merging with other processes' marks.
+
+        `buckets` limits the commit to those buckets' files, so one bucket's
+        pass doesn't commit marks another pass is still working on.
+        """
+        with self._staged_lock:
+            staged = {k: m for k, m in self._staged.items()
+                      if buckets is None or Path(k).parent.name in buckets}
+            carried = {b: list(ts) for b, ts in self._carried.items() if buckets is None or b in buckets}
+        if not staged and not carried:
+            return
+        with self.lock:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            if staged:
+                marks = self._migrate(self._load())
+                for key, mark in staged.items():
+                    current = marks.get(key)
+                    if (current and current.get("newest") and mark.get("newest")
+                            and parse_tweet_date(current["newest"]) > parse_tweet_date(mark["newest"])):
+                        continue  # another process already ingested further
+                    marks[key] = mark
+                atomic_write_json(self.state_file, marks)
+                self.marks = marks
+            if carried:
+                backlog = self._load(self.backlog_file)
+                backlog.update(carried)
+                atomic_write_json(self.backlog_file, {b: ts for b, ts in backlog.items() if ts}, indent=None)
+            with self._staged_lock:
+                for key in staged:
+                    if self._staged.get(key) is staged[key]:
+                        del self._staged[key]
+                for bucket in carried:
+                    self._carried.pop(bucket, None)
+
+    def reset(self):
+        """Forget all marks (the next poll rereads every file)."""
+        self.marks, self._staged, self._carried = {}, {}, {}
+
+
+class ScalableBloomFilter:
+    """Bloom filter that adds a bigger slice whenever the current one is full.
+
+    Slice i holds initial_capacity * GROWTH**i items at error_rate * RATIO**i,
+    so the false-positive rate stays under error_rate / (1 - RATIO) however
+    many items are added. Items are 16-byte digests (double hashing).
+    """
+
+    GROWTH = 2
+    RATIO = 0.5
+
+    def __init__(self, initial_capacity: int = 10000, error_rate: float = 0.0005):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.slices: List[Dict] = []
+
+    def _new_slice(self) -> Dict:
+        i = len(self.slices)
+        capacity = self.initial_capacity * self.GROWTH ** i
+        error = self.error_rate * self.RATIO ** i
+        bits = math.ceil(-capacity * math.log(error) / math.log(2) ** 2)
+        return {"capacity": capacity, "bits": bits, "hashes": max(1, round(bits / capacity * math.log(2))),
+                "count": 0, "data": bytearray((bits + 7) // 8)}
+
+    @staticmethod
+    def _positions(digest: bytes, bits: int, hashes: int):
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        return [(h1 + i * h2) % bits for i in range(hashes)]
+
+    def __contains__(self, digest: bytes) -> bool:
+        for sl in self.slices:
+            data = sl["data"]
+            if all(data[p >> 3] & (1 << (p & 7)) for p in self._positions(digest, sl["bits"], sl["hashes"])):
+                return True
+        return False
+
+    def add(self, digest: bytes):
+        if digest in self:
+            return
+        if not self.slices or self.slices[-1]["count"] >= self.slices[-1]["capacity"]:
+            self.slices.append(self._new_slice())
+        sl = self.slices[-1]
+        for p in self._positions(digest, sl["bits"], sl["hashes"]):
+            sl["data"][p >> 3] |= 1 << (p & 7)
+        sl["count"] += 1
+
+    def merge(self, other: 'ScalableBloomFilter'):
+        """OR in another filter built with the same parameters (e.g. by another process)."""
+        for i, theirs in enumerate(other.slices):
+            if i >= len(self.slices):
+                self.slices.append({**theirs, "data": bytearray(theirs["data"])})
+                continue
+            mine = self.slices[i]
+            mine["data"] = bytearray(a | b for a, b in zip(mine["data"], theirs["data"]))
+            mine["count"] = max(mine["count"], theirs["count"])
+
+    def to_dict(self) -> Dict:
+        import base64
+
+        return {"initial_capacity": self.initial_capacity, "error_rate": self.error_rate,
+                "slices": [{**sl, "data": base64.b64encode(bytes(sl["data"])).decode("ascii")}
+                           for sl in self.slices]}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ScalableBloomFilter':
+        import base64
+
+        bloom = cls(data.get("initial_capacity", 10000), data.get("error_rate", 0.0005))
+        bloom.slices = [{**sl, "data": bytearray(base64.b64decode(sl["data"]))} for sl in data.get("slices", [])]
+        return bloom
+
+
+class SeenTweets:
+    """Bucket tweets already handled (drafted, or dropped as near-duplicates).
+
+    Keyed by a hash of handle, date and normalized text: bucket tweet ids are
+    list positions ("MiddleEast_24-0") that shift with every scrape. Tweets
+    dated within the exact window (the longest bucket window plus
+    RECENT_MARGIN_HOURS) are answered from an exact set, so a candidate is
+    never lost to a Bloom false positive, and a normal pass never touches
+    the Bloom filter. Entries that age out of the window move into a
+    scalable Bloom filter, which only answers for older tweets: those only
+    come up when a window is widened (refresh --other-hours, a longer
+    windowHours) and would otherwise be drafted again. add() is in-memory;
+    checkpoint() merges with the files and writes them atomically; the
+    Bloom file is only rewritten when entries moved into it.
+    """
+
+    RECENT_MARGIN_HOURS = 6
+
+    def __init__(self, state_file: Path = SEEN_TWEETS_FILE, window_hours: float = 24):
+        self.state_file = state_file
+        self.bloom_file = state_file.with_name(state_file.stem + ".bloom.json")
+        self.recent_hours = window_hours + self.RECENT_MARGIN_HOURS
+        self.lock = FileLock(state_file.with_name(state_file.name + ".lock"))
+        self._mutex = threading.Lock()
+        self.recent, legacy_bloom = self._load()
+        self.bloom = self._load_bloom(legacy_bloom)
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}, None
+        return data.get("recent", {}), data.get("bloom")
+
+    def _load_bloom(self, legacy: Optional[Dict] = None) -> ScalableBloomFilter:
+        try:
+            with open(self.bloom_file, 'r', encoding='utf-8') as f:
+                return ScalableBloomFilter.from_dict(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            # Older state kept the filter inside the main file
+            return ScalableBloomFilter.from_dict(legacy) if legacy else ScalableBloomFilter()
+
+    @staticmethod
+    def key(tweet: Dict) -> bytes:
+        text = " ".join((tweet.get('text') or "").split()).lower()
+        raw = f"{(tweet.get('handle') or '').lower()}\n{tweet.get('date') or ''}\n{text}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+    def _horizon(self) -> datetime:
+        from datetime import timezone, timedelta
+        return datetime.now(timezone.utc) - timedelta(hours=self.recent_hours)
+
+    def __contains__(self, tweet: Dict) -> bool:
+        digest = self.key(tweet)
+        with self._mutex:
+            if digest.hex() in self.recent:
+                return True
+            ts = parse_tweet_date(tweet.get('date', ''))
+            if ts is None or ts >= self._horizon():
+                return False  # within the exact window: the set is authoritative
+            return digest in self.bloom
+
+    def add(self, tweet: Dict):
+        from datetime import timezone
+
+        digest = self.key(tweet)
+        ts = parse_tweet_date(tweet.get('date', ''))
+        with self._mutex:
+            # Undated tweets stay in the exact set for the window from now
+            self.recent[digest.hex()] = (ts or datetime.now(timezone.utc)).isoformat()
+            self._dirty = True
+
+    def checkpoint(self):
+        """Merge with the state on disk, move aged-out entries into the Bloom filter, write atomically."""
+        if not self._dirty:
+            return
+        with self.lock:
+            disk_recent, _ = self._load()
+            with self._mutex:
+                horizon = self._horizon()
+                recent = {**disk_recent, **self.recent}
+                aged = [k for k, d in recent.items() if (parse_tweet_date(d) or horizon) < horizon]
+                for k in aged:
+                    del recent[k]
+                self.recent = recent
+                data = {"recent": recent}
+                self._dirty = False
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            if aged:
+                bloom = self._load_bloom()
+                for k in aged:
+                    bloom.add(bytes.fromhex(k))
+                with self._mutex:
+                    bloom.merge(self.bloom)
+                    self.bloom = bloom
+                atomic_write_json(self.bloom_file, bloom.to_dict(), indent=None)
+            atomic_write_json(self.state_file, data, indent=None)
+
+
+class BucketWatcher:
+    """Blocks until bucket tweet files change.
+
+    Uses inotify on Linux (one watch per bucket directory, no extra
+    dependency); elsewhere, or if inotify can't be set up, it falls back to
+    comparing mtime/size of the *-tweets.json/.ndjson files every poll_interval
+    seconds. Bursts of writes are coalesced for `debounce` seconds.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+
+    def __init__(self, buckets_dir: Path = BUCKETS_DIR, poll_interval: float = 5.0, debounce: float = 1.0):
+        self.buckets_dir = buckets_dir
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._fd = None
+        self._watches: Dict[int, str] = {}
+        self._snapshot = self._scan()
+        self._setup_inotify()
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self._fd is not None else f"polling every {self.poll_interval:g}s"
+
+    def _setup_inotify(self):
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return
+            mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+            for bucket_dir in sorted(d for d in self.buckets_dir.glob("*") if d.is_dir()):
+                wd = libc.inotify_add_watch(fd, str(bucket_dir).encode(), mask)
+                if wd >= 0:
+                    self._watches[wd] = bucket_dir.name
+            if not self._watches:
+                os.close(fd)
+                return
+            self._fd = fd
+        except (OSError, AttributeError):
+            self._fd = None
+
+    def _scan(self) -> Dict[str, tuple]:
+        snapshot = {}
+        for path in self.buckets_dir.glob("*/*-tweets.*json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snapshot[str(path)] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def _read_events(self, timeout: Optional[float]) -> set:
+        import select
+        import struct
+
+        changed = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + 16 <= len(data):
+            wd, _, _, length = struct.unpack_from("iIII", data, offset)
+            name = data[offset + 16:offset + 16 + length].rstrip(b"\0").decode(errors="replace")
+            offset += 16 + length
+            if wd in self._watches and name.endswith(("-tweets.json", "-tweets.ndjson")):
+                changed.add(self._watches[wd])
+        return changed
+
+    def _poll(self) -> set:
+        snapshot = self._scan()
+        changed = {Path(p).parent.name for p in set(snapshot) | set(self._snapshot)
+                   if snapshot.get(p) != self._snapshot.get(p)}
+        self._snapshot = snapshot
+        return changed
+
+    def wait(self, timeout: Optional[float] = None) -> set:
+        """Names of buckets whose tweet files changed; empty set on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed = set()
+        while not changed:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return changed
+            if self._fd is not None:
+                changed = self._read_events(remaining)
+            else:
+                time.sleep(self.poll_interval if remaining is None else min(self.poll_interval, remaining))
+                changed = self._poll()
+
+        # Scrapers write several files per run; let the burst settle
+        settle = time.monotonic() + self.debounce
+        while time.monotonic() < settle:
+            if self._fd is not None:
+                changed |= self._read_events(settle - time.monotonic())
+            else:
+                time.sleep(settle - time.monotonic())
+                changed |= self._poll()
+        return changed
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class StageTimer:
+    """Accumulates wall time per named stage: `with timer("save"): ...`."""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()  # stages may run on several workers
+
+    def __call__(self, stage: str):
+        from contextlib import contextmanager
+
+        @contextmanager
+        def timed():
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.seconds[stage] = self.seconds.get(stage, 0.0) + elapsed
+        return timed()
+
+
+class DaemonMetrics:
+    """Thread-safe daemon counters and timings, rendered as Prometheus text.
+
+    Counters are cumulative; timings are summaries whose quantiles cover the
+    last WINDOW observations. Gauges (queue depth) and LLM latency are read
+    when scraped. serve() exposes GET /metrics on localhost.
+    """
+
+    WINDOW = 200
+    QUANTILES = (0.5, 0.9, 0.99)
+    HELP = {
+        "faytuks_cycle_seconds": ("summary", "Wall time of a daemon pass"),
+        "faytuks_stage_seconds": ("summary", "Wall time per pipeline stage within a pass"),
+        "faytuks_tweets_seen_total": ("counter", "Tweets surfaced by ingest within the bucket window"),
+        "faytuks_tweets_already_seen_total": ("counter", "Tweets skipped because an earlier pass handled them"),
+        "faytuks_tweets_new_total": ("counter", "Tweets left after near-duplicate filtering"),
+        "faytuks_admission_deferred_total": ("counter", "Candidates deferred because their bucket was over its watermark"),
+        "faytuks_admission_dropped_total": ("counter", "Deferred candidates dropped: the backlog was full or they left the window"),
+        "faytuks_tweets_carried_total": ("counter", "Candidates over the per-pass quota, carried to the next pass"),
+        "faytuks_drafts_created_total": ("counter", "Drafts created"),
+        "faytuks_errors_total": ("counter", "Daemon passes that raised"),
+        "faytuks_queue_depth": ("gauge", "Drafts waiting, by status"),
+        "faytuks_llm_latency_seconds": ("summary", "LLM call latency over the client's recent window"),
+    }
+
+    def __init__(self, draft_mgr: Optional['DraftManager'] = None, claude_client: 'ClaudeClient' = None):
+        self.draft_mgr = draft_mgr
+        self.claude = claude_client
+        self._lock = threading.Lock()
+        self._counters: Dict[tuple, float] = {}
+        self._summaries: Dict[tuple, Dict] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> tuple:
+        return (name, tuple(sorted(labels.items())))
+
+    def inc(self, name: str, value: float = 1, **labels):
+        with self._lock:
+            key = self._key(name, labels)
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels):
+        with self._lock:
+            summary = self._summaries.setdefault(
+                self._key(name, labels), {"window": deque(maxlen=self.WINDOW), "sum": 0.0, "count": 0})
+            summary["window"].append(seconds)
+            summary["sum"] += seconds
+            summary["count"] += 1
+
+    def observe_pass(self, bucket: str, seconds: float, stages: Dict[str, float], error: bool = False):
+        """Record one daemon pass: its duration, stage timings and whether it failed."""
+        self.observe("faytuks_cycle_seconds", seconds, bucket=bucket)
+        for stage, stage_seconds in stages.items():
+            self.observe("faytuks_stage_seconds", stage_seconds, bucket=bucket, stage=stage)
+        if error:
+            self.inc("faytuks_errors_total", bucket=bucket)
+
+    @staticmethod
+    def _line(name: str, labels: tuple, value: float) -> str:
+        label_text = ",".join(f'{k}="{str(v).replace(chr(34), chr(39))}"' for k, v in labels)
+        return f"{name}{{{label_text}}} {value:.6g}" if label_text else f"{name} {value:.6g}"
+
+    def _summary_lines(self, name: str, labels: tuple, window, total: float, count: int) -> List[str]:
+        values = list(window)
+        lines = [self._line(name, labels + (("quantile", str(q)),), percentile(values, q * 100))
+                 for q in self.QUANTILES]
+        lines.append(self._line(f"{name}_sum", labels, total))
+        lines.append(self._line(f"{name}_count", labels, count))
+        return lines
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        series: Dict[str, List[str]] = {name: [] for name in self.HELP}
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                series[name].append(self._line(name, labels, value))
+            for (name, labels), summary in sorted(self._summaries.items()):
+                series[name].extend(self._summary_lines(
+                    name, labels, summary["window"], summary["sum"], summary["count"]))
+
+        if self.draft_mgr is not None:
+            for status in ("pending", "approved"):
+                series["faytuks_queue_depth"].append(
+                    self._line("faytuks_queue_depth", (("status", status),), self.draft_mgr.count(status)))
+        if self.claude is not None:
+            for (task, model), samples in sorted(self.claude.latency_samples().items()):
+                series["faytuks_llm_latency_seconds"].extend(self._summary_lines(
+                    "faytuks_llm_latency_seconds", (("model", model), ("task", task)),
+                    samples, sum(samples), len(samples)))
+
+        out = []
+        for name, lines in series.items():
+            kind, help_text = self.HELP[name]
+            out += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"] + lines
+        return "\n".join(out) + "\n"
+
+    def serve(self, port: int, host: str = "127.0.0.1"):
+        """Serve GET /metrics from a background thread; returns the server."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes every few seconds would drown the daemon's output
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+        return server
+
+
+class FaytuksDaemon:
+    """Continuous operation daemon for tweet generation and posting."""
+
+    LOAD_WORKERS = 8
+    # Seconds before the shared near-duplicate index is rebuilt from the drafts on disk
+    DEDUP_REFRESH = 300
+
+    def __init__(self, knowledge_base: 'KnowledgeBase'):
+        self.kb = knowledge_base
+        self.enricher = TweetEnricher(knowledge_base)
+        self.draft_mgr = DraftManager()
+        self.ingestor = BucketIngestor()
+        # Exact seen-set window: the longest a bucket looks back
+        windows = [*self.BUCKET_WINDOWS.values(), *(c["window"] for c in load_bucket_schedule().values())]
+        self.seen = SeenTweets(window_hours=max(windows))
+        self.load_timings: Dict[str, float] = {}
+        self.metrics = DaemonMetrics(self.draft_mgr)
+        self.running = False
+        # Graceful shutdown: stopping drains in-flight passes, aborting hands their work back
+        self.stopping = threading.Event()
+        self.aborting = threading.Event()
+        self.checkpoint_file = DAEMON_CHECKPOINT_FILE
+        self._checkpoint_lock = threading.Lock()
+        self.pending_jobs: List[Dict] = []
+        self._resumed_jobs: List[Dict] = []  # taken by passes still running; checkpointed with pending
+        self.last_pass: Dict[str, float] = {}
+        self.admission = AdmissionController(load_admission_limits())
+        self.deferred: Dict[str, List[Dict]] = {}
+        self._priority_queue: Optional[PostingQueue] = None
+        # One near-duplicate index for all bucket passes, which run concurrently
+        self._dedup: Optional[NearDuplicateIndex] = None
+        self._dedup_built = 0.0
+        self._dedup_claims: Dict[str, str] = {}  # tweet key -> text, claimed by passes still running
+        self._dedup_lock = threading.Lock()
+        self.load_checkpoint()
+
+    def load_checkpoint(self):
+        """Restore pending pipeline jobs and last pass times saved by checkpoint()."""
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.pending_jobs = data.get("pending", [])
+        self.last_pass = data.get("last_pass", {})
+        self.deferred = data.get("deferred", {})
+        self.admission.closed = set(data.get("admission_closed", []))
+
+    def checkpoint(self):
+        """Persist daemon state: seen tweets, pending jobs and per-bucket last pass times.
+
+        Ingest marks (the per-file cursors) are committed by each completed pass.
+        """
+        self.seen.checkpoint()
+        with self._checkpoint_lock:
+            data = {"saved_at": datetime.now().isoformat(),
+                    "pending": list(self.pending_jobs) + list(self._resumed_jobs),
+                    "last_pass": dict(self.last_pass), "deferred": dict(self.deferred),
+                    "admission_closed": sorted(self.admission.closed)}
+        self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self.checkpoint_file, data)
+
+    def scrape_buckets(self, windows: Dict[str, float], incremental: bool = True) -> Dict[str, List[Dict]]:
+        """Recent tweets for several buckets at once: {bucket: max_age_hours} -> {bucket: tweets}.
+
+        Every account file of every requested bucket is loaded concurrently;
+        per-file load times end up in self.load_timings. A JSON file re-scraped
+        since its last conversion is converted to NDJSON first, so only that
+        read loads it whole. Incremental (default):
+        only tweets not surfaced by an earlier, committed call, plus the
+        backlog that call carried, and unchanged files are not opened. Hand
+        unhandled tweets to self.ingestor.carry(), then call
+        self.ingestor.commit().
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from datetime import timezone, timedelta
+
+        bucket_files = discover_bucket_files()
+        now = datetime.now(timezone.utc)
+        jobs = [(bucket, handle, path) for bucket in windows for handle, path in bucket_files.get(bucket, [])]
+
+        cutoffs = {bucket: int((now - timedelta(hours=hours)).timestamp() * 1000)
+                   for bucket, hours in windows.items()}
+
+        def load(job):
+            bucket, handle, file_path = job
+            start = time.perf_counter()
+            try:
+                if file_path.suffix == ".json":
+                    file_path = convert_bucket_file(file_path)
+                if incremental:
+                    tweets = self.ingestor.poll(file_path)  # newest first
+                    # Both newest first: stop at the first tweet outside the window
+                    tweets = tweets[:next((i for i, t in enumerate(tweets)
+                                           if t['epoch_ms'] <= cutoffs[bucket]), len(tweets))]
+                else:
+                    cutoff = datetime.fromtimestamp(cutoffs[bucket] / 1000, timezone.utc)
+                    tweets = TweetTimeIndex(stream_bucket_tweets(file_path, stop_at=cutoff)).window(
+                        after_ms=cutoffs[bucket])
+            except (OSError, json.JSONDecodeError, BucketFileError) as e:
+                print(f"Warning: skipping {file_path.name}: {e}", file=sys.stderr)
+                tweets = []
+            return job, tweets, (time.perf_counter() - start) * 1000
+
+        per_file: Dict[str, List[List[Dict]]] = {bucket: [] for bucket in windows}
+        timings = {}
+        with ThreadPoolExecutor(max_workers=min(self.LOAD_WORKERS, len(jobs) or 1)) as pool:
+            for (bucket, handle, file_path), tweets, ms in pool.map(load, jobs):
+                timings[f"{bucket}/{file_path.name}"] = ms
+                kept = []
+                for t in tweets:
+                    if not t.get('isRetweet', False):
+                        t['bucket'] = bucket
+                        t['handle'] = handle
+                        kept.append(t)
+                per_file[bucket].append(kept)
+        if incremental:
+            for bucket in windows:
+                backlog = []
+                for t in self.ingestor.take_backlog(bucket):
+                    ms = tweet_epoch_ms(t)
+                    if ms is not None and ms > cutoffs[bucket]:
+                        t['epoch_ms'] = ms
+                        backlog.append(t)
+                per_file[bucket].append(sorted(backlog, key=lambda t: t['epoch_ms'], reverse=True))
+
+        self.load_timings = timings
+        # Each file's window is already newest first; merge rather than re-sort
+        return {bucket: list(heapq.merge(*lists, key=lambda t: t['epoch_ms'], reverse=True))
+                for bucket, lists in per_file.items()}
+
+    def scrape_recent_tweets(self, bucket: str, max_age_hours: float, incremental: bool = True) -> List[Dict]:
+        """Get recent tweets from a bucket (see scrape_buckets)."""
+        return self.scrape_buckets({bucket: max_age_hours}, incremental)[bucket]
+
+    def candidate_priority(self, tweet: Dict) -> float:
+        """Posting-queue priority key a draft made from this tweet would get."""
+        if self._priority_queue is None:
+            self._priority_queue = PostingQueue(self.kb.get_source_tiers())
+        ts = parse_tweet_date(tweet.get('date', ''))
+        return self._priority_queue.key({
+            "sources": [f"@{tweet.get('handle', '')}", tweet.get('bucket', '')],
+            "created_at": ts.astimezone().replace(tzinfo=None).isoformat() if ts else "",
+        })
+
+    def admission_allowance(self, buckets) -> Dict[str, int]:
+        """Drafts each watermarked bucket may add this pass, given its pending depth."""
+        limited = [b for b in buckets if b in self.admission.limits]
+        if not limited:
+            return {}
+        depths = self.draft_mgr.bucket_counts("pending")
+        return {b: self.admission.allowance(b, depths.get(b, 0)) for b in limited}
+
+    def filter_new(self, tweets: List[Dict], dedup: NearDuplicateIndex) -> List[Dict]:
+        """Drop tweets that near-duplicate a recent draft, a posted tweet or each other."""
+        fresh = []
+        for t in tweets:
+            key = f"{t.get('handle', '')}/{t.get('id', len(dedup.signatures))}"
+            if dedup.check_and_add(key, t.get('text', '')) is None:
+                fresh.append(t)
+        return fresh
+
+    def claim_story(self, tweet: Dict) -> bool:
+        """Claim a candidate unless it near-duplicates a recent draft, a posted tweet or
+        a tweet another pass (of any bucket) has claimed. Release with release_stories().
+
+        The shared index is rebuilt from the drafts every DEDUP_REFRESH seconds
+        (so drafts from other processes are seen within that time); claims of
+        passes still running carry over into the rebuilt index.
+        """
+        key = SeenTweets.key(tweet).hex()
+        text = tweet.get('text', '')
+        with self._dedup_lock:
+            if self._dedup is None or time.monotonic() - self._dedup_built > self.DEDUP_REFRESH:
+                index = NearDuplicateIndex.from_drafts(self.draft_mgr)
+                for claimed, claimed_text in self._dedup_claims.items():
+                    index.add(claimed, claimed_text)
+                self._dedup, self._dedup_built = index, time.monotonic()
+            duplicate = self._dedup.find(text)
+            if duplicate is not None and duplicate != key:
+                return False
+            if duplicate is None:
+                self._dedup.add(key, text)
+            self._dedup_claims[key] = text
+            return True
+
+    def release_stories(self, tweets: List[Dict], forget: bool = False):
+        """Drop a finished pass's claims (its drafts are on disk for the next rebuild).
+
+        forget=True also takes the tweets out of the index, for claims that
+        won't become drafts (deferred by admission control).
+        """
+        with self._dedup_lock:
+            for tweet in tweets:
+                key = SeenTweets.key(tweet).hex()
+                self._dedup_claims.pop(key, None)
+                if forget and self._dedup is not None:
+                    self._dedup.remove(key)
+
+    # Breaking: < 10 minutes (immediate); Commentary & Geopolitics: < 24 hours
+    BUCKET_WINDOWS = {"breaking": 0.17, "commentary": 24, "geopolitics": 24}
+
+    def generate_drafts_from_buckets(self, claude_client: 'ClaudeClient' = None,
+                                     buckets: Optional[List[str]] = None,
+                                     windows: Optional[Dict[str, float]] = None,
+                                     stages: Optional[StageTimer] = None,
+                                     report: Optional[Dict] = None) -> List[str]:
+        """Generate drafts from recent bucket tweets (all buckets, or only `buckets`).
+
+        `windows` overrides BUCKET_WINDOWS (max tweet age in hours) per bucket.
+        Stage timings of the pass are added to `stages` and admission
+        deferrals ({bucket: {deferred, new, dropped}}) to `report` when given.
+        """
+        windows = {b: (windows or {}).get(b, h) for b, h in self.BUCKET_WINDOWS.items()
+                   if buckets is None or b in buckets}
+        with self._checkpoint_lock:
+            taken = [j for j in self.pending_jobs if j["tweet"].get('bucket') in windows]
+            self.pending_jobs = [j for j in self.pending_jobs if j not in taken]
+            # Jobs whose draft was saved before the interruption are done
+            resume = [j for j in taken if j["tweet"] not in self.seen]
+            self._resumed_jobs += resume
+            offered = [t for b in windows for t in self.deferred.get(b, [])]
+        allowance = self.admission_allowance(windows)
+        pipeline = DraftPipeline(self, claude_client, stages, resume, allowance, offered)
+        try:
+            created = pipeline.run(windows)
+        finally:
+            with self._checkpoint_lock:
+                resumed_ids = {id(j) for j in resume}
+                self._resumed_jobs = [j for j in self._resumed_jobs if id(j) not in resumed_ids]
+                # After a failure, re-queue only the resumed jobs this pass did not save
+                self.pending_jobs += (pipeline.pending if not pipeline._errors
+                                      else [j for j in resume if j["tweet"] not in self.seen])
+        if report is not None:
+            report["deferred"] = self._record_deferrals(windows, allowance, offered, pipeline)
+        else:
+            self._record_deferrals(windows, allowance, offered, pipeline)
+        carried = {b: sum(1 for t in pipeline.unreached if t.get('bucket') == b) for b in windows}
+        for bucket, n in carried.items():
+            self.metrics.inc("faytuks_tweets_carried_total", n, bucket=bucket)
+        if report is not None:
+            report["backlog"] = carried
+
+        if not pipeline.interrupted:
+            # Drafts are saved; the next cycle only needs tweets newer than these,
+            # plus those this pass did not get to
+            self.ingestor.carry(pipeline.unreached)
+            self.ingestor.commit(list(windows))
+            with self._checkpoint_lock:
+                self.last_pass.update({b: time.time() for b in windows})
+        self.checkpoint()
+        return created
+
+    def _record_deferrals(self, windows, allowance: Dict[str, int], offered: List[Dict],
+                          pipeline: 'DraftPipeline') -> Dict[str, Dict[str, int]]:
+        """Keep the best deferred candidates per bucket.
+
+        Earlier deferrals this pass never reached (it stopped early, or the
+        quota ran out first) stay deferred. Returns {bucket: {"deferred":
+        backlog size, "new": newly deferred, "dropped": over the limit or out
+        of the window}}.
+        """
+        from datetime import timezone, timedelta
+
+        now = datetime.now(timezone.utc)
+        report = {}
+        for bucket in set(allowance) | {t.get('bucket') for t in offered}:
+            cutoff = int((now - timedelta(hours=windows.get(bucket, 0))).timestamp() * 1000)
+            unreached = [t for t in offered if t.get('bucket') == bucket
+                         and id(t) not in pipeline._reached and t not in self.seen]
+            current = [t for t in unreached if (tweet_epoch_ms(t) or 0) > cutoff]
+            expired = len(unreached) - len(current)
+            deferred_keys = {SeenTweets.key(t) for t in pipeline.deferred}
+            candidates = [t for t in pipeline.deferred if t.get('bucket') == bucket] + [
+                t for t in current if SeenTweets.key(t) not in deferred_keys]
+            candidates.sort(key=self.candidate_priority, reverse=True)
+            kept = candidates[:self.admission.DEFERRED_LIMIT]
+            previous = {SeenTweets.key(t) for t in offered if t.get('bucket') == bucket}
+            new = sum(1 for t in kept if SeenTweets.key(t) not in previous)
+            dropped = len(candidates) - len(kept) + expired
+            with self._checkpoint_lock:
+                self.deferred[bucket] = kept
+            report[bucket] = {"deferred": len(kept), "new": new, "dropped": dropped}
+            self.metrics.inc("faytuks_admission_deferred_total", new, bucket=bucket)
+            self.metrics.inc("faytuks_admission_dropped_total", dropped, bucket=bucket)
+        return report
+
+    def run_cycle(self, claude_client: 'ClaudeClient' = None, buckets: Optional[List[str]] = None,
+                  windows: Optional[Dict[str, float]] = None) -> Dict:
+        """Run one complete cycle: scrape → enrich → queue (optionally for some buckets only)."""
+        results = {
+            "timestamp": datetime.now().isoformat(),
+            "drafts_created": [],
+            "errors": []
+        }
+
+        stages = StageTimer()
+        report: Dict[str, Any] = {}
+        start = time.perf_counter()
+        try:
+            created = self.generate_drafts_from_buckets(claude_client, buckets, windows, stages, report)
+            results["drafts_created"] = created
+        except Exception as e:
+            results["errors"].append(str(e))
+
+        results["stages"] = stages.seconds
+        results["deferred"] = report.get("deferred", {})
+        results["backlog"] = report.get("backlog", {})
+        self.metrics.observe_pass(",".join(buckets) if buckets else "all", time.perf_counter() - start,
+                                  stages.seconds, error=bool(results["errors"]))
+        return results
+
+
+class DraftPipeline:
+    """One daemon pass as a stage pipeline: ingest → detect → translate → save.
+
+    Stages are connected by bounded queues, so a slow stage blocks the one
+    before it all the way back to ingestion, and throughput is set by the
+    slowest stage rather than the sum of all of them. Ingest and detect run
+    in one thread each (detect checks the daemon's shared near-duplicate index),
+    translation runs on an asyncio loop that batches breaking tweets into
+    bulk LLM calls, and saving uses a small thread pool.
+
+    Ingest reads all of the pass's files (in parallel) before it queues the
+    first candidate, because candidates are ordered across files: breaking
+    first, then each bucket newest first, or by posting priority in buckets
+    under admission control, so those over the bucket's allowance
+    (deferred, not drafted) are the lowest-priority ones. Detection, translation and saving overlap each
+    other, not the file reads. Once the per-pass quotas are filled, ingest
+    stops feeding detect; candidates detect never got to are listed in
+    `unreached` for the ingestor to carry to the next pass.
+
+    When daemon.stopping is set the pass drains: nothing new is ingested or
+    detected, but in-flight translations and saves finish. If daemon.aborting
+    follows, work not yet done is handed back in `pending` (jobs that can be
+    passed as `resume` to a later pipeline) instead of being carried out.
+    """
+
+    QUEUE_SIZE = 32
+    SAVE_WORKERS = 2
+    TRANSLATE_CONCURRENCY = 2
+    TRANSLATE_LINGER = 0.2  # seconds to wait for a fuller translation batch
+    # Drafts per pass: breaking are translated and auto-approved, the rest are English drafts.
+    # The scheduler runs one bucket per pass, so commentary and geopolitics each get
+    # OTHER_LIMIT per period; a pass over several buckets (run_cycle() without buckets) shares it.
+    BREAKING_LIMIT = 5
+    OTHER_LIMIT = 10
+
+    _DONE = object()
+
+    def __init__(self, daemon: 'FaytuksDaemon', claude_client: 'ClaudeClient' = None,
+                 stages: Optional[StageTimer] = None, resume: Optional[List[Dict]] = None,
+                 allowance: Optional[Dict[str, int]] = None, deferred: Optional[List[Dict]] = None):
+        self.daemon = daemon
+        self.claude = claude_client
+        self.stages = stages if stages is not None else StageTimer()
+        self.resume = resume or []
+        # Admission: drafts each bucket may still add, and earlier deferrals to offer again
+        self.allowance = dict(allowance or {})
+        self.offered_deferred = deferred or []
+        self.deferred: List[Dict] = []
+        self.candidates: List[Dict] = []
+        self._reached: set = set()  # ids of candidates detect decided on
+        self._claimed: List[Dict] = []  # stories claimed in the daemon's shared dedup index
+        self.created: List[str] = []
+        self.pending: List[Dict] = []
+        self.interrupted = False
+        self._created_lock = threading.Lock()
+        self._enough = threading.Event()  # quotas filled: stop feeding detect
+        self._failed = threading.Event()
+        self._errors: List[BaseException] = []
+
+    def _fail(self, error: BaseException):
+        self._errors.append(error)
+        self._failed.set()
+
+    def _put(self, q: 'queue.Queue', item) -> bool:
+        """Blocking put (backpressure) that gives up if another stage failed."""
+        import queue
+
+        while not self._failed.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _ingest(self, windows: Dict[str, float], out: 'queue.Queue'):
+        resumed = {SeenTweets.key(job["tweet"]) for job in self.resume}
+        try:
+            with self.stages("ingest"):
+                recent = self.daemon.scrape_buckets(windows)
+            for bucket, tweets in recent.items():
+                self.daemon.metrics.inc("faytuks_tweets_seen_total", len(tweets), bucket=bucket)
+                # Tweets handled by an earlier pass (or before a restart) go no further
+                fresh = [t for t in tweets if t not in self.daemon.seen and SeenTweets.key(t) not in resumed]
+                self.daemon.metrics.inc("faytuks_tweets_already_seen_total", len(tweets) - len(fresh), bucket=bucket)
+                if bucket in self.allowance or self.offered_deferred:
+                    fresh = self._with_deferred(bucket, fresh, windows[bucket])
+                recent[bucket] = fresh
+            # Breaking first, each bucket newest first: quotas are filled in arrival order
+            ordered = recent.get("breaking", []) + [
+                t for bucket, tweets in recent.items() if bucket != "breaking" for t in tweets]
+            self.candidates = ordered
+            for tweet in ordered:
+                if self._enough.is_set() or self.daemon.stopping.is_set() or not self._put(out, tweet):
+                    break
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            out.put(self._DONE)  # detect always drains to the end
+
+    def _with_deferred(self, bucket: str, tweets: List[Dict], window_hours: float) -> List[Dict]:
+        """Merge still-current earlier deferrals into a bucket's candidates, best first."""
+        from datetime import timezone, timedelta
+
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=window_hours)
+        keys = {SeenTweets.key(t) for t in tweets}
+        for tweet in self.offered_deferred:
+            if tweet.get('bucket') != bucket or SeenTweets.key(tweet) in keys or tweet in self.daemon.seen:
+                continue
+            if (parse_tweet_date(tweet.get('date', '')) or cutoff) > cutoff:
+                tweets.append(tweet)
+        return sorted(tweets, key=self.daemon.candidate_priority, reverse=True)
+
+    @property
+    def unreached(self) -> List[Dict]:
+        """New candidates detect never got to (over quota, or the pass stopped); not earlier deferrals."""
+        offered = {id(t) for t in self.offered_deferred}
+        return [t for t in self.candidates if id(t) not in self._reached and id(t) not in offered]
+
+    def _detect(self, inbox: 'queue.Queue', to_translate, save_q: 'queue.Queue'):
+        quota = {"breaking": self.BREAKING_LIMIT, "other": self.OTHER_LIMIT}
+        try:
+            while True:
+                tweet = inbox.get()
+                if tweet is self._DONE:
+                    return
+                kind = "breaking" if tweet.get('bucket') == "breaking" else "other"
+                if self._failed.is_set() or self.daemon.stopping.is_set() or not quota[kind]:
+                    continue  # keep draining so ingest never blocks
+                self._reached.add(id(tweet))
+                with self.stages("detect"):
+                    # Skip stories already drafted, posted or taken by a concurrent pass
+                    if not self.daemon.claim_story(tweet):
+                        self.daemon.seen.add(tweet)
+                        continue
+                    self._claimed.append(tweet)
+                    bucket = tweet.get('bucket', '')
+                    if self.allowance.get(bucket, 1) <= 0:
+                        self.deferred.append(tweet)  # over the bucket's watermark
+                        self._claimed.pop()
+                        self.daemon.release_stories([tweet], forget=True)
+                        continue
+                    if bucket in self.allowance:
+                        self.allowance[bucket] -= 1
+                    tweet['pattern'] = self.daemon.enricher.detect_pattern(tweet.get('text', ''))
+                quota[kind] -= 1
+                if not any(quota.values()):
+                    self._enough.set()
+                self.daemon.metrics.inc("faytuks_tweets_new_total", bucket=tweet.get('bucket', ''))
+                if kind == "breaking":
+                    to_translate(tweet)
+                else:
+                    self._put(save_q, (tweet, ""))
+        except BaseException as e:
+            self._fail(e)
+            while inbox.get() is not self._DONE:
+                pass
+        finally:
+            to_translate(self._DONE)
+
+    async def _translate(self, inbox: 'asyncio.Queue', save_q: 'queue.Queue'):
+        import asyncio
+
+        limit = asyncio.Semaphore(self.TRANSLATE_CONCURRENCY)
+        batch_size = self.daemon.enricher.BULK_TRANSLATION_SIZE
+
+        async def translate(batch):
+            async with limit:
+                if self.daemon.aborting.is_set():
+                    with self._created_lock:
+                        self.pending += [{"stage": "translate", "tweet": t} for t in batch]
+                    return
+                translations = [""] * len(batch)
+                if self.claude and not self._failed.is_set():
+                    with self.stages("translate"):
+                        translations = await asyncio.to_thread(
+                            self.daemon.enricher.translate_batch_to_persian,
+                            [t.get('text', '') for t in batch], self.claude)
+            for tweet, persian in zip(batch, translations):
+                await asyncio.to_thread(self._put, save_q, (tweet, persian))
+
+        tasks, done = [], False
+        while not done:
+            first = await inbox.get()
+            if first is self._DONE:
+                break
+            batch = [first]
+            while len(batch) < batch_size:
+                try:
+                    item = await asyncio.wait_for(inbox.get(), timeout=self.TRANSLATE_LINGER)
+                except asyncio.TimeoutError:
+                    break
+                if item is self._DONE:
+                    done = True
+                    break
+                batch.append(item)
+            tasks.append(asyncio.create_task(translate(batch)))
+        await asyncio.gather(*tasks)
+
+    def _save(self, inbox: 'queue.Queue'):
+        draft_mgr = self.daemon.draft_mgr
+        while True:
+            item = inbox.get()
+            if item is self._DONE:
+                return
+            if self._failed.is_set():
+                continue  # drain without writing more
+            tweet, persian_text = item
+            if self.daemon.aborting.is_set():
+                with self._created_lock:
+                    self.pending.append({"stage": "save", "tweet": tweet, "persian": persian_text})
+                continue
+            bucket = tweet.get('bucket', '')
+            try:
+                with self.stages("save"):
+                    if bucket == "breaking":
+                        # Auto-approve breaking tweets (created approved, so a crash can't strand them)
+                        location = draft_mgr.add_draft(
+                            english=tweet.get('text', ''),
+                            persian=persian_text,
+                            pattern=tweet.get('pattern') or "breaking",
+                            sources=[f"@{tweet.get('handle', 'unknown')}", "breaking"],
+                            status="approved"
+                        )["location"]
+                    else:
+                        # Other buckets are drafts (English only for now)
+                        location = draft_mgr.save_draft(
+                            english=tweet.get('text', ''),
+                            persian="",
+                            pattern=tweet.get('pattern') or "general",
+                            sources=[f"@{tweet.get('handle', 'unknown')}", bucket]
+                        )
+            except Exception as e:
+                self._fail(e)
+                continue
+            self.daemon.seen.add(tweet)
+            with self._created_lock:
+                self.created.append(location)
+            self.daemon.metrics.inc("faytuks_drafts_created_total", bucket=bucket)
+
+    def run(self, windows: Dict[str, float]) -> List[str]:
+        """Run the pass for {bucket: max_age_hours}; returns the created draft locations."""
+        import asyncio
+        import concurrent.futures
+        import queue
+
+        size = max(self.QUEUE_SIZE, len(self.resume))
+        detect_q: queue.Queue = queue.Queue(self.QUEUE_SIZE)
+        save_q: queue.Queue = queue.Queue(size)
+        loop = asyncio.new_event_loop()
+        translate_q: asyncio.Queue = asyncio.Queue(size)
+
+        def to_translate(item):
+            future = asyncio.run_coroutine_threadsafe(translate_q.put(item), loop)
+            if item is self._DONE:
+                return  # delivered as soon as there is room
+            while not self._failed.is_set():
+                try:
+                    return future.result(timeout=0.1)  # backpressure onto detect
+                except concurrent.futures.TimeoutError:
+                    continue
+
+        # Jobs left over from an interrupted pass go first
+        for job in self.resume:
+            if job["stage"] == "save":
+                save_q.put((job["tweet"], job.get("persian", "")))
+            else:
+                translate_q.put_nowait(job["tweet"])
+
+        threads = [threading.Thread(target=self._ingest, args=(windows, detect_q), name="pipeline-ingest",
+                                    daemon=True),
+                   threading.Thread(target=self._detect, args=(detect_q, to_translate, save_q),
+                                    name="pipeline-detect", daemon=True)]
+        threads += [threading.Thread(target=self._save, args=(save_q,), name=f"pipeline-save-{i}", daemon=True)
+                    for i in range(self.SAVE_WORKERS)]
+        for thread in threads:
+            thread.start()
+        try:
+            # The asyncio translate stage runs on the calling thread
+            loop.run_until_complete(self._translate(translate_q, save_q))
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            for _ in range(self.SAVE_WORKERS):
+                save_q.put(self._DONE)
+            for thread in threads:
+                thread.join()
+            loop.close()
+            self.daemon.release_stories(self._claimed)
+
+        if self._errors:
+            raise self._errors[0]
+        self.interrupted = self.daemon.stopping.is_set()
+        return self.created
+
+
+class BucketScheduler:
+    """Runs each bucket on its own cadence: one asyncio task per bucket.
+
+    Passes run in worker threads, so a slow commentary pass never delays a
+    breaking one. A bucket never overlaps itself: if a pass outlasts its
+    period the missed ticks are dropped (counted in `overruns`) and the
+    next pass starts right away. A BucketWatcher, if given, wakes the
+    breaking task early when its files change. After a restart each bucket
+    waits out the rest of its period from daemon.last_pass. request_stop()
+    lets in-flight passes finish and starts no new ones; abort() stops
+    waiting for them (they run in daemon threads, see `in_flight`).
+    """
+
+    ABORT_GRACE = 1.0  # seconds aborting passes get to hand back their work
+
+    def __init__(self, daemon: 'FaytuksDaemon', schedule: Dict[str, Dict[str, float]],
+                 claude_client: 'ClaudeClient' = None, watcher: Optional['BucketWatcher'] = None,
+                 on_pass=None):
+        self.daemon = daemon
+        self.schedule = schedule
+        self.claude = claude_client
+        self.watcher = watcher
+        self.on_pass = on_pass  # called with (bucket, results, seconds) after each pass
+        self.overruns = {bucket: 0 for bucket in schedule}
+        self._wake: Dict[str, 'asyncio.Event'] = {}
+        self._tasks: List['asyncio.Task'] = []
+        self._stopping = False
+        self._aborted = False
+        self.in_flight: set = set()  # buckets with a pass running
+
+    async def _run_pass(self, bucket: str, window: float) -> Dict:
+        """run_cycle for one bucket in a daemon thread, so an abandoned pass can't hold up exit."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def deliver(setter, value):
+            if not future.done():
+                setter(value)
+
+        def work():
+            try:
+                outcome = (future.set_result, self.daemon.run_cycle(self.claude, [bucket], {bucket: window}))
+            except BaseException as e:
+                outcome = (future.set_exception, e)
+            finally:
+                self.in_flight.discard(bucket)
+            try:
+                loop.call_soon_threadsafe(deliver, *outcome)
+            except RuntimeError:
+                pass  # the loop is gone: the pass was abandoned
+
+        self.in_flight.add(bucket)
+        threading.Thread(target=work, name=f"pass-{bucket}", daemon=True).start()
+        return await future
+
+    def request_stop(self):
+        """Finish in-flight passes, then return from run(). Call on the event loop."""
+        self._stopping = True
+        self.daemon.stopping.set()
+        for wake in self._wake.values():
+            wake.set()
+
+    def abort(self):
+        """Tell passes to hand back their work, and return from run() after ABORT_GRACE
+        even if some are still blocked (e.g. in an LLM call). Call on the event loop."""
+        import asyncio
+
+        self.request_stop()
+        self.daemon.aborting.set()
+
+        def cancel():
+            self._aborted = True
+            for task in self._tasks:
+                task.cancel()
+
+        asyncio.get_running_loop().call_later(self.ABORT_GRACE, cancel)
+
+    async def _bucket_loop(self, bucket: str, cfg: Dict[str, float]):
+        import asyncio
+        import random
+
+        loop = asyncio.get_running_loop()
+        wake = self._wake[bucket]
+        # Resume the cadence from the last completed pass; stagger startup by the jitter
+        since_last = time.time() - self.daemon.last_pass.get(bucket, 0)
+        delay = max(0.0, cfg["period"] - since_last) + random.uniform(0, cfg["jitter"])
+        try:
+            await asyncio.wait_for(wake.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        next_due = loop.time()
+        while not self._stopping:
+            wake.clear()
+            started = loop.time()
+            results = await self._run_pass(bucket, cfg["window"])
+            finished = loop.time()
+            if self.on_pass:
+                self.on_pass(bucket, results, finished - started)
+
+            next_due += cfg["period"]
+            if next_due < finished:
+                missed = int((finished - next_due) // cfg["period"]) + 1
+                self.overruns[bucket] += missed
+                next_due += missed * cfg["period"]
+            delay = max(0.0, next_due - finished) + random.uniform(0, cfg["jitter"])
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _watch_loop(self):
+        import asyncio
+
+        while not self._stopping:
+            changed = await asyncio.to_thread(self.watcher.wait, 1.0)
+            for bucket in changed & {"breaking"}:
+                if bucket in self._wake:
+                    self._wake[bucket].set()
+
+    async def run(self):
+        import asyncio
+
+        self._wake = {bucket: asyncio.Event() for bucket in self.schedule}
+        tasks = [asyncio.create_task(self._bucket_loop(bucket, cfg), name=bucket)
+                 for bucket, cfg in self.schedule.items()]
+        if self.watcher:
+            tasks.append(asyncio.create_task(self._watch_loop(), name="watcher"))
+        self._tasks = tasks
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            if not self._aborted:
+                raise
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def normalize_draft_id(draft_id: str) -> str:
+    """Accept 'draft_<id>', '<id>.json' or a bare id and return the bare id."""
+    draft_id = Path(str(draft_id)).name
+    if draft_id.endswith(".json"):
+        draft_id = draft_id[:-5]
+    if draft_id.startswith("draft_"):
+        draft_id = draft_id[len("draft_"):]
+    return draft_id
+
+
+def tweet_id_from_url(tweet_url: Optional[str]) -> Optional[str]:
+    """Extract the status id from a tweet URL (x.com or twitter.com), if present."""
+    match = re.search(r"/status(?:es)?/(\d+)", tweet_url or "")
+    return match.group(1) if match else None
+
+
+CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+class UlidGenerator:
+    """Monotonic ULIDs: 48-bit millisecond timestamp + 80 random bits, Crockford base32.
+
+    Ids sort by creation time, and ids minted in the same millisecond
+    increment the random part so they stay unique and ordered.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_rand = 0
+
+    def new(self) -> str:
+        with self._lock:
+            ms = int(time.time() * 1000)
+            if ms <= self._last_ms:
+                ms, rand = self._last_ms, self._last_rand + 1
+                if rand >> 80:
+                    ms, rand = ms + 1, int.from_bytes(os.urandom(10), "big")
+            else:
+                rand = int.from_bytes(os.urandom(10), "big")
+            self._last_ms, self._last_rand = ms, rand
+        value = (ms << 80) | rand
+        return "".join(CROCKFORD_BASE32[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+
+_draft_ids = UlidGenerator()
+
+
+def new_draft_id() -> str:
+    """Sortable, collision-free draft id (ULID)."""
+    return _draft_ids.new()
+
+
+def resolve_draft_id(draft_id: str, candidates) -> Optional[str]:
+    """Exact id, else the single id starting with (or, for legacy ids, containing)
+    draft_id. Returns None if nothing or more than one id matches."""
+    if draft_id in candidates:
+        return draft_id
+    matches = [c for c in candidates if c.startswith(draft_id)]
+    if not matches:
+        matches = [c for c in candidates if draft_id in c]
+    return matches[0] if len(matches) == 1 else None
+
+
+DRAFT_STATUSES = ("pending", "approved", "posted")
 
-        downloaded = []
-        tweet_url = f"https://x.com/{handle}/status/{tweet_id}"
 
-        # Try gallery-dl first (better for images)
-        try:
-            result = subprocess.run(
-                ["gallery-dl", "--dest", str(media_dir), tweet_url],
-                capture_output=True, text=True, timeout=30
-            )
-            if result.returncode == 0:
-                # Find downloaded files
-                for f in media_dir.glob(f"*{tweet_id}*"):
-                    downloaded.append(str(f))
-                    print(f"  📷 Downloaded: {f.name}")
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+def draft_buckets(draft: Dict) -> List[str]:
+    """Source buckets of a draft: the non-@ entries of its `sources`."""
+    return [s for s in draft.get("sources", []) if s and not s.startswith("@")]
 
-        # Fallback to yt-dlp for videos
-        if not downloaded:
-            try:
-                result = subprocess.run(
-                    ["yt-dlp", "-o", str(media_dir / f"{tweet_id}.%(ext)s"), tweet_url],
-                    capture_output=True, text=True, timeout=60
-                )
-                if result.returncode == 0:
-                    for f in media_dir.glob(f"{tweet_id}.*"):
-                        downloaded.append(str(f))
-                        print(f"  🎬 Downloaded: {f.name}")
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
+# Fields every store can return without opening the draft itself
+DRAFT_HEADER_FIELDS = ("id", "status", "pattern", "created_at", "posted_at", "sources")
+DRAFT_SORT_KEYS = ("created_at", "posted_at", "id", "pattern")
 
-        return downloaded
 
-    def enrich_draft(self, draft: Dict, claude_client: 'ClaudeClient' = None) -> Dict:
-        """Enrich a bucket-based draft with historical context."""
-        text = draft.get('english', '')
-        pattern = self.detect_pattern(text)
+def page_headers(headers, sort: str, descending: bool, limit: int, after: Optional[tuple]) -> List[Dict]:
+    """Keyset page over draft headers: the `limit` headers after the (sort value, id) key `after`.
 
-        if not pattern:
-            pattern = draft.get('pattern', 'massacre_escalation')
+    Uses a bounded heap, so a page costs O(n log limit) and never sorts everything.
+    """
+    def key(h):
+        return (h.get(sort) or "", str(h["id"]))
 
-        context = self.get_historical_context(pattern)
+    if after is not None:
+        headers = (h for h in headers if (key(h) < after if descending else key(h) > after))
+    pick = heapq.nlargest if descending else heapq.nsmallest
+    return pick(limit, headers, key=key)
 
-        enriched = {
-            **draft,
-            "detected_pattern": pattern,
-            "historical_context": {
-                "facts_count": len(context.get('facts', [])),
-                "era": context.get('era', {}).get('name') if context.get('era') else None
-            }
-        }
 
-        if claude_client:
-            prompt = self.generate_enrichment_prompt(text, context)
-            response = claude_client.generate(prompt)
-            enriched["supplemental_tweet"] = response
-            enriched["enrichment_prompt"] = prompt
+def project(draft: Dict, fields: Optional[tuple]) -> Dict:
+    return {k: draft.get(k) for k in fields} if fields else draft
 
-        return enriched
 
+class JsonDraftStore:
+    """Draft storage as one JSON file per draft in pending/, approved/ and posted/.
 
-class FaytuksDaemon:
-    """Continuous operation daemon for tweet generation and posting."""
+    An id -> location index keeps lookups, counts and pattern breakdowns off
+    the directories. Each write appends one delta line to drafts/index.log;
+    once the log holds as many deltas as the index has drafts (COMPACT_MIN at
+    least) it is folded into drafts/index.json and started afresh, so a write
+    costs O(1) amortised instead of a full index rewrite. A missing or stale
+    index is rebuilt from the directories once.
 
-    def __init__(self, knowledge_base: 'KnowledgeBase'):
-        self.kb = knowledge_base
-        self.enricher = TweetEnricher(knowledge_base)
-        self.draft_mgr = DraftManager()
-        self.running = False
+    Writers hold drafts/.lock (FileLock) for the whole find-modify-write and
+    every file is written atomically, so concurrent daemons, CLI commands
+    and posters neither lose updates nor leave half-written JSON.
+    """
 
-    def scrape_recent_tweets(self, bucket: str, max_age_hours: float) -> List[Dict]:
-        """Get recent tweets from a bucket."""
-        from datetime import timezone, timedelta
+    INDEX_FIELDS = ("pattern", "created_at", "posted_at", "sources")
+    COMPACT_MIN = 1000
 
-        bucket_files = {
-            "breaking": [Path(__file__).parent / "buckets/breaking/middleeast_24-tweets.json"],
-            "commentary": [
-                Path(__file__).parent / "buckets/commentary/__injaneb96-tweets.json",
-                Path(__file__).parent / "buckets/commentary/realneo101-tweets.json",
-            ],
-            "geopolitics": [
-                Path(__file__).parent / "buckets/geopolitics/jasonmbrodsky-tweets.json",
-                Path(__file__).parent / "buckets/geopolitics/ariaramesh-tweets.json",
-            ],
-        }
+    def __init__(self, drafts_dir: Path = DRAFTS_DIR):
+        self.drafts_dir = drafts_dir
+        self.dirs = {status: drafts_dir / status for status in DRAFT_STATUSES}
+        for d in self.dirs.values():
+            d.mkdir(parents=True, exist_ok=True)
+        self.index_file = drafts_dir / "index.json"
+        self.index_log = drafts_dir / "index.log"
+        self.lock = FileLock(drafts_dir / ".lock")
+        self._index: Dict[str, Dict] = {}
+        self._index_version = None
+        # Guards _index and the log position against this process's other threads
+        self._index_lock = threading.RLock()
+        self._log_ino = None
+        self._log_offset = 0
+        self._log_entries = 0
+        self._load_index()
+
+    def _read(self, path: Path) -> Dict:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write(self, path: Path, draft: Dict):
+        atomic_write_json(path, draft)
+
+    # --- id index ---
+
+    def _load_index(self):
+        """Catch up with index changes by any process; build the index if missing."""
+        if not self._catch_up():
+            self.rebuild_index()
+
+    def _catch_up(self) -> bool:
+        """Reload index.json if it was replaced, then apply new log deltas; False if unreadable."""
+        with self._index_lock:
+            try:
+                st = self.index_file.stat()
+            except FileNotFoundError:
+                return False
+            # index.json is replaced atomically, so a new inode or mtime means a new version
+            version = (st.st_ino, st.st_mtime_ns)
+            if version != self._index_version:
+                try:
+                    self._index = self._read(self.index_file)
+                except (OSError, json.JSONDecodeError):
+                    return False
+                self._index_version = version
+                self._log_ino = None
+            try:
+                f = open(self.index_log, 'rb')
+            except FileNotFoundError:
+                return True
+            with f:
+                ino = os.fstat(f.fileno()).st_ino
+                if ino != self._log_ino:
+                    # A fresh log after compaction; deltas already folded in replay harmlessly
+                    self._log_ino, self._log_offset, self._log_entries = ino, 0, 0
+                f.seek(self._log_offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # mid-append, or torn by a crash (the next writer truncates it)
+                    try:
+                        delta = json.loads(line)
+                    except json.JSONDecodeError:
+                        return False
+                    self._log_offset += len(line)
+                    self._log_entries += 1
+                    self._apply_delta(delta["id"], delta["entry"])
+            return True
 
-        now = datetime.now(timezone.utc)
-        cutoff = now - timedelta(hours=max_age_hours)
-        recent = []
+    def _apply_delta(self, index_id: str, entry: Optional[Dict]):
+        if entry is None:
+            self._index.pop(index_id, None)
+        else:
+            self._index[index_id] = entry
+
+    def _entries(self) -> List[tuple]:
+        """Current (id, entry) pairs, safe to iterate while other threads write."""
+        self._load_index()
+        with self._index_lock:
+            return list(self._index.items())
+
+    def _log_index(self, index_id: str, entry: Optional[Dict]):
+        """Record one index change (None deletes); the caller holds the lock and has caught up."""
+        with self._index_lock:
+            self._apply_delta(index_id, entry)
+            line = (json.dumps({"id": index_id, "entry": entry}, ensure_ascii=False) + "\n").encode("utf-8")
+            with open(self.index_log, 'ab') as f:
+                ino = os.fstat(f.fileno()).st_ino
+                if ino == self._log_ino:
+                    f.truncate(self._log_offset)  # drop a tail torn by a crashed writer
+                else:
+                    self._log_ino, self._log_offset, self._log_entries = ino, 0, 0
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._log_offset += len(line)
+            self._log_entries += 1
+            if self._log_entries >= max(self.COMPACT_MIN, len(self._index)):
+                self._compact()
+
+    def _compact(self):
+        """Fold the log into index.json and start an empty log (caller holds the lock)."""
+        with self._index_lock:
+            atomic_write_json(self.index_file, self._index, indent=None)
+            st = self.index_file.stat()
+            self._index_version = (st.st_ino, st.st_mtime_ns)
+            # A crash before the swap only leaves deltas that replay harmlessly
+            tmp = self.index_log.with_name(f".{self.index_log.name}.tmp")
+            tmp.write_bytes(b"")
+            os.replace(tmp, self.index_log)
+            self._log_ino, self._log_offset, self._log_entries = self.index_log.stat().st_ino, 0, 0
+
+    def rebuild_index(self) -> int:
+        """Scan the status directories and rewrite the index; returns entry count."""
+        with self.lock:
+            return self._rebuild_index()
+
+    def _rebuild_index(self) -> int:
+        index = {}
+        for status in DRAFT_STATUSES:
+            for f in sorted(self.dirs[status].glob("*.json")):
+                try:
+                    draft = self._read(f)
+                except (OSError, json.JSONDecodeError):
+                    continue
+                draft_id = str(draft.get("id") or normalize_draft_id(f.stem))
+                if draft_id in index:
+                    # Legacy second-resolution ids can collide; qualify the later one by status
+                    draft_id = f"{draft_id}~{status}"
+                index[draft_id] = self._entry(draft, status, f.name)
+        with self._index_lock:
+            self._index = index
+            self._compact()
+        return len(index)
+
+    def _entry(self, draft: Dict, status: str, filename: str) -> Dict:
+        return {"status": status, "file": filename, **{k: draft.get(k) for k in self.INDEX_FIELDS},
+                "buckets": draft_buckets(draft)}
+
+    def _find(self, draft_id: str, statuses: tuple) -> Optional[tuple]:
+        """Locate a draft by (partial) id via the index; returns (id, status, path)."""
+        self._load_index()
+        with self._index_lock:
+            entry = self._index.get(draft_id)
+        if entry and entry["status"] in statuses:
+            found = draft_id
+        else:
+            # Partial (or legacy substring) id: scan the index
+            candidates = [i for i, e in self._entries() if e["status"] in statuses]
+            found = resolve_draft_id(draft_id, candidates)
+            if found is None:
+                return None
+            with self._index_lock:
+                entry = self._index.get(found)
+            if entry is None:
+                return None
+        path = self.dirs[entry["status"]] / entry["file"]
+        if not path.exists():
+            # Files were moved behind our back; rebuild once and retry
+            self.rebuild_index()
+            with self._index_lock:
+                entry = self._index.get(found)
+            if not entry or entry["status"] not in statuses:
+                return None
+            path = self.dirs[entry["status"]] / entry["file"]
+        return found, entry["status"], path
+
+    # --- store interface ---
+
+    def insert(self, draft: Dict) -> str:
+        with self.lock:
+            self._load_index()
+            filename = f"draft_{draft['id']}.json"
+            path = self.dirs[draft["status"]] / filename
+            self._write(path, draft)
+            self._log_index(str(draft["id"]), self._entry(draft, draft["status"], filename))
+        return str(path)
+
+    def get(self, draft_id: str, statuses: tuple = DRAFT_STATUSES) -> Optional[Dict]:
+        for _ in range(2):
+            found = self._find(draft_id, statuses)
+            if not found:
+                return None
+            _, status, path = found
+            try:
+                # The directory is the source of truth for status (approve is a plain rename)
+                return {**self._read(path), "status": status}
+            except FileNotFoundError:
+                continue  # moved by another process since the index was read; look again
+        return None
 
-        for file_path in bucket_files.get(bucket, []):
-            if not file_path.exists():
+    def list(self, status: str) -> List[Dict]:
+        drafts = []
+        for _, entry in self._entries():
+            if entry["status"] == status:
+                try:
+                    drafts.append({**self._read(self.dirs[status] / entry["file"]), "status": status})
+                except FileNotFoundError:
+                    continue
+        return drafts
+
+    def page(self, status: str, sort: str, descending: bool, limit: int,
+             after: Optional[tuple] = None, fields: Optional[tuple] = None) -> List[Dict]:
+        """One page from the index; only the drafts on the page are opened, and
+        none at all when `fields` are all header fields."""
+        header_only = fields and set(fields) <= set(DRAFT_HEADER_FIELDS)
+        if header_only:
+            self._backfill(status)
+        headers = ({"id": i, **e} for i, e in self._entries() if e["status"] == status)
+        chosen = page_headers(headers, sort, descending, limit, after)
+        if header_only:
+            return [project(h, fields) for h in chosen]
+        drafts = []
+        for h in chosen:
+            try:
+                draft = {**self._read(self.dirs[status] / h["file"]), "status": status}
+            except FileNotFoundError:
                 continue
+            drafts.append(project(draft, fields))
+        return drafts
+
+    def count(self, status: str) -> int:
+        return sum(1 for _, e in self._entries() if e["status"] == status)
+
+    def pattern_counts(self, status: str) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for _, entry in self._entries():
+            if entry["status"] == status:
+                p = entry.get('pattern') or 'unknown'
+                counts[p] = counts.get(p, 0) + 1
+        return counts
+
+    def _backfill(self, status: str):
+        """Give entries indexed before sources and buckets were their fields, reading those drafts once."""
+        if not any(e["status"] == status and "sources" not in e for _, e in self._entries()):
+            return
+        with self.lock:
+            self._load_index()
+            with self._index_lock:
+                for entry in self._index.values():
+                    if entry["status"] == status and "sources" not in entry:
+                        try:
+                            draft = self._read(self.dirs[status] / entry["file"])
+                        except (OSError, json.JSONDecodeError):
+                            draft = {}
+                        entry["sources"] = draft.get("sources", [])
+                        entry["buckets"] = draft_buckets(draft)
+                self._compact()
+
+    def bucket_counts(self, status: str) -> Dict[str, int]:
+        self._backfill(status)
+        counts: Dict[str, int] = {}
+        for _, entry in self._entries():
+            if entry["status"] == status:
+                for bucket in entry.get("buckets", []):
+                    counts[bucket] = counts.get(bucket, 0) + 1
+        return counts
+
+    def move(self, draft_id: str, from_statuses: tuple, to_status: str, changes: Dict = None) -> Optional[Dict]:
+        with self.lock:
+            found = self._find(draft_id, from_statuses)
+            if not found:
+                return None
+            index_id, status, path = found
+            dest = self.dirs[to_status] / path.name
+            if changes:
+                draft = {**self._read(path), **changes}
+                self._write(dest, draft)
+                path.unlink()
+            else:
+                path.rename(dest)
+                draft = self._read(dest)
+            self._log_index(index_id, self._entry(draft, to_status, dest.name))
+        return {**draft, "status": to_status}
+
+    def update(self, draft_id: str, changes: Dict, statuses: tuple, event: str = "update") -> Optional[Dict]:
+        with self.lock:
+            found = self._find(draft_id, statuses)
+            if not found:
+                return None
+            index_id, status, path = found
+            draft = {**self._read(path), **changes}
+            self._write(path, draft)
+            self._log_index(index_id, self._entry(draft, status, path.name))
+        return {**draft, "status": status}
+
+    def delete(self, draft_id: str, statuses: tuple) -> bool:
+        with self.lock:
+            found = self._find(draft_id, statuses)
+            if not found:
+                return False
+            index_id, _, path = found
+            path.unlink()
+            self._log_index(index_id, None)
+        return True
+
+
+class SqliteDraftStore:
+    """Draft storage in a single SQLite database (WAL mode) with indexed lookups.
+
+    Status, pattern, created_at and posted_at are real columns with indexes;
+    the full draft is kept as JSON in `data`. A fresh database imports the
+    existing pending/, approved/ and posted/ directories once.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS drafts (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            pattern TEXT,
+            created_at TEXT,
+            posted_at TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_drafts_status_created ON drafts(status, created_at);
+        CREATE INDEX IF NOT EXISTS idx_drafts_status_posted ON drafts(status, posted_at);
+        CREATE INDEX IF NOT EXISTS idx_drafts_pattern ON drafts(status, pattern);
+        CREATE INDEX IF NOT EXISTS idx_drafts_created ON drafts(created_at);
+        CREATE INDEX IF NOT EXISTS idx_drafts_page_created ON drafts(status, created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_drafts_page_posted ON drafts(status, posted_at, id);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    def __init__(self, db_path: Path = DRAFTS_DIR / "drafts.db", migrate_from: Path = None):
+        import sqlite3
+
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        # Sort columns hold '' rather than NULL so keyset pagination can use the indexes
+        self.conn.execute("UPDATE drafts SET created_at = '' WHERE created_at IS NULL")
+        self.conn.execute("UPDATE drafts SET posted_at = '' WHERE posted_at IS NULL")
+        if migrate_from is not None:
+            self.migrate_from_directories(migrate_from)
+
+    def migrate_from_directories(self, drafts_dir: Path) -> int:
+        """One-time import of JSON draft directories; later calls are no-ops."""
+        with self._lock:
+            if self.conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_at'").fetchone():
+                return 0
+            json_store = JsonDraftStore(drafts_dir)
+            imported = 0
+            self.conn.execute("BEGIN IMMEDIATE")
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                tweets = data.get('tweets', data if isinstance(data, list) else [])
-                for t in tweets:
+                for status in DRAFT_STATUSES:
+                    for f in json_store.dirs[status].glob("*.json"):
+                        try:
+                            draft = json_store._read(f)
+                        except (OSError, json.JSONDecodeError):
+                            continue
+                        draft.setdefault("id", normalize_draft_id(f.stem))
+                        draft.setdefault("created_at", draft.get("generatedAt"))
+                        draft["status"] = status
+                        # Old second-resolution ids can collide; keep every file as its own row
+                        base_id, n = str(draft["id"]), 1
+                        while self.conn.execute("SELECT 1 FROM drafts WHERE id = ?", (str(draft["id"]),)).fetchone():
+                            n += 1
+                            draft["id"] = f"{base_id}_{n}"
+                        self._upsert(draft, replace=False)
+                        imported += 1
+                self.conn.execute("INSERT INTO meta (key, value) VALUES ('migrated_at', ?)",
+                                  (datetime.now().isoformat(),))
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            return imported
+
+    def _upsert(self, draft: Dict, replace: bool = True):
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        self.conn.execute(
+            f"{verb} INTO drafts (id, status, pattern, created_at, posted_at, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (str(draft["id"]), draft["status"], draft.get("pattern"), draft.get("created_at") or "",
+             draft.get("posted_at") or "", json.dumps(draft, ensure_ascii=False)))
+
+    def _row_to_draft(self, row) -> Dict:
+        return {**json.loads(row["data"]), "status": row["status"]}
+
+    def _find_row(self, draft_id: str, statuses: tuple):
+        """Exact id match, then a unique indexed prefix match (see resolve_draft_id)."""
+        marks = ",".join("?" * len(statuses))
+        row = self.conn.execute(f"SELECT * FROM drafts WHERE id = ? AND status IN ({marks})",
+                                (draft_id, *statuses)).fetchone()
+        if row is not None:
+            return row
+        rows = self.conn.execute(
+            f"SELECT * FROM drafts WHERE id >= ? AND id < ? AND status IN ({marks}) ORDER BY id LIMIT 2",
+            (draft_id, draft_id + "\uffff", *statuses)).fetchall()
+        if not rows:
+            escaped = draft_id.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            rows = self.conn.execute(
+                f"SELECT * FROM drafts WHERE id LIKE ? ESCAPE '\\' AND status IN ({marks}) LIMIT 2",
+                (f"%{escaped}%", *statuses)).fetchall()
+        return rows[0] if len(rows) == 1 else None
+
+    def insert(self, draft: Dict) -> str:
+        with self._lock:
+            self._upsert(draft)
+        return f"{self.db_path}#{draft['id']}"
+
+    def get(self, draft_id: str, statuses: tuple = DRAFT_STATUSES) -> Optional[Dict]:
+        with self._lock:
+            row = self._find_row(draft_id, statuses)
+        return self._row_to_draft(row) if row else None
+
+    def list(self, status: str) -> List[Dict]:
+        with self._lock:
+            rows = self.conn.execute("SELECT * FROM drafts WHERE status = ? ORDER BY created_at DESC",
+                                     (status,)).fetchall()
+        return [self._row_to_draft(r) for r in rows]
+
+    def page(self, status: str, sort: str, descending: bool, limit: int,
+             after: Optional[tuple] = None, fields: Optional[tuple] = None) -> List[Dict]:
+        """One page via an indexed keyset query; header fields skip decoding `data`."""
+        column = sort if sort in ("id", "created_at", "posted_at") else f"COALESCE({sort}, '')"
+        op, order = ("<", "DESC") if descending else (">", "ASC")
+        header_only = fields and set(fields) <= set(DRAFT_HEADER_FIELDS)
+        select = ("id, status, pattern, created_at, posted_at, json_extract(data, '$.sources') AS sources"
+                  if header_only else "*")
+        where, params = "status = ?", [status]
+        if after is not None:
+            where += f" AND ({column}, id) {op} (?, ?)"
+            params += list(after)
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT {select} FROM drafts WHERE {where} ORDER BY {column} {order}, id {order} LIMIT ?",
+                (*params, limit)).fetchall()
+        if header_only:
+            return [project({**{k: (r[k] or None) if k.endswith("_at") else r[k] for k in r.keys()},
+                             "sources": json.loads(r["sources"] or "[]")}, fields)
+                    for r in rows]
+        return [project(self._row_to_draft(r), fields) for r in rows]
+
+    def count(self, status: str) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM drafts WHERE status = ?", (status,)).fetchone()[0]
+
+    def pattern_counts(self, status: str) -> Dict[str, int]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT COALESCE(pattern, 'unknown') AS p, COUNT(*) AS n FROM drafts WHERE status = ? GROUP BY p",
+                (status,)).fetchall()
+        return {r["p"]: r["n"] for r in rows}
+
+    def bucket_counts(self, status: str) -> Dict[str, int]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT s.value AS b, COUNT(DISTINCT drafts.id) AS n FROM drafts, json_each(drafts.data, '$.sources') s "
+                "WHERE drafts.status = ? AND s.value NOT LIKE '@%' AND s.value != '' GROUP BY s.value",
+                (status,)).fetchall()
+        return {r["b"]: r["n"] for r in rows}
+
+    def _transition(self, draft_id: str, statuses: tuple, to_status: Optional[str], changes: Dict) -> Optional[Dict]:
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._find_row(draft_id, statuses)
+                if row is None:
+                    self.conn.execute("ROLLBACK")
+                    return None
+                draft = {**self._row_to_draft(row), **(changes or {})}
+                if to_status:
+                    draft["status"] = to_status
+                self._upsert(draft)
+                self.conn.execute("COMMIT")
+                return draft
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def move(self, draft_id: str, from_statuses: tuple, to_status: str, changes: Dict = None) -> Optional[Dict]:
+        return self._transition(draft_id, from_statuses, to_status, changes)
+
+    def update(self, draft_id: str, changes: Dict, statuses: tuple, event: str = "update") -> Optional[Dict]:
+        return self._transition(draft_id, statuses, None, changes)
+
+    def delete(self, draft_id: str, statuses: tuple) -> bool:
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._find_row(draft_id, statuses)
+                if row is not None:
+                    self.conn.execute("DELETE FROM drafts WHERE id = ?", (row["id"],))
+                self.conn.execute("COMMIT")
+                return row is not None
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+
+class JournalDraftStore:
+    """Draft storage as an append-only event journal with periodic snapshots.
+
+    Every transition (save, approve, attach, enrich, reject, post) appends one
+    JSON line to drafts/journal/events-<segment>.jsonl. Queue state is the last
+    snapshot with the current segment replayed on top. Every COMPACT_EVERY
+    events the state is compacted into a new snapshot and a new segment is
+    started; old segments stay on disk as the audit trail.
+    """
+
+    COMPACT_EVERY = 500
+
+    def __init__(self, journal_dir: Path = DRAFTS_DIR / "journal", migrate_from: Path = None):
+        self.journal_dir = journal_dir
+        journal_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshot_file = journal_dir / "snapshot.json"
+        # Serialises appends and compaction across processes, so sequence numbers
+        # stay unique and no append lands in a segment that was just compacted
+        self._lock = FileLock(journal_dir / ".lock")
+        self.drafts: Dict[str, Dict] = {}
+        self.segment = 0
+        self.seq = 0
+        self._offset = 0
+        self._segment_events = 0
+        self._snapshot_mtime = None
+        self._refresh()
+        if migrate_from is not None and self.seq == 0:
+            self.migrate_from_directories(migrate_from)
+
+    def _segment_file(self, segment: int) -> Path:
+        return self.journal_dir / f"events-{segment:06d}.jsonl"
+
+    def _refresh(self):
+        """Catch up with snapshots and events written since the last read, by any process."""
+        try:
+            mtime = self.snapshot_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime != self._snapshot_mtime:
+            snapshot = {"segment": 0, "seq": 0, "drafts": {}}
+            if mtime is not None:
+                with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+            self.drafts = snapshot["drafts"]
+            self.segment = snapshot["segment"]
+            self.seq = snapshot["seq"]
+            self._offset = 0
+            self._segment_events = 0
+            self._snapshot_mtime = mtime
+
+        path = self._segment_file(self.segment)
+        try:
+            if path.stat().st_size <= self._offset:
+                return
+        except FileNotFoundError:
+            return
+        with open(path, 'rb') as f:
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # another writer is mid-append; pick it up next time
+                self._offset += len(line)
+                self._apply(json.loads(line))
+
+    def _apply(self, event: Dict):
+        self.seq = max(self.seq, event["seq"])
+        self._segment_events += 1
+        draft_id = event["id"]
+        if "draft" in event:
+            self.drafts[draft_id] = event["draft"]
+        elif event["op"] == "reject":
+            self.drafts.pop(draft_id, None)
+        elif draft_id in self.drafts:
+            draft = {**self.drafts[draft_id], **event.get("changes", {})}
+            if event.get("status"):
+                draft["status"] = event["status"]
+            self.drafts[draft_id] = draft
+
+    def _append(self, op: str, draft_id: str, **fields):
+        """Append one event and apply it; compacts when the segment is full."""
+        with self._lock:
+            self._refresh()
+            event = {"seq": self.seq + 1, "ts": datetime.now().isoformat(), "op": op, "id": draft_id, **fields}
+            with open(self._segment_file(self.segment), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._refresh()
+            if self._segment_events >= self.COMPACT_EVERY:
+                self.compact()
+
+    def compact(self) -> int:
+        """Write the current state as a snapshot and start a new segment; returns draft count."""
+        with self._lock:
+            self._refresh()
+            snapshot = {"segment": self.segment + 1, "seq": self.seq,
+                        "created_at": datetime.now().isoformat(), "drafts": self.drafts}
+            atomic_write_json(self.snapshot_file, snapshot, indent=None)
+            self.segment += 1
+            self._offset = 0
+            self._segment_events = 0
+            self._snapshot_mtime = self.snapshot_file.stat().st_mtime_ns
+            return len(self.drafts)
+
+    def migrate_from_directories(self, drafts_dir: Path) -> int:
+        """One-time import of JSON draft directories as the first snapshot."""
+        with self._lock:
+            self._refresh()
+            if self.seq or self.snapshot_file.exists():
+                return 0
+            json_store = JsonDraftStore(drafts_dir)
+            for status in DRAFT_STATUSES:
+                for f in json_store.dirs[status].glob("*.json"):
                     try:
-                        ts = datetime.fromisoformat(t.get('date', '').replace('Z', '+00:00'))
-                        if ts > cutoff and not t.get('isRetweet', False):
-                            t['bucket'] = bucket
-                            t['handle'] = file_path.stem.replace('-tweets', '')
-                            recent.append(t)
-                    except:
+                        draft = json_store._read(f)
+                    except (OSError, json.JSONDecodeError):
                         continue
-            except:
-                continue
+                    draft.setdefault("id", normalize_draft_id(f.stem))
+                    draft.setdefault("created_at", draft.get("generatedAt"))
+                    draft["status"] = status
+                    # Old second-resolution ids can collide; keep every file as its own draft
+                    base_id, n = str(draft["id"]), 1
+                    while str(draft["id"]) in self.drafts:
+                        n += 1
+                        draft["id"] = f"{base_id}_{n}"
+                    self.drafts[str(draft["id"])] = draft
+            self.seq = 1
+            self.compact()
+            return len(self.drafts)
+
+    def _resolve(self, draft_id: str, statuses: tuple) -> Optional[str]:
+        self._refresh()
+        return resolve_draft_id(draft_id, [i for i, d in self.drafts.items() if d["status"] in statuses])
+
+    def history(self, draft_id: str) -> List[Dict]:
+        """All journal events for a draft, oldest first (imported drafts start at the snapshot)."""
+        with self._lock:
+            found = self._resolve(draft_id, DRAFT_STATUSES) or draft_id
+            events = []
+            for path in sorted(self.journal_dir.glob("events-*.jsonl")):
+                with open(path, 'rb') as f:
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            break  # another writer is mid-append
+                        event = json.loads(line)
+                        if event["id"] == found:
+                            events.append(event)
+            return events
+
+    def insert(self, draft: Dict) -> str:
+        with self._lock:
+            self._refresh()
+            self._append("save", str(draft["id"]), draft=draft)
+        return f"{self._segment_file(self.segment)}#{draft['id']}"
+
+    def get(self, draft_id: str, statuses: tuple = DRAFT_STATUSES) -> Optional[Dict]:
+        with self._lock:
+            found = self._resolve(draft_id, statuses)
+            return dict(self.drafts[found]) if found else None
+
+    def list(self, status: str) -> List[Dict]:
+        with self._lock:
+            self._refresh()
+            return [dict(d) for d in self.drafts.values() if d["status"] == status]
+
+    def page(self, status: str, sort: str, descending: bool, limit: int,
+             after: Optional[tuple] = None, fields: Optional[tuple] = None) -> List[Dict]:
+        with self._lock:
+            self._refresh()
+            chosen = page_headers((d for d in self.drafts.values() if d["status"] == status),
+                                  sort, descending, limit, after)
+            return [project(dict(d), fields) for d in chosen]
+
+    def count(self, status: str) -> int:
+        with self._lock:
+            self._refresh()
+            return sum(1 for d in self.drafts.values() if d["status"] == status)
+
+    def pattern_counts(self, status: str) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for draft in self.list(status):
+            p = draft.get('pattern') or 'unknown'
+            counts[p] = counts.get(p, 0) + 1
+        return counts
+
+    def bucket_counts(self, status: str) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        with self._lock:
+            self._refresh()
+            for draft in self.drafts.values():
+                if draft["status"] == status:
+                    for bucket in draft_buckets(draft):
+                        counts[bucket] = counts.get(bucket, 0) + 1
+        return counts
+
+    def move(self, draft_id: str, from_statuses: tuple, to_status: str, changes: Dict = None) -> Optional[Dict]:
+        with self._lock:
+            found = self._resolve(draft_id, from_statuses)
+            if found is None:
+                return None
+            op = {"approved": "approve", "posted": "post"}.get(to_status, "move")
+            self._append(op, found, status=to_status, changes=changes or {})
+            return dict(self.drafts[found])
+
+    def update(self, draft_id: str, changes: Dict, statuses: tuple, event: str = "update") -> Optional[Dict]:
+        with self._lock:
+            found = self._resolve(draft_id, statuses)
+            if found is None:
+                return None
+            self._append(event, found, changes=changes)
+            return dict(self.drafts[found])
+
+    def delete(self, draft_id: str, statuses: tuple) -> bool:
+        with self._lock:
+            found = self._resolve(draft_id, statuses)
+            if found is None:
+                return False
+            self._append("reject", found)
+            return True
 
-        return sorted(recent, key=lambda x: x.get('date', ''), reverse=True)
 
-    def generate_drafts_from_buckets(self, claude_client: 'ClaudeClient' = None) -> List[str]:
-        """Generate drafts from recent bucket tweets."""
-        created = []
+class PostingQueue:
+    """Priority order over approved drafts, backed by a heap.
 
-        # Breaking: < 10 minutes (immediate)
-        breaking = self.scrape_recent_tweets("breaking", max_age_hours=0.17)
+    priority = bucket weight x source tier weight x pattern diversity x age decay
 
-        # Commentary & Geopolitics: < 24 hours
-        commentary = self.scrape_recent_tweets("commentary", max_age_hours=24)
-        geopolitics = self.scrape_recent_tweets("geopolitics", max_age_hours=24)
+    All drafts share one decay half-life, so the decay term folds into a
+    time-independent heap key (log weights + created_at * ln2 / half-life)
+    and the heap never needs re-sorting as time passes. Posting a draft
+    changes the diversity term only for drafts with the affected patterns;
+    those are re-pushed and superseded heap entries are skipped lazily.
+    """
 
-        # Process breaking tweets FIRST (bilingual, auto-approve)
-        for tweet in breaking[:5]:
-            english_text = tweet.get('text', '')
-            pattern = self.enricher.detect_pattern(english_text)
+    BUCKET_WEIGHTS = {"breaking": 4.0, "geopolitics": 1.5, "commentary": 1.2}
+    TIER_WEIGHTS = {1: 1.3, 2: 1.15, 3: 1.0, 4: 0.6}
+    HALF_LIFE_HOURS = 6.0
+    DIVERSITY_WINDOW = 10       # recently posted drafts that count against a pattern
+    DIVERSITY_PENALTY = 0.5     # per recent post with the same pattern
+    # Draft fields the priority reads; all are index (header) fields
+    FIELDS = ("id", "pattern", "created_at", "sources")
+
+    def __init__(self, source_tiers: Dict[str, int] = None):
+        self.source_tiers = source_tiers or {}
+        self.recent_patterns = deque(maxlen=self.DIVERSITY_WINDOW)
+        self._heap: List[tuple] = []
+        self._keys: Dict[str, float] = {}
+        self._drafts: Dict[str, Dict] = {}
+        self._pushes = 0
+
+    def bucket(self, draft: Dict) -> Optional[str]:
+        if draft.get("pattern") == "breaking":
+            return "breaking"
+        for s in [draft.get("bucket")] + draft.get("sources", []):
+            if s in self.BUCKET_WEIGHTS:
+                return s
+        return None
 
-            # Translate breaking to Persian
-            persian_text = ""
-            if claude_client:
-                try:
-                    persian_text = self.enricher.translate_to_persian(english_text, claude_client)
-                except:
-                    pass
+    def source_tier(self, draft: Dict) -> Optional[int]:
+        tiers = [self.source_tiers[s.lstrip("@").lower()] for s in draft.get("sources", [])
+                 if s.startswith("@") and s.lstrip("@").lower() in self.source_tiers]
+        return min(tiers) if tiers else None
 
-            path = self.draft_mgr.save_draft(
-                english=english_text,
-                persian=persian_text,
-                pattern=pattern or "breaking",
-                sources=[f"@{tweet.get('handle', 'unknown')}", "breaking"]
-            )
+    def weights(self, draft: Dict) -> Dict[str, float]:
+        """Multiplicative score components, before age decay."""
+        return {
+            "bucket": self.BUCKET_WEIGHTS.get(self.bucket(draft), 1.0),
+            "tier": self.TIER_WEIGHTS.get(self.source_tier(draft), 1.0),
+            "diversity": 1 / (1 + self.DIVERSITY_PENALTY * self.recent_patterns.count(draft.get("pattern"))),
+        }
 
-            # Auto-approve breaking tweets
-            draft_id = Path(path).stem if path else None
-            if draft_id:
-                self.draft_mgr.approve_draft(draft_id)
-            created.append(path)
+    @staticmethod
+    def created_ts(draft: Dict) -> float:
+        try:
+            return datetime.fromisoformat(draft.get("created_at") or "").timestamp()
+        except ValueError:
+            return 0.0
+
+    def key(self, draft: Dict) -> float:
+        log_weight = sum(math.log(w) for w in self.weights(draft).values())
+        return log_weight + self.created_ts(draft) * math.log(2) / (self.HALF_LIFE_HOURS * 3600)
+
+    def score(self, draft: Dict, now: float = None) -> float:
+        """Current priority: weights decayed by age (for display)."""
+        age_hours = max(0.0, ((now or time.time()) - self.created_ts(draft)) / 3600)
+        weight = 1.0
+        for w in self.weights(draft).values():
+            weight *= w
+        return weight * 0.5 ** (age_hours / self.HALF_LIFE_HOURS)
+
+    def push(self, draft: Dict):
+        """Add or re-score a draft. O(log n)."""
+        draft_id = str(draft["id"])
+        key = self.key(draft)
+        self._drafts[draft_id] = draft
+        self._keys[draft_id] = key
+        self._pushes += 1
+        heapq.heappush(self._heap, (-key, self._pushes, draft_id))
+
+    def remove(self, draft_id: str):
+        self._keys.pop(draft_id, None)
+        self._drafts.pop(draft_id, None)
+
+    def peek(self) -> Optional[Dict]:
+        """Highest-priority draft without removing it (amortised O(log n))."""
+        while self._heap:
+            neg_key, _, draft_id = self._heap[0]
+            if self._keys.get(draft_id) == -neg_key:
+                return self._drafts[draft_id]
+            heapq.heappop(self._heap)  # superseded or removed
+        return None
 
-        # Process other buckets as drafts (English only for now)
-        for tweet in (commentary + geopolitics)[:10]:
-            english_text = tweet.get('text', '')
-            pattern = self.enricher.detect_pattern(english_text)
+    def pop(self) -> Optional[Dict]:
+        draft = self.peek()
+        if draft is not None:
+            heapq.heappop(self._heap)
+            self.remove(str(draft["id"]))
+        return draft
+
+    def note_posted(self, draft: Dict):
+        """Record a post for pattern diversity and re-score drafts it affects."""
+        evicted = self.recent_patterns[0] if len(self.recent_patterns) == self.recent_patterns.maxlen else None
+        self.recent_patterns.append(draft.get("pattern"))
+        self.remove(str(draft.get("id")))
+        for d in [d for d in self._drafts.values() if d.get("pattern") in (draft.get("pattern"), evicted)]:
+            self.push(d)
+
+    def ranked(self, limit: int = None) -> List[Dict]:
+        """Drafts in posting order, without consuming the queue."""
+        keys = sorted(self._keys.items(), key=lambda kv: kv[1], reverse=True)
+        return [self._drafts[i] for i, _ in keys[:limit]]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class PostedArchive:
+    """Posted drafts rolled into monthly gzip segments under drafts/archive/.
+
+    Each draft is written as its own gzip member, so posted-YYYY-MM.jsonl.gz
+    streams like any jsonl.gz file, while the sidecar posted-YYYY-MM.idx.json
+    (id -> offset, length and header fields) reads one draft with a single
+    seek and answers counts and header-only listings without decompressing.
+    The index is the commit point: segment bytes past its last entry are
+    discarded on the next add().
+    """
 
-            path = self.draft_mgr.save_draft(
-                english=english_text,
-                persian="",
-                pattern=pattern or "general",
-                sources=[f"@{tweet.get('handle', 'unknown')}", tweet.get('bucket', '')]
-            )
-            created.append(path)
+    def __init__(self, archive_dir: Path = DRAFTS_DIR / "archive"):
+        self.archive_dir = archive_dir
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        self.lock = FileLock(archive_dir / ".lock")
+        self._indexes: Dict[str, tuple] = {}
+        self._id_months: tuple = ((), {})
 
-        return created
+    def segment_file(self, month: str) -> Path:
+        return self.archive_dir / f"posted-{month}.jsonl.gz"
 
-    def run_cycle(self, claude_client: 'ClaudeClient' = None) -> Dict:
-        """Run one complete cycle: scrape → enrich → queue."""
-        results = {
-            "timestamp": datetime.now().isoformat(),
-            "drafts_created": [],
-            "errors": []
-        }
+    def index_file(self, month: str) -> Path:
+        return self.archive_dir / f"posted-{month}.idx.json"
+
+    def months(self) -> List[str]:
+        return sorted(f.name[len("posted-"):-len(".idx.json")] for f in self.archive_dir.glob("posted-*.idx.json"))
 
+    def index(self, month: str) -> Dict[str, Dict]:
+        """Sidecar index for a month, cached until the file changes."""
+        path = self.index_file(month)
         try:
-            created = self.generate_drafts_from_buckets(claude_client)
-            results["drafts_created"] = created
-        except Exception as e:
-            results["errors"].append(str(e))
+            st = path.stat()
+        except FileNotFoundError:
+            return {}
+        version = (st.st_ino, st.st_mtime_ns)
+        cached = self._indexes.get(month)
+        if not cached or cached[0] != version:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = (version, json.load(f))
+            self._indexes[month] = cached
+        return cached[1]
+
+    def add(self, drafts: List[Dict]) -> int:
+        """Append drafts to their posted_at month; ids already archived are skipped."""
+        by_month: Dict[str, List[Dict]] = {}
+        for draft in drafts:
+            stamp = draft.get("posted_at") or draft.get("created_at") or ""
+            by_month.setdefault(stamp[:7] or "undated", []).append(draft)
+
+        added = 0
+        with self.lock:
+            for month, month_drafts in by_month.items():
+                index = dict(self.index(month))
+                # Drop any tail a crash left between the segment append and the index write,
+                # so those drafts are not archived twice
+                segment = self.segment_file(month)
+                indexed_end = max((e["offset"] + e["length"] for e in index.values()), default=0)
+                if segment.exists() and segment.stat().st_size > indexed_end:
+                    os.truncate(segment, indexed_end)
+                with open(segment, 'ab') as f:
+                    for draft in month_drafts:
+                        draft_id = str(draft["id"])
+                        if draft_id in index:
+                            continue
+                        record = {**draft, "status": "posted"}
+                        data = gzip.compress((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+                        index[draft_id] = {"offset": f.tell(), "length": len(data),
+                                           **{k: record.get(k) for k in ("pattern", "created_at", "posted_at", "sources")}}
+                        f.write(data)
+                        added += 1
+                    f.flush()
+                    os.fsync(f.fileno())
+                atomic_write_json(self.index_file(month), index, indent=None)
+        return added
+
+    def read(self, month: str, entry: Dict) -> Dict:
+        with open(self.segment_file(month), 'rb') as f:
+            f.seek(entry["offset"])
+            return json.loads(gzip.decompress(f.read(entry["length"])))
+
+    def iter_month(self, month: str):
+        """Stream a month's drafts sequentially."""
+        with gzip.open(self.segment_file(month), 'rt', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+
+    def headers(self):
+        for month in self.months():
+            for draft_id, entry in self.index(month).items():
+                yield {"id": draft_id, "status": "posted", "month": month, **entry}
+
+    def id_months(self) -> Dict[str, str]:
+        """id -> archive month, rebuilt only when a month's index changes."""
+        months = self.months()
+        for month in months:
+            self.index(month)  # refresh the cached version
+        versions = tuple((m, self._indexes[m][0]) for m in months if m in self._indexes)
+        if versions != self._id_months[0]:
+            self._id_months = (versions, {i: m for m in months for i in self.index(m)})
+        return self._id_months[1]
+
+    def get(self, draft_id: str) -> Optional[Dict]:
+        id_months = self.id_months()
+        found = resolve_draft_id(draft_id, id_months)
+        if found is None:
+            return None
+        month = id_months[found]
+        return self.read(month, self.index(month)[found])
 
-        return results
+    def count(self) -> int:
+        return sum(len(self.index(month)) for month in self.months())
+
+    def pattern_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for h in self.headers():
+            p = h.get("pattern") or "unknown"
+            counts[p] = counts.get(p, 0) + 1
+        return counts
+
+    def page(self, sort: str, descending: bool, limit: int,
+             after: Optional[tuple] = None, fields: Optional[tuple] = None) -> List[Dict]:
+        chosen = page_headers(self.headers(), sort, descending, limit, after)
+        # Headers archived before a field was indexed lack it; those drafts are read
+        return [project(h if fields and set(fields) <= h.keys() else self.read(h["month"], h), fields)
+                for h in chosen]
 
 
 class DraftManager:
-    """Manages tweet drafts with media attachments."""
+    """Manages tweet drafts with media attachments.
 
-    def __init__(self, drafts_dir: Path = DRAFTS_DIR):
+    Storage is pluggable: "json" (one file per draft, the default), "sqlite"
+    (indexed, WAL) or "journal" (append-only events + snapshots). Select with
+    the backend argument or FAYTUKS_DRAFT_BACKEND.
+
+    Posted drafts older than ARCHIVE_AFTER_DAYS can be rolled into a
+    PostedArchive by archive_posted(); posted counts, listings and lookups
+    include the archive. list_drafts() covers the live store only.
+    """
+
+    ARCHIVE_AFTER_DAYS = 30
+
+    def __init__(self, drafts_dir: Path = DRAFTS_DIR, backend: Optional[str] = None):
         self.drafts_dir = drafts_dir
         self.pending_dir = drafts_dir / "pending"
         self.approved_dir = drafts_dir / "approved"
         self.posted_dir = drafts_dir / "posted"
+        self.backend = backend or os.getenv("FAYTUKS_DRAFT_BACKEND", "json")
+
+        if self.backend == "sqlite":
+            self.store = SqliteDraftStore(drafts_dir / "drafts.db", migrate_from=drafts_dir)
+        elif self.backend == "journal":
+            self.store = JournalDraftStore(drafts_dir / "journal", migrate_from=drafts_dir)
+        elif self.backend == "json":
+            self.store = JsonDraftStore(drafts_dir)
+        else:
+            raise ValueError(f"Unknown draft backend: {self.backend} (use json, sqlite or journal)")
+        self.archive = PostedArchive(drafts_dir / "archive")
 
-        # Ensure directories exist
-        for d in [self.pending_dir, self.approved_dir, self.posted_dir]:
-            d.mkdir(parents=True, exist_ok=True)
-
-    def save_draft(self, english: str, persian: str, pattern: str,
-                   media: List[str] = None, hashtags: List[str] = None,
-                   sources: List[str] = None) -> str:
-        """Save a draft with media attachments."""
-        draft_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def add_draft(self, english: str, persian: str, pattern: str,
+                  media: List[str] = None, hashtags: List[str] = None,
+                  sources: List[str] = None, status: str = "pending", **extra) -> Dict:
+        """Save a draft and return it, including its id and storage location.
 
+        Pass status="approved" to create an approved draft in one write.
+        """
         draft = {
-            "id": draft_id,
+            "id": new_draft_id(),
             "created_at": datetime.now().isoformat(),
-            "status": "pending",
+            "status": status,
             "pattern": pattern,
             "english": english,
             "persian": persian,
@@ -723,47 +4272,180 @@ class DraftManager:
             "hashtags": hashtags or [],
             "sources": sources or [],
             "posted_at": None,
-            "tweet_id": None
+            "tweet_id": None,
+            **extra
         }
+        location = self.store.insert(draft)
+        return {**draft, "location": location}
 
-        draft_file = self.pending_dir / f"draft_{draft_id}.json"
-        with open(draft_file, 'w', encoding='utf-8') as f:
-            json.dump(draft, f, indent=2, ensure_ascii=False)
-
-        return str(draft_file)
+    def save_draft(self, english: str, persian: str, pattern: str,
+                   media: List[str] = None, hashtags: List[str] = None,
+                   sources: List[str] = None) -> str:
+        """Save a draft with media attachments."""
+        return self.add_draft(english, persian, pattern, media, hashtags, sources)["location"]
+
+    def get_draft(self, draft_id: str, statuses: tuple = ("pending", "approved")) -> Optional[Dict]:
+        """Find a draft by (partial) id in the given statuses."""
+        draft = self.store.get(normalize_draft_id(draft_id), statuses)
+        if draft is None and "posted" in statuses:
+            draft = self.archive.get(normalize_draft_id(draft_id))
+        return draft
+
+    def list_drafts(self, status: str) -> List[Dict]:
+        """List all drafts with a status in the live store, newest first."""
+        key = "posted_at" if status == "posted" else "created_at"
+        return sorted(self.store.list(status), key=lambda d: d.get(key) or "", reverse=True)
+
+    def page(self, status: str, limit: int = 20, cursor: Optional[str] = None,
+             sort: Optional[str] = None, descending: bool = True,
+             fields: Optional[List[str]] = None) -> tuple:
+        """One page of drafts with a status; returns (drafts, next_cursor).
+
+        sort defaults to posted_at for posted drafts and created_at otherwise.
+        Pass the returned cursor back to continue; it is None on the last page.
+        Restricting `fields` to DRAFT_HEADER_FIELDS avoids opening drafts.
+        """
+        import base64
+
+        if limit < 1:
+            raise ValueError(f"Page limit must be at least 1, got {limit}")
+        sort = sort or ("posted_at" if status == "posted" else "created_at")
+        if sort not in DRAFT_SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {sort} (use one of {', '.join(DRAFT_SORT_KEYS)})")
+        after = None
+        if cursor:
+            try:
+                cursor_sort, value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            except (ValueError, TypeError):
+                raise ValueError(f"Invalid cursor: {cursor}")
+            if cursor_sort != sort:
+                raise ValueError(f"Cursor was issued for sort '{cursor_sort}', not '{sort}'")
+            after = (value, last_id)
+
+        # Always fetch the sort key and id so the next cursor can be built
+        wanted = tuple(fields) if fields else None
+        fetch = tuple(dict.fromkeys((*wanted, "id", sort))) if wanted else None
+        drafts = self.store.page(status, sort, descending, limit + 1, after, fetch)
+        if status == "posted":
+            archived = self.archive.page(sort, descending, limit + 1, after, fetch)
+            if archived:
+                drafts = sorted(drafts + archived, key=lambda d: (d.get(sort) or "", str(d["id"])),
+                                reverse=descending)
+
+        next_cursor = None
+        if drafts and len(drafts) > limit:
+            drafts = drafts[:limit]
+            last = drafts[-1]
+            token = json.dumps([sort, last.get(sort) or "", str(last["id"])], ensure_ascii=False)
+            next_cursor = base64.urlsafe_b64encode(token.encode()).decode()
+        return [project(d, wanted) for d in drafts], next_cursor
 
     def list_pending(self) -> List[Dict]:
         """List all pending drafts."""
-        drafts = []
-        for f in self.pending_dir.glob("*.json"):
-            with open(f, 'r', encoding='utf-8') as file:
-                drafts.append(json.load(file))
-        return sorted(drafts, key=lambda d: d.get("created_at", ""), reverse=True)
+        return self.list_drafts("pending")
+
+    def list_posted(self) -> List[Dict]:
+        """List all posted drafts, archived ones included."""
+        total = self.count("posted")
+        if not total:
+            return []
+        drafts, _ = self.page("posted", limit=total)
+        return drafts
+
+    def count(self, status: str) -> int:
+        """Number of drafts with a status."""
+        count = self.store.count(status)
+        if status == "posted":
+            count += self.archive.count()
+        return count
+
+    def bucket_counts(self, status: str = "pending") -> Dict[str, int]:
+        """Live draft counts per source bucket (the non-@ entries of `sources`)."""
+        return self.store.bucket_counts(status)
+
+    def pattern_counts(self, status: str) -> Dict[str, int]:
+        """Draft counts per pattern for a status."""
+        counts = self.store.pattern_counts(status)
+        if status == "posted":
+            for p, n in self.archive.pattern_counts().items():
+                counts[p] = counts.get(p, 0) + n
+        return counts
+
+    def archive_posted(self, older_than_days: float = None) -> int:
+        """Move posted drafts older than the threshold into the monthly archive."""
+        from datetime import timedelta
+
+        days = self.ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        # Legacy drafts posted without a posted_at age by created_at; undated ones stay live
+        old = [d for d in self.store.list("posted")
+               if (stamp := d.get("posted_at") or d.get("created_at")) and stamp < cutoff]
+        # Append first, then drop from the live store; a re-run skips already archived ids
+        self.archive.add(old)
+        for draft in old:
+            self.store.delete(str(draft["id"]), ("posted",))
+        return len(old)
 
     def approve_draft(self, draft_id: str) -> bool:
         """Move draft from pending to approved."""
-        for f in self.pending_dir.glob(f"*{draft_id}*.json"):
-            dest = self.approved_dir / f.name
-            f.rename(dest)
-            return True
-        return False
+        return self.store.move(normalize_draft_id(draft_id), ("pending",), "approved") is not None
 
-    def mark_posted(self, draft_id: str, tweet_id: str = None) -> bool:
+    def mark_posted(self, draft_id: str, tweet_id: str = None, tweet_url: str = None) -> bool:
         """Move draft from approved to posted."""
-        for f in self.approved_dir.glob(f"*{draft_id}*.json"):
-            # Update the draft
-            with open(f, 'r', encoding='utf-8') as file:
-                draft = json.load(file)
-            draft["status"] = "posted"
-            draft["posted_at"] = datetime.now().isoformat()
-            draft["tweet_id"] = tweet_id
-
-            dest = self.posted_dir / f.name
-            with open(dest, 'w', encoding='utf-8') as file:
-                json.dump(draft, file, indent=2, ensure_ascii=False)
-            f.unlink()
-            return True
-        return False
+        changes = {"status": "posted", "posted_at": datetime.now().isoformat(), "tweet_id": tweet_id}
+        if tweet_url:
+            changes["tweet_url"] = tweet_url
+        return self.store.move(normalize_draft_id(draft_id), ("approved",), "posted", changes) is not None
+
+    def update_draft(self, draft_id: str, changes: Dict,
+                     statuses: tuple = ("pending", "approved"), event: str = "update") -> Optional[Dict]:
+        """Merge changes into a draft in place; returns the updated draft."""
+        return self.store.update(normalize_draft_id(draft_id), changes, statuses, event=event)
+
+    def attach_media(self, draft_id: str, media_path: str) -> bool:
+        """Append a media path to a pending or approved draft."""
+        draft = self.get_draft(draft_id)
+        if not draft:
+            return False
+        return self.update_draft(draft_id, {"media": draft.get("media", []) + [media_path]},
+                                 event="attach") is not None
+
+    def reject_draft(self, draft_id: str) -> bool:
+        """Delete a pending or approved draft."""
+        return self.store.delete(normalize_draft_id(draft_id), ("pending", "approved"))
+
+    def posting_queue(self, source_tiers: Dict[str, int] = None) -> PostingQueue:
+        """Approved draft headers in priority order, with recent posts counted for diversity.
+
+        Built from index fields only (PostingQueue.FIELDS), so no draft is opened;
+        load a draft with get_draft() once it is chosen.
+        """
+        queue = PostingQueue(source_tiers)
+        recent, _ = self.page("posted", PostingQueue.DIVERSITY_WINDOW, fields=["id", "pattern"])
+        for draft in reversed(recent):
+            queue.recent_patterns.append(draft.get("pattern"))
+        cursor = None
+        while True:
+            headers, cursor = self.page("approved", 500, cursor, fields=list(PostingQueue.FIELDS))
+            for header in headers:
+                queue.push(header)
+            if cursor is None:
+                return queue
+
+    def next_draft(self, source_tiers: Dict[str, int] = None) -> Optional[Dict]:
+        """The approved draft to post next."""
+        queue = self.posting_queue(source_tiers)
+        while queue:
+            draft = self.get_draft(str(queue.pop()["id"]), statuses=("approved",))
+            if draft:
+                return draft  # else posted or rejected since the index was read
+        return None
+
+    def history(self, draft_id: str) -> Optional[List[Dict]]:
+        """Journal events for a draft, or None when the backend keeps no journal."""
+        if not isinstance(self.store, JournalDraftStore):
+            return None
+        return self.store.history(normalize_draft_id(draft_id))
 
 
 class KnowledgeBase:
@@ -990,6 +4672,18 @@ class KnowledgeBase:
                     results.append({**source_data, "category": category, "id": source_id})
         return results
 
+    def get_source_tiers(self) -> Dict[str, int]:
+        """Map lowercased Twitter handles (without @) to credibility tier."""
+        sources = self.data.get("sources", {}).get("source_credibility", {}).get("sources", {})
+        tiers = {}
+        for category_sources in sources.values():
+            for source_data in category_sources.values():
+                tier = source_data.get("tier")
+                handles = [source_data.get("twitter", "")] + source_data.get("examples", [])
+                for handle in re.findall(r"@(\w+)", " ".join(h for h in handles if isinstance(h, str))):
+                    tiers.setdefault(handle.lower(), tier)
+        return tiers
+
     def get_tier_definitions(self) -> Dict:
         """Get source tier definitions."""
         return self.data.get("sources", {}).get("source_credibility", {}).get("tier_definitions", {})
@@ -1084,7 +4778,10 @@ class TemplateBase:
 
 class TweetGenerator:
     """Generates tweets using Claude prompts."""
-    
+
+    # Upper bound for --candidates: each candidate is a concurrent paid generation
+    MAX_CANDIDATES = 8
+
     def __init__(self, knowledge_base: KnowledgeBase):
         self.kb = knowledge_base
         self.patterns = self._load_patterns()
@@ -1190,7 +4887,46 @@ CONFIDENCE: [high/medium/low]
             prompt += f"\nADDITIONAL CONTEXT:\n{json.dumps(context, indent=2)}"
 
         return prompt
-    
+
+    def candidate_variants(self, pattern: str, emotion: str, hook: str, count: int) -> List[tuple]:
+        """(emotion, hook) pairs for N candidates: the chosen pair first, then pattern-fit variations."""
+        emotions = [emotion] + [e for e in get_emotions(pattern) if e != emotion]
+        hooks = [hook] + [h for h, cfg in HOOK_TEMPLATES.items() if pattern in cfg.get("best_for", []) and h != hook]
+        hooks += [h for h in HOOK_TEMPLATES if h not in hooks]
+
+        variants = []
+        for h in hooks:
+            for e in emotions:
+                if len(variants) >= count:
+                    return variants
+                variants.append((e, h))
+        return variants
+
+    def generate_candidates(self, topic: str, pattern: TweetPattern, claude_client: 'ClaudeClient',
+                            count: int, emotion: str, hook: str,
+                            parser: Optional['ResponseParser'] = None) -> List[Dict]:
+        """Fire N generations concurrently with varied hook/emotion; returns parsed candidates."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        parser = parser or ResponseParser()
+        variants = self.candidate_variants(pattern.value, emotion, hook, count)
+
+        def run(variant: tuple) -> Dict:
+            v_emotion, v_hook = variant
+            prompt = self.generate_prompt(topic, pattern, emotion=v_emotion,
+                                          hook_config=HOOK_TEMPLATES.get(v_hook))
+            # Parse (and any repair call) inside the guard: one failure must not discard the rest
+            try:
+                response = claude_client.generate_task("generate", prompt)
+                result = parser.try_parse("generate", response, claude_client)
+            except Exception as e:
+                return {"emotion": v_emotion, "hook": v_hook, "error": str(e), "text": ""}
+            return {"emotion": v_emotion, "hook": v_hook, "response": response, "result": result,
+                    "text": result.text if result else ""}
+
+        with ThreadPoolExecutor(max_workers=len(variants)) as pool:
+            return list(pool.map(run, variants))
+
     def generate_thread_prompt(self, topic: str, length: int = 6) -> str:
         """Generate a Claude prompt for thread creation."""
         relevant_facts = self.kb.search(topic)
@@ -1260,6 +4996,90 @@ FACTS DEPLOYED: [list]
 """
 
 
+class CandidateScorer:
+    """Ranks generated tweet candidates locally, without another LLM call.
+
+    Score = weighted length fit + fact overlap with the knowledge base
+    + novelty against recently posted drafts (see WEIGHTS).
+    """
+
+    WEIGHTS = {"length": 0.3, "facts": 0.4, "novelty": 0.3}
+
+    # Weighted length at which a tweet counts as fully developed (max is 280)
+    TARGET_LENGTH = 200
+
+    TOKEN_RE = re.compile(r"[\w\u0600-\u06FF][\w\u0600-\u06FF,.']*")
+
+    # Posted drafts from this many days back count for novelty; the SimHash radius
+    # is wide so partial overlaps grade the score instead of only near-copies
+    NOVELTY_DAYS = 30
+    NOVELTY_DISTANCE = 15
+
+    def __init__(self, knowledge_base: KnowledgeBase, posted: Optional[NearDuplicateIndex] = None):
+        self.kb = knowledge_base
+        self.kb_terms = self._build_kb_terms()
+        self.posted = posted
+
+    @classmethod
+    def posted_index(cls, draft_mgr: 'DraftManager') -> NearDuplicateIndex:
+        """SimHash index of recently posted drafts, for novelty_score."""
+        return NearDuplicateIndex.from_drafts(draft_mgr, days=cls.NOVELTY_DAYS,
+                                              max_distance=cls.NOVELTY_DISTANCE, statuses=("posted",))
+
+    def _tokens(self, text: str) -> List[str]:
+        return [t.strip(",.'").lower() for t in self.TOKEN_RE.findall(text or "")]
+
+    def _build_kb_terms(self) -> set:
+        """Numbers and content words that appear in knowledge-base facts."""
+        terms = set()
+        for fact in self.kb.get_facts():
+            for field in ("statement", "fact"):
+                terms.update(t for t in self._tokens(fact.get(field, "")) if len(t) > 3 or t[:1].isdigit())
+        return terms
+
+    def length_score(self, text: str) -> float:
+        """1.0 for a well-developed tweet; 0 when over the 280 weighted-character limit."""
+        length = weighted_length(text)
+        if length > 280:
+            return 0.0
+        return min(length / self.TARGET_LENGTH, 1.0)
+
+    def fact_score(self, text: str) -> float:
+        """Share of the tweet's numbers and content words grounded in knowledge-base facts."""
+        terms = [t for t in self._tokens(text) if (len(t) > 3 or t[:1].isdigit()) and not t.startswith("#")]
+        if not terms:
+            return 0.0
+        numbers = [t for t in terms if t[:1].isdigit()]
+        overlap = sum(1 for t in terms if t in self.kb_terms) / len(terms)
+        if not numbers:
+            return overlap
+        # Numbers carry the factual claims, so weight their support equally with the words
+        supported = sum(1 for n in numbers if n in self.kb_terms) / len(numbers)
+        return (overlap + supported) / 2
+
+    def novelty_score(self, text: str) -> float:
+        """SimHash distance to the closest posted draft, scaled to 0-1 (1 when none is close)."""
+        nearest = self.posted.nearest(text) if self.posted else None
+        if nearest is None:
+            return 1.0
+        return nearest[1] / (self.posted.max_distance + 1)
+
+    def score(self, text: str) -> Dict[str, float]:
+        parts = {
+            "length": self.length_score(text),
+            "facts": self.fact_score(text),
+            "novelty": self.novelty_score(text),
+        }
+        parts["total"] = sum(self.WEIGHTS[k] * v for k, v in parts.items())
+        return parts
+
+    def rank(self, candidates: List[Dict]) -> List[Dict]:
+        """Score candidates ({"text": ...}) and return them best first."""
+        for candidate in candidates:
+            candidate["score"] = self.score(candidate.get("text", ""))
+        return sorted(candidates, key=lambda c: c["score"]["total"], reverse=True)
+
+
 class TweetValidator:
     """Validates tweets through the laboratory loops."""
     
@@ -1350,18 +5170,29 @@ SUGGESTIONS: [if needed]
 TWEET: {tweet}
 
 === FACT CHECK ===
-List all factual claims and verify each.
+List all factual claims and verify each, one per claim:
+- Claim: [claim]
+  Verdict: PASS|FAIL - [why]
+If the tweet makes no factual claims, write NONE.
 
 === VOICE CHECK ===
 Score 1-5 on each criterion:
-1. Authoritative/Accessible
-2. Passionate/Factual
-3. Historical/Urgent
-4. Pride/Not Chauvinist
-5. Anti-regime/Pro-people
+1. Authoritative/Accessible: [X]
+2. Passionate/Factual: [X]
+3. Historical/Urgent: [X]
+4. Pride/Not Chauvinist: [X]
+5. Anti-regime/Pro-people: [X]
+TOTAL: [X]/25
 
 === PARALLEL CHECK (if applicable) ===
-If tweet uses historical parallel, evaluate strength.
+If tweet uses historical parallel, evaluate strength. Score 1-5 on each criterion:
+1. Historical accuracy: [X]
+2. Relevance to today: [X]
+3. Clarity of the link: [X]
+4. Emotional resonance: [X]
+5. Avoids false equivalence: [X]
+TOTAL: [X]/25
+If there is no parallel, write TOTAL: N/A
 
 === FINAL VERDICT ===
 READY TO PUBLISH: YES/NO
@@ -1473,8 +5304,7 @@ class CorpusManager:
     def save_history(self):
         """Save generation history to shared file."""
         self.history["metadata"]["lastUpdated"] = datetime.now().isoformat()
-        with open(self.history_file, 'w', encoding='utf-8') as f:
-            json.dump(self.history, f, indent=2, ensure_ascii=False)
+        atomic_write_json(self.history_file, self.history)
 
     def add_draft(self, theme: str, narrative_id: str, fact_ids: List[str]):
         """Add a draft to history (compatible with TypeScript system)."""
@@ -1697,6 +5527,18 @@ HUMANIZATION: [how the tweet humanizes the victim]
 def main():
     import argparse
 
+    def positive_int(value: str) -> int:
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+        return number
+
+    def candidate_count(value: str) -> int:
+        number = positive_int(value)
+        if number > TweetGenerator.MAX_CANDIDATES:
+            raise argparse.ArgumentTypeError(f"must be at most {TweetGenerator.MAX_CANDIDATES}, got {value}")
+        return number
+
     parser = argparse.ArgumentParser(description="Faytuks Tweet Synthesis Engine")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
@@ -1712,6 +5554,9 @@ def main():
                            help="Hook type for opener (auto-selected if not specified)")
     gen_parser.add_argument("--execute", action="store_true", help="Execute with Claude API (default: prompt only)")
     gen_parser.add_argument("--queue", action="store_true", help="Save to draft queue after generation")
+    gen_parser.add_argument("--candidates", type=candidate_count, default=1,
+                            help=f"Generate N candidates concurrently and keep the best, "
+                                 f"1-{TweetGenerator.MAX_CANDIDATES} (requires --execute)")
 
     # Detect command - test auto-detection
     detect_parser = subparsers.add_parser("detect", help="Auto-detect patterns from text")
@@ -1802,15 +5647,23 @@ def main():
     draft_parser.add_argument("--approve", help="Approve draft by ID")
     draft_parser.add_argument("--reject", help="Delete draft by ID")
     draft_parser.add_argument("--stats", action="store_true", help="Show queue statistics")
+    draft_parser.add_argument("--migrate", action="store_true",
+                              help="Import draft directories into the SQLite store (drafts/drafts.db)")
+    draft_parser.add_argument("--history", metavar="ID", help="Show the journal events for a draft (journal backend)")
+    draft_parser.add_argument("--compact", action="store_true", help="Snapshot the draft journal and start a new segment")
+    draft_parser.add_argument("--limit", type=positive_int, default=20, help="Drafts per page for listings (default: 20)")
+    draft_parser.add_argument("--cursor", help="Continue a listing from the cursor it printed")
 
     # Queue command - alias for draft
     queue_parser = subparsers.add_parser("queue", help="Manage tweet queue (alias for draft)")
-    queue_parser.add_argument("action", nargs="?", choices=["list", "preview", "approve", "attach", "reject", "stats"],
+    queue_parser.add_argument("action", nargs="?", choices=["list", "next", "preview", "approve", "attach", "reject", "stats"],
                               help="Queue action")
     queue_parser.add_argument("id", nargs="?", help="Draft ID")
     queue_parser.add_argument("path", nargs="?", help="Media path for attach")
     queue_parser.add_argument("--approved", action="store_true", help="List approved")
     queue_parser.add_argument("--posted", action="store_true", help="List posted")
+    queue_parser.add_argument("--limit", type=positive_int, help="Drafts per page for list (default: 20); how many 'next' shows (default: 1)")
+    queue_parser.add_argument("--cursor", help="Continue a listing from the cursor it printed")
 
     # Post command - workflow for Chrome posting
     post_parser = subparsers.add_parser("post", help="Post workflow (shows instructions for claude --chrome)")
@@ -1820,16 +5673,27 @@ def main():
 
     # Posted command - track posted tweets
     posted_parser = subparsers.add_parser("posted", help="Track posted tweets")
-    posted_parser.add_argument("action", nargs="?", choices=["confirm", "list", "stats"],
+    posted_parser.add_argument("action", nargs="?", choices=["confirm", "list", "stats", "archive"],
                                default="list", help="Action")
     posted_parser.add_argument("id", nargs="?", help="Draft ID for confirm")
+    posted_parser.add_argument("--limit", type=positive_int, default=20, help="Tweets per page for list (default: 20)")
+    posted_parser.add_argument("--cursor", help="Continue a listing from the cursor it printed")
     posted_parser.add_argument("--url", help="Tweet URL for confirm")
+    posted_parser.add_argument("--days", type=float, default=DraftManager.ARCHIVE_AFTER_DAYS,
+                               help=f"archive: posted drafts older than N days (default: {DraftManager.ARCHIVE_AFTER_DAYS})")
 
     # Refresh command - scrape buckets and generate drafts
     refresh_parser = subparsers.add_parser("refresh", help="Refresh drafts from bucket tweets")
     refresh_parser.add_argument("--execute", action="store_true", help="Enrich with Claude API")
     refresh_parser.add_argument("--breaking-hours", type=int, default=1, help="Max age for breaking (default: 1h)")
     refresh_parser.add_argument("--other-hours", type=int, default=24, help="Max age for other buckets (default: 24h)")
+    refresh_parser.add_argument("--full", action="store_true",
+                                help="Rescan whole bucket files instead of only tweets new since the last refresh")
+
+    # Buckets command - inspect bucket files, convert them to streamable NDJSON
+    buckets_parser = subparsers.add_parser("buckets", help="List bucket files or convert them to NDJSON")
+    buckets_parser.add_argument("action", nargs="?", choices=["list", "convert"], default="list")
+    buckets_parser.add_argument("--bucket", help="Only this bucket")
 
     # Enrich command - add historical parallels to a draft
     enrich_parser = subparsers.add_parser("enrich", help="Enrich draft with historical parallels")
@@ -1838,8 +5702,34 @@ def main():
 
     # Daemon command - continuous operation
     daemon_parser = subparsers.add_parser("daemon", help="Run continuous operation daemon")
-    daemon_parser.add_argument("--interval", type=int, default=3600, help="Check interval in seconds (default: 1h)")
+    daemon_parser.add_argument("--interval", type=float,
+                               help="Period in seconds for non-breaking buckets (default: buckets.json schedule)")
+    daemon_parser.add_argument("--breaking-interval", type=float,
+                               help="Period in seconds for the breaking bucket (default: buckets.json schedule)")
     daemon_parser.add_argument("--execute", action="store_true", help="Enable Claude API enrichment")
+    daemon_parser.add_argument("--watch", action="store_true",
+                               help="Run the breaking bucket as soon as its files change (inotify, polling fallback)")
+    daemon_parser.add_argument("--poll-interval", type=float, default=5.0,
+                               help="Polling fallback interval in seconds for --watch (default: 5)")
+    daemon_parser.add_argument("--metrics-port", type=int,
+                               help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics")
+    daemon_parser.add_argument("--drain-timeout", type=float, default=30,
+                               help="Seconds to let in-flight passes finish on SIGTERM/SIGINT before checkpointing "
+                                    "and exiting without them; a second signal skips the wait (default: 30)")
+
+    # Usage command - LLM token/cost/latency ledger
+    usage_parser = subparsers.add_parser("usage", help="Summarize LLM usage ledger")
+    usage_parser.add_argument("--by", nargs="+", choices=["day", "command", "task", "model"],
+                              default=["day", "command", "model"], help="Group by (default: day command model)")
+    usage_window = usage_parser.add_mutually_exclusive_group()
+    usage_window.add_argument("--since", help="Only include calls on or after date (YYYY-MM-DD)")
+    usage_window.add_argument("--days", type=int, help="Only include the last N days")
+
+    # LLM stub command - serve recorded cassettes as a local Messages API
+    stub_parser = subparsers.add_parser("llm-stub", help="Serve recorded LLM cassettes over HTTP for offline load tests")
+    stub_parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    stub_parser.add_argument("--cassettes", default=str(CASSETTE_DIR), help="Cassette directory")
+    stub_parser.add_argument("--latency", default="0", help="Seconds per response, or 'recorded'")
 
     args = parser.parse_args()
 
@@ -1849,14 +5739,15 @@ def main():
     generator = TweetGenerator(kb)
     validator = TweetValidator(kb)
     daily_gen = DailyBriefGenerator(kb)
+    response_parser = ResponseParser()
 
     # Initialize Claude client if --execute is used
     claude = None
     if hasattr(args, 'execute') and args.execute:
-        if not ANTHROPIC_AVAILABLE:
+        if not ANTHROPIC_AVAILABLE and os.getenv("FAYTUKS_LLM_MODE") != "replay":
             print("Error: anthropic package not installed. Run: pip install anthropic")
             return
-        claude = ClaudeClient()
+        claude = ClaudeClient(command=args.command)
     
     if args.command == "detect":
         matches = auto_detect_pattern(args.text)
@@ -1895,9 +5786,38 @@ def main():
 
         prompt = generator.generate_prompt(args.topic, pattern, emotion=emotion, hook_config=hook_config)
         if claude:
-            print("=== CLAUDE RESPONSE ===")
-            response = claude.generate(prompt)
-            print(response)
+            if args.candidates > 1:
+                print(f"=== GENERATING {args.candidates} CANDIDATES ===")
+                candidates = generator.generate_candidates(args.topic, pattern, claude, args.candidates,
+                                                           emotion, hook, parser=response_parser)
+                posted = CandidateScorer.posted_index(DraftManager())
+                ranked = CandidateScorer(kb, posted).rank([c for c in candidates if c["text"]])
+                for i, c in enumerate(ranked, 1):
+                    sc = c["score"]
+                    print(f"\n{i}. [{sc['total']:.2f}] {c['emotion']}/{c['hook']} "
+                          f"(len {sc['length']:.2f}, facts {sc['facts']:.2f}, novelty {sc['novelty']:.2f})")
+                    print(f"   {c['text']}")
+                failed = [c for c in candidates if not c["text"]]
+                if failed:
+                    print(f"\n⚠️ {len(failed)} candidate(s) failed or could not be parsed")
+                if not ranked:
+                    print("No usable candidates.")
+                    return
+                best = ranked[0]
+                response, result = best["response"], best["result"]
+                print(f"\n=== BEST CANDIDATE ({best['emotion']}/{best['hook']}) ===")
+            else:
+                print("=== CLAUDE RESPONSE ===")
+                response = claude.generate_task("generate", prompt)
+                result = response_parser.try_parse("generate", response, claude)
+            if result:
+                print(result.text)
+                if result.sources:
+                    print(f"\nSources: {'; '.join(result.sources)}")
+                print(f"Confidence: {result.confidence or 'N/A'}")
+            else:
+                print(response)
+                print("\n⚠️ Could not parse response; using raw text")
 
             # Save to queue if --queue flag set
             if args.queue:
@@ -1907,12 +5827,12 @@ def main():
                 media_paths = [media_rec["primary_media"]] if media_rec["has_media"] else []
 
                 draft_path = draft_mgr.save_draft(
-                    english=response,
+                    english=result.text if result else response,
                     persian="",
                     pattern=pattern.value,
                     media=media_paths,
-                    hashtags=[],
-                    sources=[args.topic]
+                    hashtags=result.hashtags if result else [],
+                    sources=[args.topic] + (result.sources if result else [])
                 )
                 print(f"\n✅ Saved to queue: {draft_path}")
                 if media_paths:
@@ -1925,7 +5845,7 @@ def main():
         prompt = generator.generate_thread_prompt(args.topic, args.length)
         if claude:
             print("=== CLAUDE RESPONSE ===")
-            response = claude.generate(prompt)
+            response = claude.generate_task("thread", prompt)
             print(response)
 
             if args.queue:
@@ -1947,17 +5867,25 @@ def main():
         prompt = generator.generate_counter_prompt(args.claim, args.source)
         if claude:
             print("=== CLAUDE RESPONSE ===")
-            response = claude.generate(prompt)
-            print(response)
+            response = claude.generate_task("counter", prompt)
+            result = response_parser.try_parse("counter", response, claude)
+            if result:
+                print(result.text)
+                print(f"\nStrategy: {result.strategy or 'N/A'}")
+                if result.facts:
+                    print(f"Facts: {'; '.join(result.facts)}")
+            else:
+                print(response)
+                print("\n⚠️ Could not parse response; using raw text")
 
             if args.queue:
                 draft_mgr = DraftManager()
                 draft_path = draft_mgr.save_draft(
-                    english=response,
+                    english=result.text if result else response,
                     persian="",
                     pattern="counter_" + args.source,
                     media=[],
-                    hashtags=[],
+                    hashtags=result.hashtags if result else [],
                     sources=[args.claim]
                 )
                 print(f"\n✅ Counter-narrative saved to queue: {draft_path}")
@@ -1970,7 +5898,7 @@ def main():
         prompt = daily_gen.generate_daily_prompt(args.date, developments)
         if claude:
             print("=== CLAUDE RESPONSE ===")
-            response = claude.generate(prompt)
+            response = claude.generate_task("daily_brief", prompt)
             print(response)
 
             if args.queue:
@@ -1992,7 +5920,14 @@ def main():
         prompt = validator.full_validation_prompt(args.tweet)
         if claude:
             print("=== VALIDATION RESULT ===")
-            print(claude.generate(prompt))
+            response = claude.generate_task("validation", prompt)
+            print(response)
+            verdict = response_parser.try_parse("validation", response, claude)
+            if verdict:
+                facts = f"{verdict.fact_check_score:.0%}" if verdict.fact_check_score is not None else "N/A"
+                print(f"\n{'✅ READY TO PUBLISH' if verdict.passed else '❌ NOT READY'} "
+                      f"(facts {facts}, voice {verdict.voice_score:.0%}, "
+                      f"confidence {verdict.confidence or 'N/A'})")
         else:
             print("=== VALIDATION PROMPT ===")
             print(prompt)
@@ -2008,7 +5943,7 @@ def main():
             prompt = validator.full_validation_prompt(args.tweet)
         if claude:
             print(f"=== {args.test.upper()} RESULT ===")
-            print(claude.generate(prompt))
+            print(claude.generate_task("validation", prompt))
         else:
             print(f"=== {args.test.upper()} PROMPT ===")
             print(prompt)
@@ -2072,7 +6007,13 @@ def main():
             if claude:
                 prompt = ann_gen.generate_prompt(anniversary, args.context if hasattr(args, 'context') else None)
                 print("\n=== GENERATED ANNIVERSARY TWEET ===")
-                print(claude.generate(prompt))
+                response = claude.generate_task("anniversary", prompt)
+                result = response_parser.try_parse("anniversary", response, claude)
+                if result:
+                    print(result.text)
+                    print(f"\nConnection to 2026: {result.connection or 'N/A'}")
+                else:
+                    print(response)
             elif hasattr(args, 'execute') and args.execute:
                 print("\n=== ANNIVERSARY TWEET PROMPT ===")
                 prompt = ann_gen.generate_prompt(anniversary, args.context if hasattr(args, 'context') else None)
@@ -2107,7 +6048,9 @@ def main():
                 if claude:
                     prompt = memorial_gen.generate_prompt(victim)
                     print("\n=== GENERATED MEMORIAL TWEET ===")
-                    print(claude.generate(prompt))
+                    response = claude.generate_task("memorial", prompt)
+                    result = response_parser.try_parse("memorial", response, claude)
+                    print(result.text if result else response)
                 elif hasattr(args, 'execute') and args.execute:
                     print("\n=== MEMORIAL TWEET PROMPT ===")
                     prompt = memorial_gen.generate_prompt(victim)
@@ -2127,7 +6070,9 @@ def main():
                 if claude:
                     prompt = memorial_gen.generate_prompt(victim)
                     print("\n=== GENERATED MEMORIAL TWEET ===")
-                    print(claude.generate(prompt))
+                    response = claude.generate_task("memorial", prompt)
+                    result = response_parser.try_parse("memorial", response, claude)
+                    print(result.text if result else response)
                 elif hasattr(args, 'execute') and args.execute:
                     print("\n=== MEMORIAL TWEET PROMPT ===")
                     prompt = memorial_gen.generate_prompt(victim)
@@ -2227,73 +6172,85 @@ def main():
                 print()
 
     elif args.command == "draft":
+        if args.migrate:
+            store = SqliteDraftStore(DRAFTS_DIR / "drafts.db")
+            imported = store.migrate_from_directories(DRAFTS_DIR)
+            print(f"✅ Imported {imported} drafts into {store.db_path}")
+            print("   Use it with: export FAYTUKS_DRAFT_BACKEND=sqlite")
+            return
+
         draft_mgr = DraftManager()
 
-        if args.stats:
+        if args.history or args.compact:
+            if not isinstance(draft_mgr.store, JournalDraftStore):
+                print("❌ The draft journal needs FAYTUKS_DRAFT_BACKEND=journal")
+            elif args.compact:
+                count = draft_mgr.store.compact()
+                print(f"✅ Snapshot written: {count} drafts, now on segment {draft_mgr.store.segment}")
+            else:
+                events = draft_mgr.history(args.history)
+                print(f"=== HISTORY: {args.history} ({len(events)} events) ===\n")
+                for e in events:
+                    detail = e.get("status") or ", ".join(sorted(e.get("changes", {}))) or ""
+                    print(f"#{e['seq']:<6} {e['ts'][:19]}  {e['op']:<8} {detail}")
+
+        elif args.stats:
             # Queue statistics
-            pending = list((DRAFTS_DIR / "pending").glob("*.json"))
-            approved = list((DRAFTS_DIR / "approved").glob("*.json"))
-            posted = list((DRAFTS_DIR / "posted").glob("*.json"))
+            pending = draft_mgr.count("pending")
+            approved = draft_mgr.count("approved")
+            posted = draft_mgr.count("posted")
 
             print("=== QUEUE STATISTICS ===\n")
-            print(f"📋 Pending:  {len(pending)}")
-            print(f"✅ Approved: {len(approved)}")
-            print(f"📤 Posted:   {len(posted)}")
-            print(f"\n📊 Total:    {len(pending) + len(approved) + len(posted)}")
+            print(f"📋 Pending:  {pending}")
+            print(f"✅ Approved: {approved}")
+            print(f"📤 Posted:   {posted}")
+            print(f"\n📊 Total:    {pending + approved + posted}")
 
             # Pattern breakdown
             if posted:
-                patterns = {}
-                for f in posted:
-                    with open(f, 'r', encoding='utf-8') as file:
-                        d = json.load(file)
-                        p = d.get('pattern', 'unknown')
-                        patterns[p] = patterns.get(p, 0) + 1
+                patterns = draft_mgr.pattern_counts("posted")
                 print("\n📖 Posted by pattern:")
                 for p, count in sorted(patterns.items(), key=lambda x: -x[1]):
                     print(f"   {p}: {count}")
 
         elif args.list:
-            drafts = draft_mgr.list_pending()
-            print(f"=== PENDING DRAFTS ({len(drafts)}) ===\n")
+            drafts, next_cursor = draft_mgr.page("pending", args.limit, args.cursor)
+            print(f"=== PENDING DRAFTS ({len(drafts)} of {draft_mgr.count('pending')}) ===\n")
             for d in drafts:
                 media_status = f"📷 {len(d.get('media', []))} media" if d.get('media') else "No media"
                 print(f"ID: {d['id']} | {d.get('pattern', 'N/A')} | {media_status}")
                 print(f"   EN: {d.get('english', '')[:80]}...")
                 print()
+            if next_cursor:
+                print(f"➡️  More: draft --list --cursor {next_cursor}")
 
         elif args.approved:
-            approved_files = list((DRAFTS_DIR / "approved").glob("*.json"))
-            print(f"=== APPROVED DRAFTS ({len(approved_files)}) ===\n")
-            for f in approved_files:
-                with open(f, 'r', encoding='utf-8') as file:
-                    d = json.load(file)
+            approved_drafts, next_cursor = draft_mgr.page("approved", args.limit, args.cursor)
+            print(f"=== APPROVED DRAFTS ({len(approved_drafts)} of {draft_mgr.count('approved')}) ===\n")
+            for d in approved_drafts:
                 media_status = f"📷 {len(d.get('media', []))} media" if d.get('media') else "No media"
                 print(f"ID: {d['id']} | {d.get('pattern', 'N/A')} | {media_status}")
                 print(f"   EN: {d.get('english', '')[:80]}...")
                 print()
+            if next_cursor:
+                print(f"➡️  More: draft --approved --cursor {next_cursor}")
 
         elif getattr(args, 'posted_list', False):
-            posted_files = list((DRAFTS_DIR / "posted").glob("*.json"))
-            print(f"=== POSTED DRAFTS ({len(posted_files)}) ===\n")
-            for f in posted_files:
-                with open(f, 'r', encoding='utf-8') as file:
-                    d = json.load(file)
+            posted_drafts, next_cursor = draft_mgr.page("posted", args.limit, args.cursor)
+            print(f"=== POSTED DRAFTS ({len(posted_drafts)} of {draft_mgr.count('posted')}) ===\n")
+            for d in posted_drafts:
                 posted_at = d.get('posted_at', 'N/A')[:10] if d.get('posted_at') else 'N/A'
                 print(f"ID: {d['id']} | Posted: {posted_at}")
                 print(f"   EN: {d.get('english', '')[:80]}...")
                 if d.get('tweet_id'):
                     print(f"   URL: https://x.com/FaytuksNetwork/status/{d['tweet_id']}")
                 print()
+            if next_cursor:
+                print(f"➡️  More: draft --posted-list --cursor {next_cursor}")
 
         elif args.preview:
             # Find draft by ID
-            draft = None
-            for folder in [DRAFTS_DIR / "pending", DRAFTS_DIR / "approved"]:
-                for f in folder.glob(f"*{args.preview}*.json"):
-                    with open(f, 'r', encoding='utf-8') as file:
-                        draft = json.load(file)
-                    break
+            draft = draft_mgr.get_draft(args.preview)
             if draft:
                 print(f"=== DRAFT PREVIEW: {draft['id']} ===\n")
                 print(f"Pattern: {draft.get('pattern', 'N/A')}")
@@ -2321,31 +6278,16 @@ def main():
 
         elif args.attach:
             draft_id, media_path = args.attach
-            # Find and update draft
-            updated = False
-            for folder in [DRAFTS_DIR / "pending", DRAFTS_DIR / "approved"]:
-                for f in folder.glob(f"*{draft_id}*.json"):
-                    with open(f, 'r', encoding='utf-8') as file:
-                        draft = json.load(file)
-                    draft['media'] = draft.get('media', []) + [media_path]
-                    with open(f, 'w', encoding='utf-8') as file:
-                        json.dump(draft, file, indent=2, ensure_ascii=False)
-                    print(f"✅ Attached {media_path} to draft {draft_id}")
-                    updated = True
-                    break
-            if not updated:
+            if draft_mgr.attach_media(draft_id, media_path):
+                print(f"✅ Attached {media_path} to draft {draft_id}")
+            else:
                 print(f"❌ Draft {draft_id} not found")
 
         elif args.reject:
             # Delete draft
-            deleted = False
-            for folder in [DRAFTS_DIR / "pending", DRAFTS_DIR / "approved"]:
-                for f in folder.glob(f"*{args.reject}*.json"):
-                    f.unlink()
-                    print(f"✅ Draft {args.reject} deleted")
-                    deleted = True
-                    break
-            if not deleted:
+            if draft_mgr.reject_draft(args.reject):
+                print(f"✅ Draft {args.reject} deleted")
+            else:
                 print(f"❌ Draft {args.reject} not found")
 
         elif args.save:
@@ -2389,24 +6331,16 @@ def main():
         import subprocess
 
         # Find draft to post
+        draft_mgr = DraftManager()
         draft = None
-        draft_file = None
         if args.draft:
-            for f in (DRAFTS_DIR / "approved").glob(f"*{args.draft}*.json"):
-                with open(f, 'r', encoding='utf-8') as file:
-                    draft = json.load(file)
-                draft_file = f
-                break
+            draft = draft_mgr.get_draft(args.draft, statuses=("approved",))
         elif args.next:
-            approved = list((DRAFTS_DIR / "approved").glob("*.json"))
-            if approved:
-                draft_file = approved[0]
-                with open(draft_file, 'r', encoding='utf-8') as f:
-                    draft = json.load(f)
+            draft = draft_mgr.next_draft(kb.get_source_tiers())
 
         if not draft:
-            approved_count = len(list((DRAFTS_DIR / "approved").glob("*.json")))
-            pending_count = len(list((DRAFTS_DIR / "pending").glob("*.json")))
+            approved_count = draft_mgr.count("approved")
+            pending_count = draft_mgr.count("pending")
             print(f"📋 Queue: {pending_count} pending | {approved_count} approved")
             if approved_count == 0 and pending_count > 0:
                 print("\n💡 Approve a draft first: draft --approve <id>")
@@ -2490,36 +6424,49 @@ def main():
         draft_mgr = DraftManager()
 
         if args.action == "list":
+            limit = args.limit or 20
             if args.approved:
-                approved_files = list((DRAFTS_DIR / "approved").glob("*.json"))
-                print(f"=== APPROVED ({len(approved_files)}) ===\n")
-                for f in approved_files:
-                    with open(f, 'r', encoding='utf-8') as file:
-                        d = json.load(file)
+                # Header-only listing: served from the index without opening drafts
+                approved_drafts, next_cursor = draft_mgr.page("approved", limit, args.cursor,
+                                                              fields=["id", "pattern"])
+                print(f"=== APPROVED ({draft_mgr.count('approved')}) ===\n")
+                for d in approved_drafts:
                     print(f"{d['id']} | {d.get('pattern', 'N/A')}")
+                flag = "--approved"
             elif args.posted:
-                posted_files = list((DRAFTS_DIR / "posted").glob("*.json"))
-                print(f"=== POSTED ({len(posted_files)}) ===\n")
-                for f in posted_files:
-                    with open(f, 'r', encoding='utf-8') as file:
-                        d = json.load(file)
+                posted_drafts, next_cursor = draft_mgr.page("posted", limit, args.cursor,
+                                                            fields=["id", "posted_at"])
+                print(f"=== POSTED ({draft_mgr.count('posted')}) ===\n")
+                for d in posted_drafts:
                     print(f"{d['id']} | Posted: {d.get('posted_at', 'N/A')[:10] if d.get('posted_at') else 'N/A'}")
+                flag = "--posted"
             else:
-                drafts = draft_mgr.list_pending()
-                print(f"=== PENDING ({len(drafts)}) ===\n")
+                drafts, next_cursor = draft_mgr.page("pending", limit, args.cursor)
+                print(f"=== PENDING ({draft_mgr.count('pending')}) ===\n")
                 for d in drafts:
                     media = "📷" if d.get('media') else ""
                     print(f"{d['id']} | {d.get('pattern', 'N/A')} {media}")
                     print(f"  {d.get('english', '')[:60]}...")
                     print()
+                flag = ""
+            if next_cursor:
+                print(f"\n➡️  More: {' '.join(filter(None, ['queue list', flag, '--cursor', next_cursor]))}")
+
+        elif args.action == "next":
+            queue = draft_mgr.posting_queue(kb.get_source_tiers())
+            ranked = queue.ranked(args.limit or 1)
+            if not ranked:
+                print("No approved drafts. Approve one with: queue approve <id>")
+            print(f"=== NEXT TO POST ({len(ranked)} of {len(queue)} approved) ===\n")
+            for d in ranked:
+                w = queue.weights(d)
+                print(f"{d['id']} | score {queue.score(d):.3g} | {queue.bucket(d) or 'other'} "
+                      f"x{w['bucket']:g} · tier x{w['tier']:g} · diversity x{w['diversity']:.2f} | {d.get('pattern', 'N/A')}")
+                draft = draft_mgr.get_draft(str(d['id']), statuses=("approved",)) or d
+                print(f"  {draft.get('english', '')[:80]}...")
 
         elif args.action == "preview" and args.id:
-            draft = None
-            for folder in [DRAFTS_DIR / "pending", DRAFTS_DIR / "approved"]:
-                for f in folder.glob(f"*{args.id}*.json"):
-                    with open(f, 'r', encoding='utf-8') as file:
-                        draft = json.load(file)
-                    break
+            draft = draft_mgr.get_draft(args.id)
             if draft:
                 print(f"=== {draft['id']} ===\n")
                 print(draft.get('english', ''))
@@ -2535,31 +6482,22 @@ def main():
                 print(f"❌ {args.id} not found")
 
         elif args.action == "attach" and args.id and args.path:
-            for folder in [DRAFTS_DIR / "pending", DRAFTS_DIR / "approved"]:
-                for f in folder.glob(f"*{args.id}*.json"):
-                    with open(f, 'r', encoding='utf-8') as file:
-                        draft = json.load(file)
-                    draft['media'] = draft.get('media', []) + [args.path]
-                    with open(f, 'w', encoding='utf-8') as file:
-                        json.dump(draft, file, indent=2, ensure_ascii=False)
-                    print(f"✅ Attached {args.path}")
-                    break
+            if draft_mgr.attach_media(args.id, args.path):
+                print(f"✅ Attached {args.path}")
 
         elif args.action == "reject" and args.id:
-            for folder in [DRAFTS_DIR / "pending", DRAFTS_DIR / "approved"]:
-                for f in folder.glob(f"*{args.id}*.json"):
-                    f.unlink()
-                    print(f"✅ {args.id} deleted")
-                    break
+            if draft_mgr.reject_draft(args.id):
+                print(f"✅ {args.id} deleted")
 
         elif args.action == "stats":
-            pending = len(list((DRAFTS_DIR / "pending").glob("*.json")))
-            approved = len(list((DRAFTS_DIR / "approved").glob("*.json")))
-            posted = len(list((DRAFTS_DIR / "posted").glob("*.json")))
+            pending = draft_mgr.count("pending")
+            approved = draft_mgr.count("approved")
+            posted = draft_mgr.count("posted")
             print(f"📋 Pending: {pending} | ✅ Approved: {approved} | 📤 Posted: {posted}")
 
         else:
             print("Usage: queue list [--approved|--posted]")
+            print("       queue next [--limit N]")
             print("       queue preview <id>")
             print("       queue approve <id>")
             print("       queue attach <id> <path>")
@@ -2571,11 +6509,7 @@ def main():
         if args.action == "confirm" and args.id:
             draft_mgr = DraftManager()
             tweet_url = args.url if hasattr(args, 'url') else None
-            # Extract tweet ID from URL if provided
-            tweet_id = None
-            if tweet_url and '/status/' in tweet_url:
-                tweet_id = tweet_url.split('/status/')[-1].split('?')[0]
-            if draft_mgr.mark_posted(args.id, tweet_id=tweet_id):
+            if draft_mgr.mark_posted(args.id, tweet_id=tweet_id_from_url(tweet_url), tweet_url=tweet_url):
                 print(f"✅ {args.id} marked as posted")
                 if tweet_url:
                     print(f"   URL: {tweet_url}")
@@ -2583,36 +6517,58 @@ def main():
                 print(f"❌ {args.id} not found in approved/")
 
         elif args.action == "list":
-            posted_files = list((DRAFTS_DIR / "posted").glob("*.json"))
-            print(f"=== POSTED TWEETS ({len(posted_files)}) ===\n")
-            for f in sorted(posted_files, key=lambda x: x.stat().st_mtime, reverse=True):
-                with open(f, 'r', encoding='utf-8') as file:
-                    d = json.load(file)
+            draft_mgr = DraftManager()
+            posted_drafts, next_cursor = draft_mgr.page("posted", args.limit, args.cursor,
+                                                        fields=["id", "posted_at", "pattern", "tweet_id"])
+            print(f"=== POSTED TWEETS ({len(posted_drafts)} of {draft_mgr.count('posted')}) ===\n")
+            for d in posted_drafts:
                 posted_at = d.get('posted_at', '')[:10] if d.get('posted_at') else 'N/A'
                 print(f"{d['id']} | {posted_at} | {d.get('pattern', 'N/A')}")
                 if d.get('tweet_id'):
                     print(f"  https://x.com/FaytuksNetwork/status/{d['tweet_id']}")
                 print()
+            if next_cursor:
+                print(f"➡️  More: posted list --cursor {next_cursor}")
 
         elif args.action == "stats":
-            posted_files = list((DRAFTS_DIR / "posted").glob("*.json"))
-            patterns = {}
-            for f in posted_files:
-                with open(f, 'r', encoding='utf-8') as file:
-                    d = json.load(file)
-                p = d.get('pattern', 'unknown')
-                patterns[p] = patterns.get(p, 0) + 1
+            draft_mgr = DraftManager()
+            patterns = draft_mgr.pattern_counts("posted")
 
             print(f"=== POSTING STATS ===\n")
-            print(f"Total posted: {len(posted_files)}")
+            print(f"Total posted: {draft_mgr.count('posted')} ({draft_mgr.archive.count()} archived)")
             print(f"\nBy pattern:")
             for p, count in sorted(patterns.items(), key=lambda x: -x[1]):
                 print(f"  {p}: {count}")
 
+        elif args.action == "archive":
+            draft_mgr = DraftManager()
+            archived = draft_mgr.archive_posted(args.days)
+            print(f"✅ Archived {archived} posted drafts older than {args.days:g} days")
+            for month in draft_mgr.archive.months():
+                print(f"   {draft_mgr.archive.segment_file(month).name}: {len(draft_mgr.archive.index(month))} drafts")
+
         else:
             print("Usage: posted confirm <id> --url <tweet_url>")
             print("       posted list")
             print("       posted stats")
+            print("       posted archive [--days N]")
+
+    elif args.command == "buckets":
+        for bucket, files in discover_bucket_files().items():
+            if args.bucket and bucket != args.bucket:
+                continue
+            print(f"\n{bucket.upper()}")
+            for handle, path in files:
+                if args.action == "convert" and path.suffix == ".json":
+                    start = time.perf_counter()
+                    try:
+                        path = convert_bucket_file(path)
+                    except (OSError, json.JSONDecodeError, BucketFileError) as e:
+                        print(f"  ❌ @{handle}: {path.name}: {e}")
+                        continue
+                    print(f"  ✅ @{handle}: {path.name} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+                else:
+                    print(f"  @{handle}: {path.name} ({path.stat().st_size / 1024:.0f} KB)")
 
     elif args.command == "refresh":
         # Refresh drafts from bucket tweets
@@ -2622,13 +6578,29 @@ def main():
         print("=== REFRESHING FROM BUCKETS ===\n")
 
         # Breaking: use CLI arg (default 0.17 = ~10 mins), auto-approve, bilingual
-        breaking_hours = getattr(args, 'breaking_hours', 0.17)
-        breaking = daemon.scrape_recent_tweets("breaking", max_age_hours=breaking_hours)
-
         # Commentary & Geopolitics: < 24 hours - drafts only
+        breaking_hours = getattr(args, 'breaking_hours', 0.17)
+        incremental = not args.full
         other_hours = getattr(args, 'other_hours', 24)
-        commentary = daemon.scrape_recent_tweets("commentary", max_age_hours=other_hours)
-        geopolitics = daemon.scrape_recent_tweets("geopolitics", max_age_hours=other_hours)
+        recent = daemon.scrape_buckets(
+            {"breaking": breaking_hours, "commentary": other_hours, "geopolitics": other_hours}, incremental)
+        breaking, commentary, geopolitics = recent["breaking"], recent["commentary"], recent["geopolitics"]
+        timings = daemon.load_timings
+        print(f"Loaded {len(timings)} account files in parallel (slowest {max(timings.values(), default=0):.0f} ms):")
+        for name, ms in sorted(timings.items(), key=lambda kv: -kv[1]):
+            print(f"  {ms:7.1f} ms  {name}")
+        if incremental:
+            stats = daemon.ingestor.stats
+            print(f"Ingest: {stats['read']} files read, {stats['skipped']} unchanged, "
+                  f"{stats['new_tweets']} new tweets since last refresh, {stats['backlog']} carried over\n")
+
+        # Drop tweets an earlier refresh or daemon pass already handled
+        handled = sum(len(v) for v in (breaking, commentary, geopolitics))
+        breaking, commentary, geopolitics = (
+            [t for t in tweets if t not in daemon.seen] for tweets in (breaking, commentary, geopolitics))
+        handled -= len(breaking) + len(commentary) + len(geopolitics)
+        if handled:
+            print(f"👀 Skipped {handled} tweets already handled")
 
         breaking_mins = int(breaking_hours * 60)
         print(f"Breaking (< {breaking_mins} min):     {len(breaking)} tweets → AUTO-APPROVE")
@@ -2638,37 +6610,53 @@ def main():
         created_breaking = 0
         created_drafts = 0
 
+        # Skip stories already drafted or posted, and repeats across accounts
+        dedup = NearDuplicateIndex.from_drafts(daemon.draft_mgr)
+        candidates = breaking + commentary + geopolitics
+        breaking = daemon.filter_new(breaking, dedup)
+        others = daemon.filter_new(commentary + geopolitics, dedup)
+        kept = {id(t) for t in breaking + others}
+        for tweet in candidates:
+            if id(tweet) not in kept:
+                daemon.seen.add(tweet)
+        suppressed = len(candidates) - len(kept)
+        if suppressed:
+            print(f"🔁 Suppressed {suppressed} near-duplicate tweets")
+
+        # Tweets over the per-run limits come back on the next refresh or daemon pass
+        carried = breaking[5:] + others[10:]
+        daemon.ingestor.carry(carried)
+        if carried:
+            print(f"↪ Carried {len(carried)} tweets over the per-run limits to the next refresh")
+
+        # Translate breaking tweets to Persian in one bulk call if Claude is available
+        breaking = breaking[:5]
+        translations = [""] * len(breaking)
+        if claude and breaking:
+            translations = enricher.translate_batch_to_persian([t.get('text', '') for t in breaking], claude)
+            translated = sum(1 for t in translations if t)
+            print(f"  🔄 Translated {translated}/{len(breaking)} to Persian")
+
         # Process breaking tweets - immediate posting (BILINGUAL)
-        for tweet in breaking[:5]:
+        for tweet, persian_text in zip(breaking, translations):
             english_text = tweet.get('text', '')
             pattern = enricher.detect_pattern(english_text)
 
-            # Translate to Persian if Claude is available
-            persian_text = ""
-            if claude:
-                try:
-                    persian_text = enricher.translate_to_persian(english_text, claude)
-                    print(f"  🔄 Translated to Persian ({len(persian_text)} chars)")
-                except Exception as e:
-                    print(f"  ⚠️ Translation failed: {e}")
-
-            draft_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-            path = daemon.draft_mgr.save_draft(
+            # Auto-approve breaking tweets
+            daemon.draft_mgr.add_draft(
                 english=english_text,
                 persian=persian_text,
                 pattern=pattern or "breaking",
-                sources=[f"@{tweet.get('handle', '')}", "breaking"]
+                sources=[f"@{tweet.get('handle', '')}", "breaking"],
+                status="approved"
             )
-
-            # Auto-approve breaking tweets
-            daemon.draft_mgr.approve_draft(draft_id)
+            daemon.seen.add(tweet)
             created_breaking += 1
             lang_status = "EN+FA" if persian_text else "EN only"
             print(f"  ⚡ BREAKING [{lang_status}]: @{tweet.get('handle', '')} → approved")
 
         # Process other buckets as regular drafts
-        for tweet in (commentary + geopolitics)[:10]:
+        for tweet in others[:10]:
             pattern = enricher.detect_pattern(tweet.get('text', ''))
 
             path = daemon.draft_mgr.save_draft(
@@ -2677,13 +6665,16 @@ def main():
                 pattern=pattern or "general",
                 sources=[f"@{tweet.get('handle', '')}", tweet.get('bucket', '')]
             )
+            daemon.seen.add(tweet)
             created_drafts += 1
 
         print(f"\n✅ Created: {created_breaking} breaking (auto-approved), {created_drafts} drafts")
+        daemon.ingestor.commit()
+        daemon.seen.checkpoint()
 
         # Show queue status
-        pending = len(list((DRAFTS_DIR / "pending").glob("*.json")))
-        approved = len(list((DRAFTS_DIR / "approved").glob("*.json")))
+        pending = daemon.draft_mgr.count("pending")
+        approved = daemon.draft_mgr.count("approved")
         print(f"📋 Queue: {pending} pending | {approved} approved (ready to post)")
 
     elif args.command == "enrich":
@@ -2691,13 +6682,8 @@ def main():
         enricher = TweetEnricher(kb)
 
         # Find draft
-        draft = None
-        for folder in [DRAFTS_DIR / "pending", DRAFTS_DIR / "approved"]:
-            for f in folder.glob(f"*{args.draft}*.json"):
-                with open(f, 'r', encoding='utf-8') as file:
-                    draft = json.load(file)
-                draft_path = f
-                break
+        draft_mgr = DraftManager()
+        draft = draft_mgr.get_draft(args.draft)
 
         if not draft:
             print(f"Draft '{args.draft}' not found")
@@ -2720,52 +6706,140 @@ def main():
             if claude:
                 prompt = enricher.generate_enrichment_prompt(draft.get('english', ''), context)
                 print("\n=== SUPPLEMENTAL TWEET ===")
-                response = claude.generate(prompt)
-                print(response)
+                response = claude.generate_task("enrichment", prompt)
+                result = response_parser.try_parse("enrichment", response, claude)
+                if result:
+                    print(result.text)
+                    print(f"\nParallel: {result.parallel or 'N/A'}")
+                else:
+                    print(response)
 
                 # Save enrichment to draft
-                draft['supplemental_tweet'] = response
-                draft['enriched_at'] = datetime.now().isoformat()
-                with open(draft_path, 'w', encoding='utf-8') as file:
-                    json.dump(draft, file, indent=2, ensure_ascii=False)
+                enrichment = {'supplemental_tweet': result.text if result else response}
+                if result:
+                    enrichment['supplemental_parallel'] = result.parallel
+                    enrichment['supplemental_hashtags'] = result.hashtags
+                enrichment['enriched_at'] = datetime.now().isoformat()
+                draft_mgr.update_draft(args.draft, enrichment, event="enrich")
                 print(f"\n✅ Enrichment saved to draft")
             else:
                 print("\n(Add --execute to generate supplemental tweet with Claude)")
 
     elif args.command == "daemon":
-        import time
+        import asyncio
 
         daemon = FaytuksDaemon(kb)
-        interval = args.interval
+        schedule = load_bucket_schedule()
+        for bucket, cfg in schedule.items():
+            override = args.breaking_interval if bucket == "breaking" else args.interval
+            if override:
+                cfg["period"] = override
 
         print("=" * 60)
         print("FAYTUKS CONTINUOUS DAEMON")
         print("=" * 60)
-        print(f"\nInterval: {interval} seconds ({interval/60:.1f} minutes)")
+        print()
+        for bucket, cfg in schedule.items():
+            print(f"  {bucket:<12} every {cfg['period']:g}s (±{cfg['jitter']:g}s), window {cfg['window']:g}h")
         print(f"Claude enrichment: {'enabled' if claude else 'disabled'}")
+        watcher = BucketWatcher(poll_interval=args.poll_interval) if args.watch else None
+        if watcher:
+            print(f"Breaking watch: {watcher.mode}")
+        if args.metrics_port:
+            daemon.metrics.claude = claude
+            daemon.metrics.serve(args.metrics_port)
+            print(f"Metrics: http://127.0.0.1:{args.metrics_port}/metrics")
         print("\nPress Ctrl+C to stop\n")
 
-        cycle = 0
-        while True:
-            cycle += 1
-            print(f"\n--- Cycle {cycle} at {datetime.now().strftime('%H:%M:%S')} ---")
-
-            try:
-                results = daemon.run_cycle(claude)
-                print(f"Created: {len(results.get('drafts_created', []))} drafts")
-                if results.get('errors'):
-                    print(f"Errors: {results['errors']}")
-
+        def report(bucket, results, seconds):
+            created = len(results.get('drafts_created', []))
+            print(f"--- {bucket} pass at {datetime.now().strftime('%H:%M:%S')} "
+                  f"({seconds:.1f}s): {created} drafts", end="")
+            if created:
                 # Show queue status
-                pending = len(list((DRAFTS_DIR / "pending").glob("*.json")))
-                approved = len(list((DRAFTS_DIR / "approved").glob("*.json")))
-                print(f"Queue: {pending} pending | {approved} approved")
-
-            except Exception as e:
-                print(f"Error: {e}")
-
-            print(f"Sleeping {interval}s...")
-            time.sleep(interval)
+                pending = daemon.draft_mgr.count("pending")
+                approved = daemon.draft_mgr.count("approved")
+                print(f" | Queue: {pending} pending | {approved} approved", end="")
+            print()
+            for name, counts in results.get('deferred', {}).items():
+                if counts["new"] or counts["dropped"]:
+                    limit = daemon.admission.limits.get(name, {})
+                    print(f"    ⏸ {name}: {counts['new']} deferred, {counts['dropped']} dropped "
+                          f"(backlog {counts['deferred']}, pending watermarks {limit.get('low')}/{limit.get('high')})")
+            for name, carried in results.get('backlog', {}).items():
+                if carried:
+                    print(f"    ↪ {name}: {carried} tweets over the per-pass quota carried to the next pass")
+            if results.get('errors'):
+                print(f"Errors: {results['errors']}")
+
+        scheduler = BucketScheduler(daemon, schedule, claude, watcher=watcher, on_pass=report)
+
+        async def run_until_signalled():
+            import signal
+
+            loop = asyncio.get_running_loop()
+
+            def shutdown(name):
+                if daemon.stopping.is_set():
+                    scheduler.abort()  # second signal: stop waiting for in-flight passes
+                    return
+                print(f"\n{name}: finishing in-flight passes (up to {args.drain_timeout:g}s)...")
+                scheduler.request_stop()
+                loop.call_later(args.drain_timeout, scheduler.abort)
+
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, shutdown, sig.name)
+                except NotImplementedError:  # Windows
+                    signal.signal(sig, lambda signum, frame, name=sig.name:
+                                  loop.call_soon_threadsafe(shutdown, name))
+            await scheduler.run()
+
+        if daemon.pending_jobs or daemon.last_pass:
+            print(f"Resuming from checkpoint: {len(daemon.pending_jobs)} pending jobs, "
+                  f"last passes for {', '.join(sorted(daemon.last_pass)) or 'no buckets'}")
+        asyncio.run(run_until_signalled())
+        daemon.checkpoint()
+        if watcher:
+            watcher.close()
+        print(f"Stopped. Checkpoint saved ({len(daemon.pending_jobs)} pending jobs). "
+              f"Overrun ticks: {scheduler.overruns}")
+        if scheduler.in_flight:
+            # Abandoned passes committed nothing; their tweets and resumed jobs come back on restart
+            print(f"Abandoned in-flight passes: {', '.join(sorted(scheduler.in_flight))}")
+            sys.stdout.flush()
+            os._exit(0)
+
+    elif args.command == "llm-stub":
+        latency = args.latency if args.latency == "recorded" else float(args.latency)
+        ReplayTransport(Path(args.cassettes), latency=latency).serve(port=args.port)
+
+    elif args.command == "usage":
+        from datetime import timedelta
+
+        ledger = UsageLedger()
+        since = args.since
+        if args.days:
+            since = (datetime.now() - timedelta(days=args.days - 1)).strftime("%Y-%m-%d")
+        rows = ledger.aggregate(args.by, since=since)
+
+        if not rows:
+            print(f"No LLM calls recorded in {ledger.ledger_file}")
+        else:
+            print(f"=== LLM USAGE{f' SINCE {since}' if since else ''} ===\n")
+            header = " | ".join(g.upper() for g in args.by)
+            print(f"{header} | CALLS | IN TOK | OUT TOK | CACHE | COST | TOTAL s | p50/p95/p99 ms")
+            for row in rows:
+                key = " | ".join(str(row[g]) for g in args.by)
+                errors = f" ({row['errors']} err)" if row['errors'] else ""
+                print(f"{key} | {row['calls']}{errors} | {row['input_tokens']:,} | {row['output_tokens']:,} | "
+                      f"{row['cache_hits']} | ${row['cost_usd']:.4f} | {row['total_ms'] / 1000:.1f} | "
+                      f"{row['p50_ms']:.0f}/{row['p95_ms']:.0f}/{row['p99_ms']:.0f}")
+
+            total_calls = sum(r['calls'] for r in rows)
+            total_cost = sum(r['cost_usd'] for r in rows)
+            total_secs = sum(r['total_ms'] for r in rows) / 1000
+            print(f"\n📊 Total: {total_calls} calls | ${total_cost:.4f} | {total_secs:.1f}s LLM wall time")
 
     else:
         parser.print_help()
@@ -0,0 +1,297 @@
+"""Self-checks for the pure pieces of faytuks_engine.
+
+Run with: python -m unittest discover tests   (or python -m pytest tests)
+"""
+
+import hashlib
+import json
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import faytuks_engine as fe  # noqa: E402
+
+
+class TempDirTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+
+class DraftIdTests(unittest.TestCase):
+    def test_ulids_are_unique_and_sorted(self):
+        gen = fe.UlidGenerator()
+        ids = [gen.new() for _ in range(2000)]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(ids, sorted(ids))
+        self.assertTrue(all(len(i) == 26 and set(i) <= set(fe.CROCKFORD_BASE32) for i in ids))
+
+    def test_resolve_draft_id(self):
+        ids = ["01HZAAAA", "01HZAAAB", "20260101_120000"]
+        self.assertEqual(fe.resolve_draft_id("01HZAAAB", ids), "01HZAAAB")
+        self.assertIsNone(fe.resolve_draft_id("01HZAAA", ids))  # ambiguous prefix
+        self.assertEqual(fe.resolve_draft_id("0101_12", ids), "20260101_120000")  # legacy substring
+        self.assertIsNone(fe.resolve_draft_id("nope", ids))
+
+    def test_normalize_draft_id(self):
+        self.assertEqual(fe.normalize_draft_id("drafts/pending/draft_01HZ.json"), "01HZ")
+
+    def test_tweet_id_from_url(self):
+        self.assertEqual(fe.tweet_id_from_url("https://x.com/a/status/123?s=20"), "123")
+        self.assertEqual(fe.tweet_id_from_url("https://twitter.com/a/status/456/photo/1"), "456")
+        self.assertIsNone(fe.tweet_id_from_url("https://x.com/a"))
+        self.assertIsNone(fe.tweet_id_from_url(None))
+
+
+class BloomFilterTests(unittest.TestCase):
+    @staticmethod
+    def digest(i) -> bytes:
+        return hashlib.blake2b(str(i).encode(), digest_size=16).digest()
+
+    def test_no_false_negatives_and_grows(self):
+        bloom = fe.ScalableBloomFilter(initial_capacity=100, error_rate=0.001)
+        for i in range(1000):
+            bloom.add(self.digest(i))
+        self.assertTrue(all(self.digest(i) in bloom for i in range(1000)))
+        self.assertGreater(len(bloom.slices), 1)
+        false_positives = sum(self.digest(f"x{i}") in bloom for i in range(5000))
+        self.assertLess(false_positives / 5000, 0.01)
+
+    def test_round_trip_and_merge(self):
+        a, b = fe.ScalableBloomFilter(50), fe.ScalableBloomFilter(50)
+        for i in range(80):
+            a.add(self.digest(i))
+        for i in range(80, 120):
+            b.add(self.digest(i))
+        restored = fe.ScalableBloomFilter.from_dict(json.loads(json.dumps(a.to_dict())))
+        restored.merge(b)
+        self.assertTrue(all(self.digest(i) in restored for i in range(120)))
+
+
+class NearDuplicateIndexTests(unittest.TestCase):
+    def test_finds_near_copies_only(self):
+        index = fe.NearDuplicateIndex()
+        text = "Regime forces set fire to the Rasht bazaar and blamed rioters for the deaths of 40 people"
+        self.assertIsNone(index.check_and_add("a", text))
+        self.assertEqual(index.find(text + " https://t.co/x"), "a")
+        self.assertEqual(index.nearest(text), ("a", 0))
+        self.assertIsNone(index.find("Oil exports fell sharply as new sanctions took effect on Monday"))
+
+    def test_featureless_texts_never_match(self):
+        index = fe.NearDuplicateIndex()
+        index.add("a", "https://t.co/abc @someone")
+        self.assertEqual(index.signatures, {})
+        self.assertIsNone(index.find("@other https://t.co/def"))
+        self.assertIsNone(index.find(""))
+
+    def test_remove(self):
+        index = fe.NearDuplicateIndex()
+        index.add("a", "the same story told twice in two buckets")
+        index.remove("a")
+        self.assertIsNone(index.find("the same story told twice in two buckets"))
+
+
+class PostingQueueTests(unittest.TestCase):
+    def draft(self, draft_id, pattern="fire_parallel", sources=(), hours_ago=0.0):
+        created = (datetime.now() - timedelta(hours=hours_ago)).isoformat()
+        return {"id": draft_id, "pattern": pattern, "sources": list(sources), "created_at": created}
+
+    def test_ranked_order(self):
+        queue = fe.PostingQueue({"bbc": 1})
+        queue.push(self.draft("old", hours_ago=24))
+        queue.push(self.draft("commentary", sources=["commentary"]))
+        queue.push(self.draft("breaking", pattern="breaking"))
+        queue.push(self.draft("tier1", sources=["@bbc"]))
+        self.assertEqual([d["id"] for d in queue.ranked()], ["breaking", "tier1", "commentary", "old"])
+        self.assertEqual([d["id"] for d in queue.ranked(2)], ["breaking", "tier1"])
+        self.assertEqual(queue.pop()["id"], "breaking")
+        self.assertEqual(len(queue), 3)
+
+    def test_diversity_rescores_after_post(self):
+        queue = fe.PostingQueue()
+        queue.push(self.draft("a", pattern="fire_parallel"))
+        queue.push(self.draft("b", pattern="iraq_contrast", hours_ago=1))
+        self.assertEqual(queue.peek()["id"], "a")
+        queue.note_posted({"id": "x", "pattern": "fire_parallel"})
+        self.assertEqual(queue.peek()["id"], "b")
+
+
+class TweetTimeIndexTests(TempDirTestCase):
+    def tweets(self):
+        return [{"id": str(i), "date": f"2026-01-0{i}T12:00:00Z"} for i in (3, 1, 2, 5, 4)] + [{"id": "undated"}]
+
+    def test_window_is_newest_first_and_half_open(self):
+        index = fe.TweetTimeIndex(self.tweets())
+        self.assertEqual(len(index), 5)
+        ms = {t["id"]: t["epoch_ms"] for t in index.tweets}
+        self.assertEqual([t["id"] for t in index.window()], ["5", "4", "3", "2", "1"])
+        self.assertEqual([t["id"] for t in index.window(after_ms=ms["2"])], ["5", "4", "3"])
+        self.assertEqual([t["id"] for t in index.window(after_ms=ms["1"], until_ms=ms["3"])], ["3", "2"])
+        self.assertEqual(index.newest_ms, ms["5"])
+
+    def test_ndjson_conversion_stops_early(self):
+        path = self.tmp / "a-tweets.json"
+        path.write_text(json.dumps({"handle": "a", "tweets": self.tweets() + [7, "junk"]}))
+        converted = fe.convert_bucket_file(path)
+        self.assertEqual(fe._current_bucket_file(path), converted)
+        stop_at = datetime.fromisoformat("2026-01-03T12:00:00+00:00")
+        self.assertEqual([t["id"] for t in fe.stream_bucket_tweets(converted, stop_at=stop_at)], ["5", "4"])
+
+    def test_bad_bucket_file_shape(self):
+        path = self.tmp / "b-tweets.json"
+        path.write_text('"not tweets"')
+        with self.assertRaises(fe.BucketFileError):
+            list(fe.stream_bucket_tweets(path))
+
+
+class DraftStoreTests(TempDirTestCase):
+    BACKENDS = ("json", "sqlite", "journal")
+
+    def round_trip(self, backend):
+        mgr = fe.DraftManager(self.tmp / backend, backend)
+        a = mgr.add_draft("first", "", "fire_parallel", sources=["commentary", "@bbc"])["id"]
+        b = mgr.add_draft("second", "", "iraq_contrast", sources=["geopolitics"])["id"]
+        c = mgr.add_draft("third", "", "fire_parallel")["id"]
+        self.assertTrue(mgr.approve_draft(a[-8:]))
+        self.assertTrue(mgr.attach_media(a, "media/x.jpg"))
+        self.assertTrue(mgr.mark_posted(a, tweet_id="1"))
+        self.assertTrue(mgr.reject_draft(c))
+
+        # A fresh manager sees the same state (index log, WAL or journal replay)
+        mgr = fe.DraftManager(self.tmp / backend, backend)
+        self.assertEqual((mgr.count("pending"), mgr.count("approved"), mgr.count("posted")), (1, 0, 1))
+        posted = mgr.get_draft(a, ("posted",))
+        self.assertEqual((posted["english"], posted["media"], posted["tweet_id"]), ("first", ["media/x.jpg"], "1"))
+        self.assertIsNone(mgr.get_draft(c, fe.DRAFT_STATUSES))
+        self.assertEqual(mgr.bucket_counts("pending"), {"geopolitics": 1})
+        self.assertEqual(mgr.pattern_counts("posted"), {"fire_parallel": 1})
+        headers, cursor = mgr.page("pending", fields=["id", "sources"])
+        self.assertEqual((headers, cursor), ([{"id": b, "sources": ["geopolitics"]}], None))
+
+    def test_round_trips(self):
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend):
+                self.round_trip(backend)
+
+    def test_paging_cursor(self):
+        mgr = fe.DraftManager(self.tmp, "json")
+        ids = [mgr.add_draft(f"d{i}", "", "p")["id"] for i in range(5)]
+        seen, cursor = [], None
+        while True:
+            page, cursor = mgr.page("pending", limit=2, cursor=cursor, fields=["id"])
+            seen += [d["id"] for d in page]
+            if cursor is None:
+                break
+        self.assertEqual(seen, ids[::-1])
+        with self.assertRaises(ValueError):
+            mgr.page("pending", limit=0)
+
+    def test_journal_ignores_torn_tail(self):
+        mgr = fe.DraftManager(self.tmp, "journal")
+        draft_id = mgr.add_draft("kept", "", "p")["id"]
+        with open(mgr.store._segment_file(mgr.store.segment), "a", encoding="utf-8") as f:
+            f.write('{"seq": 99, "op": "upd')
+        self.assertEqual([e["op"] for e in mgr.history(draft_id)], ["save"])
+        self.assertEqual(fe.DraftManager(self.tmp, "journal").count("pending"), 1)
+
+    def test_json_index_log_survives_torn_tail(self):
+        mgr = fe.DraftManager(self.tmp, "json")
+        mgr.add_draft("a", "", "p")
+        with open(self.tmp / "index.log", "ab") as f:
+            f.write(b'{"id": "x", "ent')
+        mgr = fe.DraftManager(self.tmp, "json")
+        mgr.add_draft("b", "", "p")
+        self.assertEqual(fe.DraftManager(self.tmp, "json").count("pending"), 2)
+
+    def test_posting_queue_matches_full_drafts(self):
+        mgr = fe.DraftManager(self.tmp, "json")
+        for text, pattern, sources in (("a", "fire_parallel", ["commentary"]), ("b", "breaking", ["breaking"]),
+                                       ("c", "iraq_contrast", ["@bbc"])):
+            mgr.approve_draft(mgr.add_draft(text, "", pattern, sources=sources)["id"])
+        reference = fe.PostingQueue({"bbc": 1})
+        for draft in mgr.list_drafts("approved"):
+            reference.push(draft)
+        queue = mgr.posting_queue({"bbc": 1})
+        self.assertEqual([d["id"] for d in queue.ranked()], [d["id"] for d in reference.ranked()])
+        self.assertEqual(mgr.next_draft({"bbc": 1})["english"], "b")
+
+
+class PostedArchiveTests(TempDirTestCase):
+    def test_archive_by_age_and_lookup(self):
+        mgr = fe.DraftManager(self.tmp, "json")
+        ids = {}
+        # Legacy posted drafts without posted_at: an old one, a recent one and an undated one
+        for text, changes in (("old", {"created_at": "2020-01-01T00:00:00"}), ("recent", {}),
+                              ("undated", {"created_at": None})):
+            draft_id = mgr.add_draft(text, "", "p")["id"]
+            mgr.approve_draft(draft_id)
+            mgr.mark_posted(draft_id)
+            mgr.update_draft(draft_id, {"posted_at": None, **changes}, statuses=("posted",))
+            ids[text] = draft_id
+        # Only the draft whose created_at is past the cutoff moves; undated ones stay live
+        self.assertEqual(mgr.archive_posted(30), 1)
+        self.assertEqual(mgr.archive.get(ids["old"])["english"], "old")
+        self.assertEqual(mgr.get_draft(ids["old"][:12], ("posted",))["english"], "old")
+        self.assertEqual(mgr.count("posted"), 3)
+        self.assertEqual(mgr.archive_posted(30), 0)  # re-run archives nothing twice
+        self.assertEqual(mgr.archive.count(), 1)
+
+
+class AdmissionControllerTests(unittest.TestCase):
+    def test_hysteresis(self):
+        admission = fe.AdmissionController({"commentary": {"high": 10, "low": 4}})
+        self.assertEqual(admission.allowance("commentary", 3), 7)
+        self.assertEqual(admission.allowance("commentary", 10), 0)  # closes at the high watermark
+        self.assertEqual(admission.allowance("commentary", 6), 0)   # stays closed above low
+        self.assertEqual(admission.allowance("commentary", 4), 6)   # reopens at low
+        self.assertEqual(admission.allowance("commentary", 6), 4)
+        self.assertIsNone(admission.allowance("breaking", 100))     # no limit configured
+
+    def test_closed_state_is_restored(self):
+        admission = fe.AdmissionController({"geopolitics": {"high": 5, "low": 2}}, closed=["geopolitics"])
+        self.assertEqual(admission.allowance("geopolitics", 3), 0)
+
+
+class ResponseParserTests(unittest.TestCase):
+    VALIDATION = """=== FACT CHECK ===
+- Claim: Cinema Rex burned in 1978
+  Verdict: PASS - documented
+- Claim: 900 died
+  Verdict: FAIL - about 400
+=== VOICE CHECK ===
+1. Authoritative/Accessible: 4
+2. Passionate/Factual: 3
+=== FINAL VERDICT ===
+READY TO PUBLISH: NO
+ISSUES: death toll
+SUGGESTIONS: fix the number
+CONFIDENCE: high
+"""
+
+    def test_validation_scores(self):
+        result = fe.ResponseParser().parse("validation", self.VALIDATION)
+        self.assertFalse(result.passed)
+        self.assertEqual(result.fact_check_score, 0.5)
+        self.assertEqual(result.voice_score, 0.7)  # per-criterion fallback: (4 + 3) / 10
+
+    def test_missing_fact_verdicts_are_none(self):
+        raw = self.VALIDATION.replace("Verdict: PASS", "ok").replace("Verdict: FAIL", "wrong")
+        self.assertIsNone(fe.ResponseParser().parse("validation", raw).fact_check_score)
+
+    def test_failed_repair_returns_none(self):
+        class FailingClient:
+            def generate_task(self, task, prompt):
+                raise fe.ReplayTimeoutError("repair timed out")
+
+        self.assertIsNone(fe.ResponseParser().try_parse("generate", "no format here", FailingClient()))
+
+
+if __name__ == "__main__":
+    unittest.main()
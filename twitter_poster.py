@@ -5,31 +5,24 @@ Uses existing browser session (must be logged into X.com)
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
 from playwright.async_api import async_playwright
 
-DRAFTS_DIR = Path(__file__).parent / "drafts"
+from faytuks_engine import DraftManager, KnowledgeBase, tweet_id_from_url
 
 
 async def post_tweet(draft_id: str, language: str = "english"):
     """Post a tweet from an approved draft."""
 
-    # Find draft in approved folder
-    draft_path = DRAFTS_DIR / "approved" / f"{draft_id}.json"
-    if not draft_path.exists():
-        # Try with draft_ prefix
-        draft_path = DRAFTS_DIR / "approved" / f"draft_{draft_id}.json"
-
-    if not draft_path.exists():
+    # Find draft among approved drafts
+    draft_mgr = DraftManager()
+    draft = draft_mgr.get_draft(draft_id, statuses=("approved",))
+    if not draft:
         print(f"❌ Draft not found: {draft_id}")
-        print(f"   Looked in: {DRAFTS_DIR / 'approved'}")
+        print(f"   Looked in: approved drafts ({draft_mgr.backend} store)")
         return None
 
-    with open(draft_path, 'r') as f:
-        draft = json.load(f)
-
     # Get tweet text based on language preference
     if language == "persian" and draft.get("persian"):
         tweet_text = draft["persian"]
@@ -89,16 +82,8 @@ async def post_tweet(draft_id: str, language: str = "english"):
             print(f"   URL: {tweet_url}")
 
             # Mark draft as posted
-            draft["posted_at"] = __import__("datetime").datetime.now().isoformat()
-            draft["tweet_url"] = tweet_url
-
-            # Move to posted folder
-            posted_path = DRAFTS_DIR / "posted" / draft_path.name
-            with open(posted_path, 'w') as f:
-                json.dump(draft, f, indent=2, ensure_ascii=False)
-            draft_path.unlink()
-
-            print(f"   Moved to: {posted_path}")
+            draft_mgr.mark_posted(draft["id"], tweet_id=tweet_id_from_url(tweet_url), tweet_url=tweet_url)
+            print(f"   Marked as posted: {draft['id']}")
 
             return tweet_url
 
@@ -138,17 +123,12 @@ async def login_flow():
 async def post_both_languages(draft_id: str):
     """Post a tweet in both English and Persian (as a thread)."""
 
-    draft_path = DRAFTS_DIR / "approved" / f"draft_{draft_id}.json"
-    if not draft_path.exists():
-        draft_path = DRAFTS_DIR / "approved" / f"{draft_id}.json"
-
-    if not draft_path.exists():
+    draft_mgr = DraftManager()
+    draft = draft_mgr.get_draft(draft_id, statuses=("approved",))
+    if not draft:
         print(f"❌ Draft not found: {draft_id}")
         return
 
-    with open(draft_path, 'r') as f:
-        draft = json.load(f)
-
     english = draft.get("english", "")
     persian = draft.get("persian", "")
 
@@ -207,12 +187,7 @@ async def post_both_languages(draft_id: str):
             print(f"   URL: {tweet_url}")
 
             # Mark as posted
-            draft["posted_at"] = __import__("datetime").datetime.now().isoformat()
-            draft["tweet_url"] = tweet_url
-            posted_path = DRAFTS_DIR / "posted" / draft_path.name
-            with open(posted_path, 'w') as f:
-                json.dump(draft, f, indent=2, ensure_ascii=False)
-            draft_path.unlink()
+            draft_mgr.mark_posted(draft["id"], tweet_id=tweet_id_from_url(tweet_url), tweet_url=tweet_url)
 
             return tweet_url
 
@@ -225,15 +200,29 @@ async def post_both_languages(draft_id: str):
             await browser.close()
 
 
+def next_draft_id():
+    """Id of the highest-priority approved draft (same order as `queue next`)."""
+    draft = DraftManager().next_draft(KnowledgeBase().get_source_tiers())
+    return draft["id"] if draft else None
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage:")
         print("  python twitter_poster.py --login           # Login to Twitter first")
+        print("  python twitter_poster.py --next [--fa|--both]  # Post the next draft in the queue")
         print("  python twitter_poster.py <draft_id>        # Post English only")
         print("  python twitter_poster.py <draft_id> --fa   # Post Persian only")
         print("  python twitter_poster.py <draft_id> --both # Post EN+FA as thread")
         sys.exit(1)
 
+    if sys.argv[1] == "--next":
+        sys.argv[1] = next_draft_id()
+        if not sys.argv[1]:
+            print("❌ No approved drafts in the queue")
+            sys.exit(1)
+        print(f"⏭️  Next in queue: {sys.argv[1]}")
+
     if sys.argv[1] == "--login":
         asyncio.run(login_flow())
     elif len(sys.argv) >= 3 and sys.argv[2] == "--both":